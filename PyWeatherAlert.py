@@ -1,14 +1,20 @@
 import requests  # Used for making HTTP requests to fetch data from web APIs.
+from requests.adapters import HTTPAdapter  # Connection pool settings for the shared HTTP session.
 import feedparser  # Used for parsing ATOM and RSS feeds, specifically for NWS alerts.
 import pyttsx3  # Used for text-to-speech (TTS) functionality.
 import time  # Used for adding delays (e.g., between checks) and for timestamping logs.
 import logging  # Used for logging application events, errors, and information.
+import queue  # Hands messages from the check loop to the speech thread.
+import threading  # Runs text-to-speech on its own thread so checks never wait on speech.
+import xml.etree.ElementTree as ET  # C-accelerated XML parser used for the compact NWS ATOM alert feed.
+from collections import deque, namedtuple  # Bounded FIFO of seen alert IDs; lightweight records for parsed alert entries.
 
 # --- Configuration ---
 NWS_STATION_ID = "KSLO"  # Target NWS/AIRPORT Station ID for which to fetch weather alerts.
 CHECK_INTERVAL = 900  # Time in seconds between checks for new weather alerts (e.g., 900 seconds = 15 minutes).
 # Define the repeater information as a constant. This text will be spoken after alerts or periodically.
 REPEATER_INFO = "Repeater, GMRSCALLSIGN, Frequencies (Change text in quotes)"
+MAX_SEEN_ALERT_IDS = 10000  # Oldest announced alert IDs are forgotten beyond this many, keeping memory flat over long uptimes.
 
 
 # URL format for fetching active alerts for a specific geographic point (latitude, longitude).
@@ -20,6 +26,74 @@ ALERTS_URL_POINT_FORMAT = "https://api.weather.gov/alerts/active.atom?point={lat
 # which includes its geographic coordinates. The {station_id} will be replaced.
 NWS_STATION_API_URL_FORMAT = "https://api.weather.gov/stations/{station_id}"
 
+# XML namespaces used by the NWS ATOM alert feed.
+ATOM_NAMESPACES = {'a': 'http://www.w3.org/2005/Atom', 'c': 'urn:oasis:names:tc:emergency:cap:1.2'}
+
+# Parsed alert entry. Exposes the same attribute names the main loop reads from feedparser entries.
+AlertEntry = namedtuple('AlertEntry', ['id', 'title', 'summary', 'link', 'updated', 'event', 'severity', 'urgency', 'certainty'])
+
+
+class SeenAlertIds:
+    """
+    Set of announced alert IDs that keeps at most `max_size` entries.
+    Membership is a set lookup; once full, each new ID evicts the oldest one.
+    """
+
+    def __init__(self, max_size=MAX_SEEN_ALERT_IDS):
+        self._ids = set()
+        self._order = deque()  # Insertion order, used to find the oldest ID to evict.
+        self._max_size = max_size
+
+    def __contains__(self, alert_id):
+        return alert_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, alert_id):
+        """Records an alert ID, evicting the oldest one if the cap is exceeded."""
+        if alert_id in self._ids:
+            return
+        self._ids.add(alert_id)
+        self._order.append(alert_id)
+        if len(self._order) > self._max_size:
+            self._ids.discard(self._order.popleft())
+
+    def clear(self):
+        self._ids.clear()
+        self._order.clear()
+
+
+class AlertFeedCache:
+    """
+    Validators and parsed entries from the last full alert feed response.
+    Lets get_alerts send a conditional request and reuse the entries when the server answers 304 Not Modified.
+    """
+
+    def __init__(self):
+        self.url = None
+        self.etag = None
+        self.last_modified = None
+        self.entries = []
+
+    def request_headers(self, url):
+        """Returns the If-None-Match / If-Modified-Since headers to send for `url`."""
+        if url != self.url:
+            return {}
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def store(self, url, response_headers, entries):
+        """Remembers a full response for `url`."""
+        self.url = url
+        self.etag = response_headers.get('ETag')
+        self.last_modified = response_headers.get('Last-Modified')
+        self.entries = entries
+
 
 # --- Logging Setup ---
 # Configures basic logging:
@@ -29,6 +103,21 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 
 # --- Functions ---
+def create_http_session():
+    """
+    Creates the HTTP session shared by every request the script makes.
+    Reusing one session keeps the connection to api.weather.gov alive between checks,
+    so each poll skips the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: The configured session. Close it on shutdown.
+    """
+    session = requests.Session()
+    # The script only ever talks to one host, one request at a time.
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+    return session
+
+
 def initialize_tts_engine():
     """
     Initializes and returns the text-to-speech (TTS) engine.
@@ -73,12 +162,13 @@ def initialize_tts_engine():
 
         return DummyEngine() # Return an instance of the dummy engine.
 
-def fetch_station_coordinates(station_id):
+def fetch_station_coordinates(station_id, session=None):
     """
     Fetches the latitude and longitude for a given NWS station ID.
 
     Args:
         station_id (str): The NWS station identifier (e.g., "KSLO").
+        session (requests.Session, optional): Session to send the request on; a one-off connection is used if omitted.
 
     Returns:
         tuple: A tuple containing (latitude, longitude) if successful,
@@ -100,7 +190,8 @@ def fetch_station_coordinates(station_id):
 
     try:
         # Make the GET request to the NWS API.
-        response = requests.get(station_api_url, headers=headers, timeout=10) # 10-second timeout.
+        http = session if session is not None else requests
+        response = http.get(station_api_url, headers=headers, timeout=10) # 10-second timeout.
         response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx status codes).
         data = response.json()  # Parse the JSON response.
 
@@ -135,15 +226,54 @@ def fetch_station_coordinates(station_id):
     return None # Return None in case of any error.
 
 
-def get_alerts(alerts_url_for_point):
+def parse_alert_entries(content):
+    """
+    Extracts alert entries from NWS ATOM feed content.
+
+    Reads only the fields the script uses instead of normalizing the whole feed,
+    falling back to feedparser if the content is not well-formed XML.
+
+    Args:
+        content (bytes): The raw ATOM feed body.
+
+    Returns:
+        list: A list of AlertEntry records.
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        logging.warning(f"ATOM feed is not well-formed XML ({e}); falling back to feedparser.")
+        return feedparser.parse(content).entries
+
+    entries = []
+    for entry in root.iterfind('a:entry', ATOM_NAMESPACES):
+        link = entry.find('a:link', ATOM_NAMESPACES)
+        entries.append(AlertEntry(
+            id=entry.findtext('a:id', default='', namespaces=ATOM_NAMESPACES),
+            title=entry.findtext('a:title', default='', namespaces=ATOM_NAMESPACES),
+            summary=entry.findtext('a:summary', default='No summary available.', namespaces=ATOM_NAMESPACES),
+            link=link.get('href', '') if link is not None else '',
+            updated=entry.findtext('a:updated', default='', namespaces=ATOM_NAMESPACES),
+            event=entry.findtext('c:event', default='', namespaces=ATOM_NAMESPACES),
+            severity=entry.findtext('c:severity', default='', namespaces=ATOM_NAMESPACES),
+            urgency=entry.findtext('c:urgency', default='', namespaces=ATOM_NAMESPACES),
+            certainty=entry.findtext('c:certainty', default='', namespaces=ATOM_NAMESPACES),
+        ))
+    return entries
+
+
+def get_alerts(alerts_url_for_point, session=None, feed_cache=None):
     """
     Fetches weather alerts from the provided NWS ATOM feed URL for a specific point.
 
     Args:
         alerts_url_for_point (str): The fully formatted URL to fetch alerts from.
+        session (requests.Session, optional): Session to send the request on; a one-off connection is used if omitted.
+        feed_cache (AlertFeedCache, optional): If given, the request is conditional and an unchanged
+            feed (304 Not Modified) returns the cached entries without downloading or parsing it again.
 
     Returns:
-        list: A list of alert entries (parsed by feedparser). Returns an empty
+        list: A list of AlertEntry records (see parse_alert_entries). Returns an empty
               list if an error occurs or no alerts are found.
     """
     if not alerts_url_for_point:
@@ -152,11 +282,19 @@ def get_alerts(alerts_url_for_point):
     try:
         # NWS API for alerts also benefits from a User-Agent.
         headers = {'User-Agent': 'PythonWeatherAlertScript/1.0 (contact@example.com)'} # Customize
+        if feed_cache is not None:
+            headers.update(feed_cache.request_headers(alerts_url_for_point))
         # Make the GET request to the alerts API.
-        response = requests.get(alerts_url_for_point, headers=headers, timeout=10) # 10-second timeout.
+        http = session if session is not None else requests
+        response = http.get(alerts_url_for_point, headers=headers, timeout=10) # 10-second timeout.
+        if response.status_code == 304 and feed_cache is not None:
+            logging.debug("Alert feed not modified since the last check; reusing cached entries.")
+            return feed_cache.entries
         response.raise_for_status() # Check for HTTP errors.
-        feed = feedparser.parse(response.content) # Parse the ATOM feed content.
-        return feed.entries # Return the list of alert entries.
+        entries = parse_alert_entries(response.content) # Parse the ATOM feed content.
+        if feed_cache is not None:
+            feed_cache.store(alerts_url_for_point, response.headers, entries)
+        return entries
     except requests.exceptions.Timeout:
         logging.error(f"Timeout while trying to fetch alerts from {alerts_url_for_point}")
     except requests.exceptions.HTTPError as http_err:
@@ -172,15 +310,17 @@ def get_alerts(alerts_url_for_point):
     return [] # Return an empty list in case of any error.
 
 
-def speak_weather_alert(engine, alert_title, alert_summary, additional_info=""):
+def build_alert_message(alert_title, alert_summary, additional_info=""):
     """
-    Constructs a message from alert details and speaks it using the TTS engine.
+    Constructs the spoken message for an alert.
 
     Args:
-        engine: The initialized TTS engine instance.
         alert_title (str): The title of the weather alert.
         alert_summary (str): The summary or details of the alert.
         additional_info (str, optional): Extra information to append to the message (e.g., repeater info).
+
+    Returns:
+        str: The message text.
     """
     # Construct the core alert message.
     message = f"Weather Alert: {alert_title}. Details: {alert_summary}"
@@ -189,30 +329,99 @@ def speak_weather_alert(engine, alert_title, alert_summary, additional_info=""):
         if message and not message.endswith(('.', '!', '?')):
             message += "."
         message += f" {additional_info}"
-    try:
-        engine.say(message) # Queue the message for speaking.
-        engine.runAndWait() # Block until speaking is complete.
-    except Exception as e:
-        logging.error(f"Error during text-to-speech: {e}")
+    return message
 
 
-def speak_message(engine, message_text):
+def join_spoken_messages(messages):
     """
-    Speaks a given message string using the TTS engine.
+    Joins messages into a single utterance.
+
+    Args:
+        messages (list): The texts to join, in speaking order.
+
+    Returns:
+        str: The combined text, with sentence punctuation between messages so the voice pauses.
+    """
+    parts = []
+    for message_text in messages[:-1]:
+        if not message_text.endswith(('.', '!', '?')):
+            message_text += "."
+        parts.append(message_text)
+    parts.extend(messages[-1:])
+    return " ".join(parts)
+
+
+def speak_messages(engine, messages):
+    """
+    Speaks several messages in order with a single engine run.
 
     Args:
         engine: The initialized TTS engine instance.
-        message_text (str): The text to be spoken.
+        messages (list): The texts to be spoken; empty ones are skipped.
     """
-    if not message_text: # Avoid trying to speak empty messages.
-        logging.debug("speak_message called with empty text, skipping.")
+    messages = [text for text in messages if text]
+    if not messages:
         return
     try:
-        engine.say(message_text) # Queue the message.
-        engine.runAndWait() # Block until speaking is complete.
-        logging.info(f"Spoken: {message_text}")
+        for message_text in messages:
+            engine.say(message_text) # Queue each message.
+        engine.runAndWait() # One blocking run for the whole batch.
+        for message_text in messages:
+            logging.info(f"Spoken: {message_text}")
     except Exception as e:
-        logging.error(f"Error during text-to-speech for message '{message_text}': {e}")
+        logging.error(f"Error during text-to-speech for {len(messages)} message(s): {e}")
+
+
+class SpeechThread(threading.Thread):
+    """
+    Speaks queued messages in order on a dedicated thread.
+    The thread creates and runs the TTS engine itself, since pyttsx3 engines must be used
+    from the thread that initialized them, and the check loop only ever enqueues text.
+    """
+
+    _STOP = object()  # Queue sentinel that ends the thread.
+
+    def __init__(self):
+        super().__init__(name="WeatherAlertSpeech", daemon=True)
+        self._messages = queue.Queue()
+
+    def say(self, message_text):
+        """Queues a message to be spoken; returns immediately."""
+        self._messages.put(message_text)
+
+    def stop(self):
+        """Drops messages not yet started and ends the thread after the current one."""
+        try:
+            while True:
+                self._messages.get_nowait()
+        except queue.Empty:
+            pass
+        self._messages.put(self._STOP)
+
+    def run(self):
+        engine = initialize_tts_engine()
+        try:
+            while True:
+                # Wait for the next message, then take everything else already queued with it,
+                # so a burst of alerts costs one engine run instead of one per message.
+                batch = [self._messages.get()]
+                try:
+                    while True:
+                        batch.append(self._messages.get_nowait())
+                except queue.Empty:
+                    pass
+                stopping = self._STOP in batch
+                if stopping:
+                    batch = batch[:batch.index(self._STOP)]
+                speak_messages(engine, batch)
+                if stopping:
+                    break
+        finally:
+            if engine.isBusy():
+                try:
+                    engine.stop() # Attempt to stop any ongoing speech.
+                except Exception as e_stop:
+                    logging.error(f"Error trying to stop TTS engine: {e_stop}")
 
 
 def main():
@@ -220,8 +429,11 @@ def main():
     Main function to run the weather alert monitoring script.
     It periodically checks for new alerts and announces them.
     """
-    seen_alert_ids = set() # A set to store IDs of alerts already announced, to avoid repetition.
-    tts_engine = initialize_tts_engine() # Initialize the TTS engine.
+    seen_alert_ids = SeenAlertIds() # IDs of alerts already announced, to avoid repetition (bounded).
+    speech = SpeechThread() # Owns the TTS engine; alerts are spoken while the loop keeps polling.
+    speech.start()
+    http_session = create_http_session() # Kept open for the whole run so polls reuse the connection.
+    alert_feed_cache = AlertFeedCache() # Lets unchanged feeds come back as an empty 304 response.
 
     logging.info(f"Monitoring weather alerts for NWS Station ID: {NWS_STATION_ID} every {CHECK_INTERVAL} seconds.")
     if REPEATER_INFO:
@@ -230,10 +442,13 @@ def main():
     # Fetch initial coordinates for the configured NWS station.
     # In a long-running script, you might want to refresh this periodically
     # or handle cases where the station data might change, though it's rare.
-    current_coordinates = fetch_station_coordinates(NWS_STATION_ID)
+    current_coordinates = fetch_station_coordinates(NWS_STATION_ID, session=http_session)
     if not current_coordinates:
         # If coordinates can't be fetched, alerts cannot be monitored for a point.
         logging.critical(f"Could not fetch initial coordinates for station {NWS_STATION_ID}. Alerts cannot be monitored. Exiting.")
+        http_session.close()
+        speech.stop()
+        speech.join()
         return # Exit the script if initial setup fails.
 
     latitude, longitude = current_coordinates # Unpack the coordinates.
@@ -247,8 +462,9 @@ def main():
             # In a more robust setup, you might re-fetch coordinates if alerts_url becomes invalid
             # or if there's a way to detect station data changes. For now, we use the initial one.
 
-            alerts = get_alerts(alerts_url) # Fetch current active alerts.
+            alerts = get_alerts(alerts_url, session=http_session, feed_cache=alert_feed_cache) # Fetch current active alerts.
             new_alerts_found_this_cycle = False # Flag to track if new alerts are found in this iteration.
+            cycle_messages = [] # Everything announced this cycle, spoken as one utterance.
 
             if alerts:
                 for alert in alerts:
@@ -263,8 +479,8 @@ def main():
                         print(f"New Weather Alert: {alert.title}") # For immediate console visibility.
                         # Get alert summary, defaulting if not present.
                         summary = getattr(alert, 'summary', "No summary available.")
-                        # Speak the new alert along with repeater information.
-                        speak_weather_alert(tts_engine, alert.title, summary, REPEATER_INFO)
+                        # The repeater line is added once after all of this cycle's alerts.
+                        cycle_messages.append(build_alert_message(alert.title, summary))
                         seen_alert_ids.add(alert.id) # Add the alert ID to the set of seen alerts.
 
             if not new_alerts_found_this_cycle:
@@ -273,7 +489,9 @@ def main():
 
             # If REPEATER_INFO is configured, speak it at the end of each cycle.
             if REPEATER_INFO:
-                speak_message(tts_engine, REPEATER_INFO)
+                cycle_messages.append(REPEATER_INFO)
+            if cycle_messages:
+                speech.say(join_spoken_messages(cycle_messages))
 
             # Wait for the defined interval before the next check.
             logging.info(f"Waiting for {CHECK_INTERVAL} seconds before next check.")
@@ -287,13 +505,9 @@ def main():
     finally:
         # This block executes whether the loop exits normally or due to an exception.
         logging.info("Shutting down weather alert monitor.")
-        if hasattr(tts_engine, 'stop'): # Check if the engine has a 'stop' method.
-            # Ensure the engine is not busy before trying to stop, though runAndWait should handle this.
-            if tts_engine.isBusy():
-                try:
-                    tts_engine.stop() # Attempt to stop any ongoing speech.
-                except Exception as e_stop:
-                    logging.error(f"Error trying to stop TTS engine: {e_stop}")
+        http_session.close() # Release the pooled connection.
+        speech.stop() # Lets the message being spoken finish, then shuts the engine down.
+        speech.join()
 
 
 # Standard Python idiom: ensure the main() function is called only when the script is executed directly.
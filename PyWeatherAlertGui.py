@@ -1,12 +1,13 @@
 import sys
-import pyttsx3
+import importlib.util
 import time
 import logging
 import os
 import json
-import shutil
 import re
 import html
+import math
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple, Callable
 
@@ -14,16 +15,19 @@ from typing import Optional, Dict, Any, List, Tuple, Callable
 # PySide6 imports
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, QMessageBox,
+    QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, QPlainTextEdit, QMessageBox,
     QStatusBar, QCheckBox, QSplitter, QStyleFactory, QGroupBox, QDialog,
-    QDialogButtonBox, QFormLayout, QListWidget, QListWidgetItem, QLayout,
-    QSpacerItem, QSizePolicy, QFileDialog, QFrame, QMenu, QStyle, QTableWidget, QScrollArea,
-    QTableWidgetItem, QHeaderView, QSystemTrayIcon, QTabWidget, QAbstractItemView, QToolTip
+    QDialogButtonBox, QFormLayout, QListWidget, QListWidgetItem,
+    QSpacerItem, QSizePolicy, QFileDialog, QFrame, QMenu, QStyle, QTableWidget, QStackedWidget,
+    QTableWidgetItem, QHeaderView, QSystemTrayIcon, QTabWidget, QAbstractItemView, QToolTip, QListView
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Slot, QUrl, QObject, Signal, QRunnable, QThreadPool, QStandardPaths,
+    QMarginsF, QSize, QSortFilterProxyModel, QModelIndex, QSignalBlocker, QEvent, QThread
 )
-from PySide6.QtCore import Qt, QTimer, Slot, QUrl, QFile, QTextStream, QObject, Signal, QRunnable, QThreadPool, QStandardPaths, QMarginsF, QSize
 from PySide6.QtGui import (
     QTextCursor, QIcon, QColor, QDesktopServices, QPalette, QAction,
-    QActionGroup, QFont, QPixmap, QFontDatabase
+    QActionGroup, QFont, QPixmap, QFontDatabase, QStandardItem, QStandardItemModel
 )
 
 try:
@@ -57,7 +61,7 @@ from weather_alert.marine import (
     max_optional,
     moon_phase_info,
 )
-from weather_alert.security import first_payload_entry, html_attr, safe_external_url
+from weather_alert.security import first_payload_entry, html_attr, is_web_url, safe_external_url
 
 # --- Application Version ---
 versionnumber = "26.06.23"
@@ -82,6 +86,10 @@ FALLBACK_SHOW_ALERTS_AREA_CHECKED = True
 FALLBACK_SHOW_FORECASTS_AREA_CHECKED = True
 FALLBACK_SHOW_HOURLY_FORECAST_CHECKED = True
 FALLBACK_SHOW_DAILY_FORECAST_CHECKED = True
+# Forecast periods kept from each fetch: the trend charts read 12 hourly periods, and
+# five daytime periods plus their nights (after a possible leading night) fit in 12 daily ones.
+HOURLY_FORECAST_PERIODS_USED = 12
+DAILY_FORECAST_PERIODS_USED = 12
 FALLBACK_SHOW_TOOLBAR_LOCATION = True
 FALLBACK_SHOW_TOOLBAR_INTERVAL = True
 FALLBACK_SHOW_TOOLBAR_SOURCES = True
@@ -94,6 +102,7 @@ FALLBACK_SHOW_TOOLBAR_TIME = True
 FALLBACK_SHOW_MONITORING_STATUS_CHECKED = True
 FALLBACK_SHOW_LOCATION_OVERVIEW_CHECKED = True
 FALLBACK_AUTO_REFRESH_CONTENT_CHECKED = False
+FALLBACK_ADAPTIVE_POLLING_CHECKED = False
 FALLBACK_DARK_MODE_ENABLED = False
 FALLBACK_LOG_SORT_ORDER = "chronological"
 FALLBACK_MUTE_AUDIO_CHECKED = False
@@ -124,6 +133,11 @@ CHECK_INTERVAL_OPTIONS = {
     "10 Minutes": 10 * 60 * 1000, "15 Minutes": 15 * 60 * 1000,
     "30 Minutes": 30 * 60 * 1000, "1 Hour": 60 * 60 * 1000,
 }
+# Adaptive polling stretches the interval by this factor per unchanged check, up to the cap.
+ADAPTIVE_POLL_BACKOFF_FACTOR = 1.5
+ADAPTIVE_POLL_MAX_FACTOR = 2.0
+# Streak length at which the cap is reached; counting further would only overflow the exponent.
+ADAPTIVE_POLL_MAX_STREAK = math.ceil(math.log(ADAPTIVE_POLL_MAX_FACTOR) / math.log(ADAPTIVE_POLL_BACKOFF_FACTOR))
 
 NWS_STATION_API_URL_TEMPLATE = "https://api.weather.gov/stations/{station_id}"
 NWS_POINTS_API_URL_TEMPLATE = "https://api.weather.gov/points/{latitude},{longitude}"
@@ -131,16 +145,83 @@ WEATHER_URL_PREFIX = "https://api.weather.gov/alerts/active.atom?point="
 WEATHER_URL_SUFFIX = "&certainty=Possible%2CLikely%2CObserved&severity=Extreme%2CSevere%2CModerate%2CMinor&urgency=Immediate%2CFuture%2CExpected"
 
 SETTINGS_FILE_NAME = "settings.json"
+SETTINGS_SAVE_DEBOUNCE_MS = 250
 RESOURCES_FOLDER_NAME = "resources"
 ALERT_HISTORY_FILE = "alert_history.json"
+GEOCACHE_FILE_NAME = "geocache.json"
 
 ADD_NEW_SOURCE_TEXT = "Add New Source..."
 MANAGE_SOURCES_TEXT = "Manage Sources..."
 ADD_CURRENT_SOURCE_TEXT = "Add Current View as Source..."
 
 MAX_HISTORY_ITEMS = 100
+MAX_LOG_LINES = 5000
+LOG_FLUSH_INTERVAL_MS = 250
+CLOCK_UPDATE_INTERVAL_MS = 1000
+# Timed checks reload the radar view at most this often.
+RADAR_AUTO_RELOAD_MIN_INTERVAL_S = 60
+# Window icon, resolved from resources on first use.
+_APP_ICON: Optional[QIcon] = None
+
+# Alert filter tags, stored per list item so filtering is a bitwise test.
+ALERT_TAG_WARNING = 0x1
+ALERT_TAG_WATCH = 0x2
+ALERT_TAG_ADVISORY = 0x4
+ALERT_TAG_GENERIC = 0x8
+ALERT_TAG_ALL = ALERT_TAG_WARNING | ALERT_TAG_WATCH | ALERT_TAG_ADVISORY | ALERT_TAG_GENERIC
+ALERT_CATEGORY_KEYWORDS = ("warning", "watch", "advisory")
+# One case-insensitive pass finds every category keyword; ALERT_CATEGORY_KEYWORDS still sets precedence.
+ALERT_CATEGORY_RE = re.compile("|".join(ALERT_CATEGORY_KEYWORDS), re.IGNORECASE)
+# New alerts whose title matches also flash the taskbar entry.
+HIGH_PRIORITY_ALERT_KEYWORDS = ("tornado", "severe thunderstorm", "flash flood warning")
+HIGH_PRIORITY_ALERT_RE = re.compile("|".join(map(re.escape, HIGH_PRIORITY_ALERT_KEYWORDS)), re.IGNORECASE)
+ALERT_CATEGORY_TAGS = {
+    "warning": ALERT_TAG_WARNING,
+    "watch": ALERT_TAG_WATCH,
+    "advisory": ALERT_TAG_ADVISORY,
+    "generic": ALERT_TAG_GENERIC,
+}
 MANAGE_LOCATIONS_VALUE = "__manage_locations__"
 
+# Alert list colours as (background, foreground), keyed by dark mode. Built once so
+# repainting the list does not re-parse hex strings for every item.
+ALERT_SEVERITY_COLORS = {
+    True: {
+        "Extreme": (QColor("#49151d"), QColor("#ffd7df")),
+        "Severe": (QColor("#3f1f1f"), QColor("#fecaca")),
+        "Moderate": (QColor("#3b2d12"), QColor("#fde68a")),
+        "Minor": (QColor("#14253d"), QColor("#bfdbfe")),
+        "Unknown": (QColor("#1b2530"), QColor("#d8e2ee")),
+    },
+    False: {
+        "Extreme": (QColor("#fee2e2"), QColor("#7f1d1d")),
+        "Severe": (QColor("#fff1f2"), QColor("#991b1b")),
+        "Moderate": (QColor("#fffbeb"), QColor("#92400e")),
+        "Minor": (QColor("#eff6ff"), QColor("#1d4ed8")),
+        "Unknown": (QColor("#f8fafc"), QColor("#334155")),
+    },
+}
+ALERT_CATEGORY_COLORS = {
+    True: {
+        "warning": (QColor("#3f1f1f"), QColor("#fecaca")),
+        "watch": (QColor("#3b2d12"), QColor("#fde68a")),
+        "advisory": (QColor("#14253d"), QColor("#bfdbfe")),
+        "generic": (QColor("#1b2530"), QColor("#d8e2ee")),
+    },
+    False: {
+        "warning": (QColor("#fff1f2"), QColor("#991b1b")),
+        "watch": (QColor("#fffbeb"), QColor("#92400e")),
+        "advisory": (QColor("#eff6ff"), QColor("#1d4ed8")),
+        "generic": (QColor("#f8fafc"), QColor("#334155")),
+    },
+}
+ALERT_NEW_BACKGROUND = {True: QColor("#4c1d2d"), False: QColor("#ffe4e6")}
+ALERT_ESCALATED_COLORS = {
+    True: (QColor("#5a1d24"), QColor("#ffe4e6")),
+    False: (QColor("#fecdd3"), QColor("#7f1d1d")),
+}
+CURRENT_LOCATION_BACKGROUND = QColor("#dbeafe")
+
 # --- Stylesheet Content ---
 LIGHT_STYLESHEET = '''
 /*
@@ -214,7 +295,7 @@ QGroupBox::title {
 }
 
 /* --- Text/List Views --- */
-QTextEdit, QListWidget {
+QTextEdit, QPlainTextEdit, QListWidget, QListView {
     background-color: #ffffff;
     border: 1px solid #cccccc;
     border-radius: 4px;
@@ -223,24 +304,24 @@ QTextEdit, QListWidget {
     selection-color: #ffffff;
 }
 
-QTextEdit:focus, QListWidget:focus {
+QTextEdit:focus, QPlainTextEdit:focus, QListWidget:focus, QListView:focus {
     border: 1px solid #3498db;
 }
 
-QListWidget::item {
+QListWidget::item, QListView::item {
     padding: 5px;
     border-radius: 3px;
 }
 
-QListWidget::item:alternate {
+QListWidget::item:alternate, QListView::item:alternate {
     background-color: #f7f7f7;
 }
 
-QListWidget::item:hover {
+QListWidget::item:hover, QListView::item:hover {
     background-color: #e9e9e9;
 }
 
-QListWidget::item:selected {
+QListWidget::item:selected, QListView::item:selected {
     background-color: #3498db;
     color: #ffffff;
 }
@@ -1544,6 +1625,9 @@ QSplitter::handle:vertical {
 }
 '''
 
+# Keyed by dark_mode_enabled so theme toggles are a dict lookup.
+STYLESHEETS = {False: LIGHT_STYLESHEET, True: DARK_STYLESHEET}
+
 
 # --- Logging Configuration ---
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -1602,6 +1686,53 @@ class Worker(QRunnable):
         result = Signal(object)
 
 
+class TtsWorker(QObject):
+    '''
+    Owns the pyttsx3 engine on a dedicated QThread so speaking never blocks the UI.
+    pyttsx3 is imported and the engine created on the first utterance, so sessions
+    that never speak skip both. Without a usable engine, utterances are logged instead.
+    '''
+    failed = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.engine = None
+        self._initialized = False
+
+    @Slot()
+    def initialize(self):
+        """Creates the engine on the worker thread; pyttsx3 engines must stay on the thread that made them."""
+        self._initialized = True
+        try:
+            if sys.platform == "win32":
+                import comtypes  # SAPI5 is COM-based; this thread needs its own apartment.
+                comtypes.CoInitialize()
+            import pyttsx3
+            engine = pyttsx3.init()
+            if not engine.getProperty('voices'):
+                raise RuntimeError("No TTS voices found on the system.")
+            self.engine = engine
+        except Exception as e:
+            self.failed.emit(f"TTS engine initialization failed: {e}. Voice announcements will be disabled.")
+
+    @Slot(list)
+    def speak(self, utterances):
+        """Speaks (text, voice_rate) pairs in order with a single engine run."""
+        if not self._initialized:
+            self.initialize()
+        if self.engine is None:
+            for text, _voice_rate in utterances:
+                logging.info(f"TTS (Dummy): {text}")
+            return
+        try:
+            for text, voice_rate in utterances:
+                self.engine.setProperty("rate", voice_rate)
+                self.engine.say(text)
+            self.engine.runAndWait()
+        except Exception as e:
+            self.failed.emit(f"TTS error: {e}")
+
+
 class SettingsManager(ModularSettingsManager):
     """Backward-compatible alias for modular settings manager."""
 
@@ -1610,6 +1741,25 @@ class NwsApiClient(ModularNwsApiClient):
     """Backward-compatible alias for modular NWS API client."""
 
 
+class AlertFilterProxy(QSortFilterProxyModel):
+    """Filters alert rows by their category tag; placeholder rows always pass."""
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._mask = ALERT_TAG_ALL
+
+    def set_mask(self, mask: int) -> None:
+        if mask != self._mask:
+            self._mask = mask
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if index.data(Qt.ItemDataRole.UserRole + 3):
+            return True
+        return bool((index.data(Qt.ItemDataRole.UserRole + 5) or ALERT_TAG_GENERIC) & self._mask)
+
+
 # --- Dialog Classes ---
 class AboutDialog(QDialog):
     def __init__(self, parent: Optional[QWidget] = None):
@@ -1984,7 +2134,7 @@ class AddEditSourceDialog(QDialog):
     def get_data(self) -> Optional[Tuple[str, str]]:
         name = self.name_edit.text().strip()
         url = self.url_edit.text().strip()
-        if name and url and (url.startswith("http://") or url.startswith("https://")):
+        if name and is_web_url(url):
             return name, url
         QMessageBox.warning(self, "Invalid Input",
                             "Please provide a valid name and a URL starting with http:// or https://.")
@@ -1995,14 +2145,15 @@ class ManageSourcesDialog(QDialog):
     def __init__(self, sources: Dict[str, str], parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("Manage Web Sources")
-        self.sources_list: List[Tuple[str, str]] = list(sources.items())
+        self.sources_list: List[Tuple[str, str]] = []
+        # Names in sources_list, for duplicate checks.
+        self._names: set = set()
         self.setMinimumWidth(400)
 
         layout = QVBoxLayout(self)
         self.list_widget = QListWidget()
-        for name, _ in self.sources_list:
-            self.list_widget.addItem(name)
         layout.addWidget(self.list_widget)
+        self.set_sources(sources)
 
         button_layout = QHBoxLayout()
         add_button = QPushButton("Add...")
@@ -2038,10 +2189,11 @@ class ManageSourcesDialog(QDialog):
             data = dialog.get_data()
             if not data: return
             name, url = data
-            if any(n == name for n, _ in self.sources_list):
+            if name in self._names:
                 QMessageBox.warning(self, "Duplicate Name", f"A source with the name '{name}' already exists.")
                 return
             self.sources_list.append((name, url))
+            self._names.add(name)
             self.list_widget.addItem(name)
             self.list_widget.setCurrentRow(len(self.sources_list) - 1)
 
@@ -2058,12 +2210,13 @@ class ManageSourcesDialog(QDialog):
             if not data: return
             new_name, new_url = data
 
-            if new_name != old_name and any(
-                    n == new_name for i, (n, _) in enumerate(self.sources_list) if i != current_row):
+            if new_name != old_name and new_name in self._names:
                 QMessageBox.warning(self, "Duplicate Name", f"A source with the name '{new_name}' already exists.")
                 return
 
             self.sources_list[current_row] = (new_name, new_url)
+            self._names.discard(old_name)
+            self._names.add(new_name)
             selected_item.setText(new_name)
 
     def remove_source(self):
@@ -2076,25 +2229,27 @@ class ManageSourcesDialog(QDialog):
         reply = QMessageBox.question(self, "Confirm Removal", f"Are you sure you want to remove '{name_to_remove}'?")
         if reply == QMessageBox.StandardButton.Yes:
             self.sources_list.pop(current_row)
+            self._names.discard(name_to_remove)
             self.list_widget.takeItem(current_row)
 
     def move_up_source(self):
         current_row = self.list_widget.currentRow()
         if current_row > 0:
-            item_to_move = self.sources_list.pop(current_row)
-            self.sources_list.insert(current_row - 1, item_to_move)
-            q_item = self.list_widget.takeItem(current_row)
-            self.list_widget.insertItem(current_row - 1, q_item)
-            self.list_widget.setCurrentRow(current_row - 1)
+            self._swap_sources(current_row, current_row - 1)
 
     def move_down_source(self):
         current_row = self.list_widget.currentRow()
-        if current_row < len(self.sources_list) - 1:
-            item_to_move = self.sources_list.pop(current_row)
-            self.sources_list.insert(current_row + 1, item_to_move)
-            q_item = self.list_widget.takeItem(current_row)
-            self.list_widget.insertItem(current_row + 1, q_item)
-            self.list_widget.setCurrentRow(current_row + 1)
+        if 0 <= current_row < len(self.sources_list) - 1:
+            self._swap_sources(current_row, current_row + 1)
+
+    def _swap_sources(self, row: int, target_row: int) -> None:
+        sources = self.sources_list
+        sources[row], sources[target_row] = sources[target_row], sources[row]
+        # Move the existing row in the model rather than taking and re-inserting the item.
+        # Qt's destination is the row to insert before, measured before the move.
+        destination = target_row if target_row < row else target_row + 1
+        self.list_widget.model().moveRow(QModelIndex(), row, QModelIndex(), destination)
+        self.list_widget.setCurrentRow(target_row)
 
     def sort_sources_alphabetically(self):
         selected_item = self.list_widget.currentItem()
@@ -2110,6 +2265,13 @@ class ManageSourcesDialog(QDialog):
                     self.list_widget.setCurrentRow(index)
                     break
 
+    def set_sources(self, sources: Dict[str, str]) -> None:
+        """Resets the dialog to the given sources so one instance can be reopened."""
+        self.sources_list = list(sources.items())
+        self._names = set(sources)
+        self.list_widget.clear()
+        self.list_widget.addItems([name for name, _ in self.sources_list])
+
     def get_sources(self) -> Dict[str, str]:
         return dict(self.sources_list)
 
@@ -2991,19 +3153,47 @@ class SettingsDialog(QDialog):
 
 # --- Main Application Window ---
 class WeatherAlertApp(QMainWindow):
+    # Carries queued (text, voice_rate) pairs to the TtsWorker thread.
+    tts_speak_requested = Signal(list)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"Weather Alert Station v{versionnumber}")
         self.setGeometry(70, 70, 1500, 920)
         self.setMinimumSize(1180, 780)
 
-        self._log_buffer: List[str] = []
-
-        self.api_client = ModularNwsApiClient(f'PyWeatherAlertGui/{versionnumber} (github.com/nicarley/PythonWeatherAlerts)')
+        # Set once the log panel is built; None until then.
+        self.log_area: Optional[QPlainTextEdit] = None
+        # Bounded like log_area itself, so a burst before the first flush cannot grow unchecked.
+        self._log_buffer: deque = deque(maxlen=MAX_LOG_LINES)
+        self._log_lines: deque = deque(maxlen=MAX_LOG_LINES)
+        self._log_line_total = 0
+        # Log timestamp text and the whole second it was formatted for; bursts reuse it.
+        self._log_timestamp: Tuple[int, str] = (0, "")
+        # Order currently rendered in log_area and how many lines it covered.
+        self._log_display_order = "chronological"
+        self._log_display_count = 0
+        # Lines waiting in _log_buffer are appended to log_area in one batch per tick.
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        # A late flush is harmless; a coarse timer lets the OS group the wakeup with others.
+        self.log_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._applied_stylesheet: Optional[str] = None
+        self._icons: Dict[QStyle.StandardPixmap, QIcon] = {}
+        self._manage_sources_dialog: Optional[ManageSourcesDialog] = None
+        # Resolved once; the user-data folder is created here rather than on every lookup.
+        self._resources_path = self._locate_resources_path()
+        self._user_data_path = self._locate_user_data_path()
+
+        self.api_client = ModularNwsApiClient(
+            f'PyWeatherAlertGui/{versionnumber} (github.com/nicarley/PythonWeatherAlerts)',
+            geocache_path=os.path.join(self._user_data_path, GEOCACHE_FILE_NAME))
         self.marine_service = MarineDataService(self.api_client.session)
-        self.settings_manager = ModularSettingsManager(os.path.join(self._get_user_data_path(), SETTINGS_FILE_NAME))
+        self.settings_manager = ModularSettingsManager(os.path.join(self._user_data_path, SETTINGS_FILE_NAME))
         self.alert_history_manager = ModularAlertHistoryManager(
-            os.path.join(self._get_user_data_path(), ALERT_HISTORY_FILE))
+            os.path.join(self._user_data_path, ALERT_HISTORY_FILE))
         self.thread_pool = QThreadPool()
         self.log_to_gui(f"Multithreading with up to {self.thread_pool.maxThreadCount()} threads.", level="DEBUG")
 
@@ -3020,6 +3210,10 @@ class WeatherAlertApp(QMainWindow):
         self.last_lifecycle_by_location: Dict[str, Dict[str, Any]] = {}
         self.location_runtime_status: Dict[str, Dict[str, Any]] = {}
         self._last_loaded_web_url: str = ""
+        self._last_radar_reload = 0.0
+        self._radar_reload_pending = False
+        # Radar source requested before the radar web view was first created.
+        self._pending_web_view_url: Optional[str] = None
         self._last_loaded_nws_url: str = ""
         self._last_map_signature: Tuple[Any, ...] = ()
         self._last_map_empty_location_id: str = ""
@@ -3030,7 +3224,7 @@ class WeatherAlertApp(QMainWindow):
         self._web_tabs_was_maximized = False
 
         # Initialize application state variables
-        self.RADAR_OPTIONS = DEFAULT_RADAR_OPTIONS.copy()
+        self._set_radar_options(DEFAULT_RADAR_OPTIONS.copy())
         self._last_valid_radar_text = FALLBACK_DEFAULT_RADAR_DISPLAY_NAME
         self.current_radar_url = FALLBACK_DEFAULT_RADAR_URL
         self.current_repeater_info = FALLBACK_INITIAL_REPEATER_INFO
@@ -3055,6 +3249,7 @@ class WeatherAlertApp(QMainWindow):
         self.current_show_monitoring_status_checked = FALLBACK_SHOW_MONITORING_STATUS_CHECKED
         self.current_show_location_overview_checked = FALLBACK_SHOW_LOCATION_OVERVIEW_CHECKED
         self.current_auto_refresh_content_checked = FALLBACK_AUTO_REFRESH_CONTENT_CHECKED
+        self.current_adaptive_polling_checked = FALLBACK_ADAPTIVE_POLLING_CHECKED
         self.current_dark_mode_enabled = FALLBACK_DARK_MODE_ENABLED
         self.current_log_sort_order = FALLBACK_LOG_SORT_ORDER
         self.current_mute_audio_checked = FALLBACK_MUTE_AUDIO_CHECKED
@@ -3082,29 +3277,60 @@ class WeatherAlertApp(QMainWindow):
         self.latest_temperature_reading: Optional[str] = None
         self._last_time_announcement_minute_key: Optional[str] = None
         self._last_repeater_announcement_minute_key: Optional[str] = None
+        self._last_spoken_repeater: Optional[str] = None
         self._last_temp_announcement_minute_key: Optional[str] = None
 
         self._load_settings()
         self._set_window_icon()
 
-        self.tts_engine = self._initialize_tts_engine()
-        self.is_tts_dummy = isinstance(self.tts_engine, self._DummyEngine)
+        self._init_tts_thread()
 
         self.current_check_interval_ms = CHECK_INTERVAL_OPTIONS.get(
             self.current_interval_key, FALLBACK_INITIAL_CHECK_INTERVAL_MS)
 
+        # None of the periodic timers need sub-second precision, so they are all coarse;
+        # this lets the OS batch wakeups instead of raising the system timer resolution.
         self.main_check_timer = QTimer(self)
+        self.main_check_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.main_check_timer.setSingleShot(True)
         self.main_check_timer.timeout.connect(self.perform_check_cycle)
+        # The countdown chip only ticks while it can be seen; the label is derived from the deadline.
         self.countdown_timer = QTimer(self)
+        self.countdown_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.countdown_timer.timeout.connect(self._update_countdown_display)
-        self.remaining_time_seconds = 0
+        self._next_check_deadline: Optional[float] = None
         self._check_in_progress = False
+        # Bumped per location fetch so a late finished signal cannot release a newer check.
+        self._check_generation = 0
         self._pending_location_id: Optional[str] = None
+        self._resolved_coords_by_location: Dict[str, Tuple[float, float]] = {}
+        # Consecutive timed checks that found no alert changes; drives adaptive polling.
+        # Manual refreshes and location switches do not count, and the streak is per location.
+        self._unchanged_streak = 0
+        self._unchanged_streak_location_id: Optional[str] = None
+        # Re-armed after every tick so it lands just after each whole second.
         self.clock_timer = QTimer(self)
-        self.clock_timer.timeout.connect(self._update_current_time_display)
+        self.clock_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.timeout.connect(self._tick_clock)
+        self._clock_text = ""
         self.scheduled_announcement_timer = QTimer(self)
+        self.scheduled_announcement_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.scheduled_announcement_timer.timeout.connect(self._check_scheduled_time_and_temperature_announcements)
+        # Rapid setting changes collapse into a single background write.
+        self._pending_settings: Optional[Dict[str, Any]] = None
+        self._last_saved_settings: Optional[Dict[str, Any]] = None
+        self._settings_write_in_progress = False
+        # A restore waits for any running write, and blocks new saves until its settings are applied.
+        self._pending_restore_file: Optional[str] = None
+        self._settings_restore_in_progress = False
+        self.settings_save_timer = QTimer(self)
+        self.settings_save_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.settings_save_timer.setSingleShot(True)
+        self.settings_save_timer.setInterval(SETTINGS_SAVE_DEBOUNCE_MS)
+        self.settings_save_timer.timeout.connect(self._flush_pending_settings)
+        # Quitting without closing the window (e.g. session logout) skips closeEvent.
+        QApplication.instance().aboutToQuit.connect(self._flush_settings_on_quit)
 
         self._init_ui()
         self._apply_loaded_settings_to_ui()
@@ -3113,8 +3339,7 @@ class WeatherAlertApp(QMainWindow):
         self._update_location_data(self.current_location_id)
         self._update_main_timer_state()
 
-        # Start the clock timer
-        self.clock_timer.start(1000)
+        # The clock timer starts once the window is shown; see _sync_clock_timer.
         self.scheduled_announcement_timer.start(15000)
         self._update_current_time_display()
 
@@ -3181,25 +3406,40 @@ class WeatherAlertApp(QMainWindow):
             f" · {active_text}"
         )
 
+    def _standard_icon(self, pixmap: QStyle.StandardPixmap) -> QIcon:
+        """Returns the style's standard icon, resolving each pixmap only once."""
+        icon = self._icons.get(pixmap)
+        if icon is None:
+            icon = self.style().standardIcon(pixmap)
+            self._icons[pixmap] = icon
+        return icon
+
     def _set_window_icon(self):
         """Sets the application window icon, trying custom files first."""
-        icon_path_ico = os.path.join(self._get_resources_path(), "icon.ico")
-        icon_path_png = os.path.join(self._get_resources_path(), "icon.png")
-
-        if os.path.exists(icon_path_ico):
-            icon = QIcon(icon_path_ico)
-            self.log_to_gui(f"Loaded application icon from: {icon_path_ico}", level="DEBUG")
-        elif os.path.exists(icon_path_png):
-            icon = QIcon(icon_path_png)
-            self.log_to_gui(f"Loaded application icon from: {icon_path_png}", level="DEBUG")
-        else:
-            icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
-            self.log_to_gui("Custom application icon not found. Using default PySide6 icon.", level="WARNING")
+        global _APP_ICON
+        if _APP_ICON is None:
+            # .ico is the native format on Windows; elsewhere the PNG renders better.
+            icon_names = ("icon.ico", "icon.png") if sys.platform.startswith("win") else ("icon.png", "icon.ico")
+            icon_path = next(
+                (path for path in (os.path.join(self._resources_path, name) for name in icon_names)
+                 if os.path.exists(path)),
+                None,
+            )
+            if icon_path:
+                _APP_ICON = QIcon(icon_path)
+                self.log_to_gui(f"Loaded application icon from: {icon_path}", level="DEBUG")
+            else:
+                _APP_ICON = self._standard_icon(QStyle.StandardPixmap.SP_MessageBoxInformation)
+                self.log_to_gui("Custom application icon not found. Using default PySide6 icon.", level="WARNING")
 
-        self.setWindowIcon(icon)
+        self.setWindowIcon(_APP_ICON)
 
     def _get_resources_path(self) -> str:
         """Gets the path to bundled, read-only resources like icons and stylesheets."""
+        return self._resources_path
+
+    @staticmethod
+    def _locate_resources_path() -> str:
         if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
             # Running in a PyInstaller bundle.
             base_path = sys._MEIPASS
@@ -3210,6 +3450,10 @@ class WeatherAlertApp(QMainWindow):
 
     def _get_user_data_path(self) -> str:
         """Gets a writable path for user data (settings, history)."""
+        return self._user_data_path
+
+    @staticmethod
+    def _locate_user_data_path() -> str:
         app_name = "PythonWeatherAlerts"
         # Use Qt's standard paths for cross-platform compatibility
         # On macOS, this is ~/Library/Application Support/
@@ -3236,9 +3480,10 @@ class WeatherAlertApp(QMainWindow):
             self.current_location_id = self.locations[0].get("id")
         self.current_interval_key = settings.get("check_interval_key", FALLBACK_DEFAULT_INTERVAL_KEY)
         radar_options = settings.get("radar_options_dict", DEFAULT_RADAR_OPTIONS.copy())
-        self.RADAR_OPTIONS = radar_options if isinstance(radar_options, dict) and radar_options else DEFAULT_RADAR_OPTIONS.copy()
+        self._set_radar_options(
+            radar_options if isinstance(radar_options, dict) and radar_options else DEFAULT_RADAR_OPTIONS.copy())
         self.current_radar_url = settings.get("radar_url", FALLBACK_DEFAULT_RADAR_URL)
-        if self.current_radar_url not in self.RADAR_OPTIONS.values():
+        if self.current_radar_url not in self._radar_url_to_name:
             self.current_radar_url = next(iter(self.RADAR_OPTIONS.values()), FALLBACK_DEFAULT_RADAR_URL)
         self.current_announce_alerts_checked = settings.get("announce_alerts", FALLBACK_ANNOUNCE_ALERTS_CHECKED)
         self.current_show_log_checked = settings.get("show_log", FALLBACK_SHOW_LOG_CHECKED)
@@ -3270,6 +3515,7 @@ class WeatherAlertApp(QMainWindow):
         )
         self.current_auto_refresh_content_checked = settings.get("auto_refresh_content",
                                                                  FALLBACK_AUTO_REFRESH_CONTENT_CHECKED)
+        self.current_adaptive_polling_checked = settings.get("adaptive_polling", FALLBACK_ADAPTIVE_POLLING_CHECKED)
         self.current_dark_mode_enabled = settings.get("dark_mode_enabled", FALLBACK_DARK_MODE_ENABLED)
         self.current_log_sort_order = settings.get("log_sort_order", FALLBACK_LOG_SORT_ORDER)
         self.current_mute_audio_checked = settings.get("mute_audio", FALLBACK_MUTE_AUDIO_CHECKED)
@@ -3306,7 +3552,7 @@ class WeatherAlertApp(QMainWindow):
         self.locations = [normalize_location_entry(loc) for loc in FALLBACK_DEFAULT_LOCATIONS]
         self.current_location_id = self.locations[0]["id"]
         self.current_interval_key = FALLBACK_DEFAULT_INTERVAL_KEY
-        self.RADAR_OPTIONS = DEFAULT_RADAR_OPTIONS.copy()
+        self._set_radar_options(DEFAULT_RADAR_OPTIONS.copy())
         self.current_radar_url = FALLBACK_DEFAULT_RADAR_URL
         self._last_valid_radar_text = FALLBACK_DEFAULT_RADAR_DISPLAY_NAME
         self.current_announce_alerts_checked = FALLBACK_ANNOUNCE_ALERTS_CHECKED
@@ -3327,6 +3573,7 @@ class WeatherAlertApp(QMainWindow):
         self.current_show_monitoring_status_checked = FALLBACK_SHOW_MONITORING_STATUS_CHECKED
         self.current_show_location_overview_checked = FALLBACK_SHOW_LOCATION_OVERVIEW_CHECKED
         self.current_auto_refresh_content_checked = FALLBACK_AUTO_REFRESH_CONTENT_CHECKED
+        self.current_adaptive_polling_checked = FALLBACK_ADAPTIVE_POLLING_CHECKED
         self.current_dark_mode_enabled = FALLBACK_DARK_MODE_ENABLED
         self.current_log_sort_order = FALLBACK_LOG_SORT_ORDER
         self.current_mute_audio_checked = FALLBACK_MUTE_AUDIO_CHECKED
@@ -3354,12 +3601,24 @@ class WeatherAlertApp(QMainWindow):
 
     @Slot()
     def _save_settings(self):
+        """Queues a debounced settings write; the file is written off the UI thread."""
+        if self._settings_restore_in_progress:
+            return
+        settings = self._collect_settings()
+        if settings == self._last_saved_settings:
+            return
+        self._last_saved_settings = settings
+        self._pending_settings = settings
+        self.settings_save_timer.start()
+
+    def _collect_settings(self) -> Dict[str, Any]:
+        show_hourly_forecast = self.show_hourly_forecast_action.isChecked()
+        show_daily_forecast = self.show_daily_forecast_action.isChecked()
         settings = {
             "repeater_info": self.current_repeater_info,
             "locations": [normalize_location_entry(loc) for loc in self.locations],
             "current_location_id": self.current_location_id,
             "check_interval_key": self.current_interval_key,
-            "radar_options_dict": self.RADAR_OPTIONS,
             "radar_url": self.current_radar_url,
             "announce_alerts": self.announce_alerts_action.isChecked(),
             "announce_repeater_at_interval": self.current_announce_repeater_at_interval,
@@ -3376,6 +3635,7 @@ class WeatherAlertApp(QMainWindow):
             "announce_temp_30": self.current_announce_temp_30,
             "announce_temp_45": self.current_announce_temp_45,
             "auto_refresh_content": self.auto_refresh_action.isChecked(),
+            "adaptive_polling": self.adaptive_polling_action.isChecked(),
             "mute_audio": self.mute_action.isChecked(),
             "enable_sounds": self.enable_sounds_action.isChecked(),
             "enable_desktop_notifications": self.desktop_notification_action.isChecked(),
@@ -3388,9 +3648,9 @@ class WeatherAlertApp(QMainWindow):
             "dark_mode_enabled": self.dark_mode_action.isChecked(),
             "show_log": self.show_log_action.isChecked(),
             "show_alerts_area": self.show_alerts_area_action.isChecked(),
-            "show_forecasts_area": self.show_hourly_forecast_action.isChecked() or self.show_daily_forecast_action.isChecked(),
-            "show_hourly_forecast": self.show_hourly_forecast_action.isChecked(),
-            "show_daily_forecast": self.show_daily_forecast_action.isChecked(),
+            "show_forecasts_area": show_hourly_forecast or show_daily_forecast,
+            "show_hourly_forecast": show_hourly_forecast,
+            "show_daily_forecast": show_daily_forecast,
             "toolbar_show_location": self.current_toolbar_show_location,
             "toolbar_show_interval": self.current_toolbar_show_interval,
             "toolbar_show_sources": self.current_toolbar_show_sources,
@@ -3404,12 +3664,63 @@ class WeatherAlertApp(QMainWindow):
             "show_location_overview": self.show_location_overview_action.isChecked(),
             "log_sort_order": self.current_log_sort_order,
         }
-        if self.settings_manager.save(settings):
+        # Unmodified web sources are left out and refilled from DEFAULT_RADAR_OPTIONS on load.
+        # The copy keeps later in-place edits from matching the last-saved snapshot.
+        if self.RADAR_OPTIONS != DEFAULT_RADAR_OPTIONS:
+            settings["radar_options_dict"] = dict(self.RADAR_OPTIONS)
+        return settings
+
+    @Slot()
+    def _flush_pending_settings(self):
+        if self._pending_settings is None or self._settings_write_in_progress:
+            return
+        settings, self._pending_settings = self._pending_settings, None
+        self._settings_write_in_progress = True
+        worker = Worker(self.settings_manager.save, settings)
+        worker.signals.result.connect(self._on_settings_saved)
+        worker.signals.finished.connect(self._on_settings_write_finished)
+        self.thread_pool.start(worker)
+
+    @Slot(object)
+    def _on_settings_saved(self, saved: bool):
+        if saved:
             self.update_status("Settings saved.")
         else:
+            self._last_saved_settings = None
             self.log_to_gui("Error saving settings.", level="ERROR")
             QMessageBox.critical(self, "Error", "Could not save settings to file.")
 
+    @Slot()
+    def _on_settings_write_finished(self):
+        self._settings_write_in_progress = False
+        if self._pending_restore_file is not None:
+            file_name, self._pending_restore_file = self._pending_restore_file, None
+            self._start_settings_restore(file_name)
+            return
+        # Changes made while the previous write was running still need flushing.
+        if self._pending_settings is not None and not self.settings_save_timer.isActive():
+            self._flush_pending_settings()
+
+    @Slot()
+    def _flush_settings_on_quit(self):
+        if self._pending_settings is not None or self.settings_save_timer.isActive():
+            self.thread_pool.waitForDone()
+            if not self._save_settings_now():
+                logging.error("Error saving settings on quit.")
+
+    def _save_settings_now(self) -> bool:
+        """Writes settings synchronously, bypassing the debounce (used on shutdown)."""
+        self.settings_save_timer.stop()
+        self._pending_settings = None
+        if self._settings_restore_in_progress:
+            # The restored file is newer than anything the UI holds.
+            return True
+        settings = self._collect_settings()
+        if settings == self._last_saved_settings and not self._settings_write_in_progress:
+            return True
+        self._last_saved_settings = settings
+        return self.settings_manager.save(settings)
+
     def _init_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -3478,7 +3789,13 @@ class WeatherAlertApp(QMainWindow):
         self.alerts_meta_label.setObjectName("AlertMetaLabel")
         self.alerts_meta_label.setWordWrap(True)
         alerts_layout.addWidget(self.alerts_meta_label)
-        self.alerts_display_area = QListWidget()
+        self.alerts_model = QStandardItemModel(self)
+        self._alert_items: List[QStandardItem] = []
+        self.alerts_proxy = AlertFilterProxy(self)
+        self.alerts_proxy.setSourceModel(self.alerts_model)
+        self.alerts_display_area = QListView()
+        self.alerts_display_area.setModel(self.alerts_proxy)
+        self.alerts_display_area.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.alerts_display_area.setObjectName("AlertsDisplayArea")
         alerts_font = self.alerts_display_area.font()
         alerts_font.setPointSize(9)
@@ -3491,7 +3808,7 @@ class WeatherAlertApp(QMainWindow):
         self.alerts_display_area.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.alerts_display_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.alerts_display_area.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.alerts_display_area.itemDoubleClicked.connect(self._show_current_alert_details)
+        self.alerts_display_area.doubleClicked.connect(self._show_current_alert_details)
         alerts_layout.addWidget(self.alerts_display_area)
 
         self.lifecycle_display_area = QListWidget(self.alerts_group)
@@ -3518,30 +3835,15 @@ class WeatherAlertApp(QMainWindow):
         hourly_forecast_sub_group_layout = QVBoxLayout(self.hourly_forecast_group)
         hourly_forecast_sub_group_layout.setContentsMargins(4, 4, 4, 4)
         hourly_forecast_sub_group_layout.setSpacing(1)
-        self.hourly_forecast_widget = QWidget()
-        self.hourly_forecast_widget.setObjectName("HourlyForecastGrid")
-        self.hourly_forecast_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.hourly_forecast_layout = QGridLayout(self.hourly_forecast_widget)
-        self.hourly_forecast_layout.setContentsMargins(3, 3, 3, 3)
-        self.hourly_forecast_layout.setHorizontalSpacing(4)
-        self.hourly_forecast_layout.setVerticalSpacing(1)
-        self.hourly_forecast_layout.setColumnStretch(0, 0)
-        self.hourly_forecast_layout.setColumnStretch(1, 2)
-        self.hourly_forecast_layout.setColumnStretch(2, 2)
-        self.hourly_forecast_layout.setColumnStretch(3, 4)
-        self.hourly_forecast_layout.setColumnStretch(4, 2)
-        self.hourly_forecast_layout.setColumnStretch(5, 2)
-        self.hourly_forecast_layout.setColumnStretch(6, 2)
-        self.hourly_forecast_layout.setColumnStretch(7, 2)
-        self.hourly_forecast_layout.setColumnStretch(8, 5)
+        self.hourly_forecast_widget = self._create_forecast_table(
+            "HourlyForecastGrid",
+            ["Time", "Temp", "Feels Like", "Wind", "Gusts", "Precip", "Humidity", "Sky", "Forecast"],
+            data_rows=8,
+            centered_columns=range(8),
+        )
         hourly_font = QFont(); hourly_font.setPointSize(8); self.hourly_forecast_widget.setFont(hourly_font)
-        self.hourly_forecast_scroll = QScrollArea()
-        self.hourly_forecast_scroll.setWidgetResizable(True)
-        self.hourly_forecast_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.hourly_forecast_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.hourly_forecast_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.hourly_forecast_scroll.setWidget(self.hourly_forecast_widget)
-        hourly_forecast_sub_group_layout.addWidget(self.hourly_forecast_scroll)
+        self.hourly_forecast_stack = self._create_forecast_stack(self.hourly_forecast_widget)
+        hourly_forecast_sub_group_layout.addWidget(self.hourly_forecast_stack)
         self.combined_forecast_main_layout.addWidget(self.hourly_forecast_group, 1)
         self.daily_forecast_group = QGroupBox("5-Day Forecast")
         self.daily_forecast_group.setObjectName("DailyForecastCard")
@@ -3549,26 +3851,15 @@ class WeatherAlertApp(QMainWindow):
         daily_forecast_sub_group_layout = QVBoxLayout(self.daily_forecast_group)
         daily_forecast_sub_group_layout.setContentsMargins(4, 4, 4, 4)
         daily_forecast_sub_group_layout.setSpacing(1)
-        self.daily_forecast_widget = QWidget()
-        self.daily_forecast_widget.setObjectName("DailyForecastGrid")
-        self.daily_forecast_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.daily_forecast_layout = QGridLayout(self.daily_forecast_widget)
-        self.daily_forecast_layout.setContentsMargins(3, 3, 3, 3)
-        self.daily_forecast_layout.setHorizontalSpacing(4)
-        self.daily_forecast_layout.setVerticalSpacing(1)
-        self.daily_forecast_layout.setColumnStretch(0, 2)
-        self.daily_forecast_layout.setColumnStretch(1, 1)
-        self.daily_forecast_layout.setColumnStretch(2, 2)
-        self.daily_forecast_layout.setColumnStretch(3, 1)
-        self.daily_forecast_layout.setColumnStretch(4, 4)
+        self.daily_forecast_widget = self._create_forecast_table(
+            "DailyForecastGrid",
+            ["Day", "High / Low", "Wind", "Precip", "Forecast"],
+            data_rows=5,
+            centered_columns=(1, 2, 3),
+        )
         daily_font = QFont(); daily_font.setPointSize(8); self.daily_forecast_widget.setFont(daily_font)
-        self.daily_forecast_scroll = QScrollArea()
-        self.daily_forecast_scroll.setWidgetResizable(True)
-        self.daily_forecast_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.daily_forecast_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.daily_forecast_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.daily_forecast_scroll.setWidget(self.daily_forecast_widget)
-        daily_forecast_sub_group_layout.addWidget(self.daily_forecast_scroll)
+        self.daily_forecast_stack = self._create_forecast_stack(self.daily_forecast_widget)
+        daily_forecast_sub_group_layout.addWidget(self.daily_forecast_stack)
         self.combined_forecast_main_layout.addWidget(self.daily_forecast_group, 1)
         right_workspace_layout.addWidget(self.combined_forecast_widget, 0)
         self._apply_forecast_layout_mode()
@@ -3587,19 +3878,19 @@ class WeatherAlertApp(QMainWindow):
         web_nav_layout.setSpacing(4)
         self.web_back_button = QPushButton("")
         self.web_back_button.setObjectName("HeaderIconButton")
-        self.web_back_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowBack))
+        self.web_back_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ArrowBack))
         self.web_back_button.setToolTip("Go back in the active web tab")
         self.web_back_button.clicked.connect(self._go_active_web_back)
         web_nav_layout.addWidget(self.web_back_button)
         self.web_forward_button = QPushButton("")
         self.web_forward_button.setObjectName("HeaderIconButton")
-        self.web_forward_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowForward))
+        self.web_forward_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ArrowForward))
         self.web_forward_button.setToolTip("Go forward in the active web tab")
         self.web_forward_button.clicked.connect(self._go_active_web_forward)
         web_nav_layout.addWidget(self.web_forward_button)
         self.web_reload_button = QPushButton("")
         self.web_reload_button.setObjectName("HeaderIconButton")
-        self.web_reload_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+        self.web_reload_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_BrowserReload))
         self.web_reload_button.setToolTip("Reload the active web tab")
         self.web_reload_button.clicked.connect(self._reload_active_web_view)
         web_nav_layout.addWidget(self.web_reload_button)
@@ -3610,16 +3901,18 @@ class WeatherAlertApp(QMainWindow):
         self.web_tabs_fullscreen_button.clicked.connect(self._toggle_web_tabs_fullscreen)
         web_nav_layout.addWidget(self.web_tabs_fullscreen_button)
         self.web_tabs.currentChanged.connect(self._update_web_navigation_buttons)
+        self.web_tabs.currentChanged.connect(self._on_web_tab_changed)
         self.web_tabs.setCornerWidget(self.web_nav_widget, Qt.Corner.TopRightCorner)
         if QWebEngineView:
-            self.web_view = QWebEngineView()
+            # The radar page is the heaviest source, so its view is created when the tab is first opened.
+            self.web_view = QLabel("Radar loads when this tab is opened.")
+            self.web_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.map_view = QWebEngineView()
             self.nws_view = QWebEngineView()
             self.digital_forecast_view = QWebEngineView()
             self.forecast_trends_view = QWebEngineView()
             self.fishing_view = QWebEngineView()
             for view in [
-                self.web_view,
                 self.map_view,
                 self.nws_view,
                 self.digital_forecast_view,
@@ -3666,17 +3959,14 @@ class WeatherAlertApp(QMainWindow):
         log_toolbar = QHBoxLayout()
         log_toolbar.addWidget(QLabel("<b>Event Log</b>"))
         log_toolbar.addStretch()
-        style = self.style()
-        sort_asc_button = QPushButton(""); sort_asc_button.setObjectName("HeaderIconButton"); sort_asc_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_ArrowUp)); sort_asc_button.setToolTip("Sort log ascending (A-Z)"); sort_asc_button.clicked.connect(self._sort_log_ascending); log_toolbar.addWidget(sort_asc_button)
-        sort_desc_button = QPushButton(""); sort_desc_button.setObjectName("HeaderIconButton"); sort_desc_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_ArrowDown)); sort_desc_button.setToolTip("Sort log descending (Z-A)"); sort_desc_button.clicked.connect(self._sort_log_descending); log_toolbar.addWidget(sort_desc_button)
-        clear_log_button = QPushButton(""); clear_log_button.setObjectName("HeaderIconButton"); clear_log_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogResetButton)); clear_log_button.setToolTip("Clear event log"); clear_log_button.clicked.connect(lambda: self.log_area.clear()); log_toolbar.addWidget(clear_log_button)
+        sort_asc_button = QPushButton(""); sort_asc_button.setObjectName("HeaderIconButton"); sort_asc_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ArrowUp)); sort_asc_button.setToolTip("Show log oldest first"); sort_asc_button.clicked.connect(self._sort_log_ascending); log_toolbar.addWidget(sort_asc_button)
+        sort_desc_button = QPushButton(""); sort_desc_button.setObjectName("HeaderIconButton"); sort_desc_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ArrowDown)); sort_desc_button.setToolTip("Show log newest first"); sort_desc_button.clicked.connect(self._sort_log_descending); log_toolbar.addWidget(sort_desc_button)
+        clear_log_button = QPushButton(""); clear_log_button.setObjectName("HeaderIconButton"); clear_log_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_DialogResetButton)); clear_log_button.setToolTip("Clear event log"); clear_log_button.clicked.connect(self._clear_log); log_toolbar.addWidget(clear_log_button)
         log_layout.addLayout(log_toolbar)
-        self.log_area = QTextEdit(); self.log_area.setReadOnly(True); log_layout.addWidget(self.log_area)
+        self.log_area = QPlainTextEdit(); self.log_area.setReadOnly(True); self.log_area.setMaximumBlockCount(MAX_LOG_LINES); log_layout.addWidget(self.log_area)
         self.bottom_splitter.addWidget(self.log_widget)
 
-        if self._log_buffer:
-            self.log_area.append("\n".join(self._log_buffer))
-            self._log_buffer.clear()
+        self._flush_log_buffer()
 
         self.bottom_splitter.setSizes([760, 1])
         self.workbench_splitter.setSizes([440, 1060])
@@ -3697,9 +3987,12 @@ class WeatherAlertApp(QMainWindow):
         warnings = []
         if QWebEngineView is None:
             warnings.append("PySide6-WebEngine missing")
-        if getattr(self.api_client, "pgeocode_client", None) is None:
+        # pyttsx3 itself is only imported on the first announcement; see TtsWorker.
+        if importlib.util.find_spec("pyttsx3") is None:
+            warnings.append("pyttsx3 missing (voice announcements disabled)")
+        if not self.api_client.geocoder_available:
             warnings.append("offline ZIP/city geocoder unavailable")
-        user_data_path = self._get_user_data_path()
+        user_data_path = self._user_data_path
         if not os.access(user_data_path, os.W_OK):
             warnings.append("user-data folder is not writable")
 
@@ -3752,7 +4045,7 @@ class WeatherAlertApp(QMainWindow):
             if self._web_tabs_fullscreen_active
             else QStyle.StandardPixmap.SP_TitleBarMaxButton
         )
-        self.web_tabs_fullscreen_button.setIcon(self.style().standardIcon(icon_type))
+        self.web_tabs_fullscreen_button.setIcon(self._standard_icon(icon_type))
         self.web_tabs_fullscreen_button.setToolTip(
             "Return to the station desk"
             if self._web_tabs_fullscreen_active
@@ -3824,7 +4117,6 @@ class WeatherAlertApp(QMainWindow):
         top_status_layout = QHBoxLayout()
         top_status_layout.setContentsMargins(0, 0, 0, 2)
 
-        style = self.style()
         strip = QFrame()
         self.top_status_strip = strip
         strip.setObjectName("TopStatusStrip")
@@ -3880,7 +4172,7 @@ class WeatherAlertApp(QMainWindow):
         self.current_time_label.setMaximumWidth(150)
 
         location_icon_label = QLabel()
-        location_icon_label.setPixmap(style.standardIcon(QStyle.StandardPixmap.SP_DirHomeIcon).pixmap(14, 14))
+        location_icon_label.setPixmap(self._standard_icon(QStyle.StandardPixmap.SP_DirHomeIcon).pixmap(14, 14))
         location_icon_label.setObjectName("TopToolbarIcon")
         self.location_icon_label = location_icon_label
         controls_layout.addWidget(location_icon_label)
@@ -3894,7 +4186,7 @@ class WeatherAlertApp(QMainWindow):
         controls_layout.addWidget(self.location_combo)
 
         interval_icon_label = QLabel()
-        interval_icon_label.setPixmap(style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload).pixmap(14, 14))
+        interval_icon_label.setPixmap(self._standard_icon(QStyle.StandardPixmap.SP_BrowserReload).pixmap(14, 14))
         interval_icon_label.setObjectName("TopToolbarIcon")
         self.interval_icon_label = interval_icon_label
         controls_layout.addWidget(interval_icon_label)
@@ -3910,7 +4202,7 @@ class WeatherAlertApp(QMainWindow):
 
         self.refresh_now_button = QPushButton("")
         self.refresh_now_button.setObjectName("HeaderIconButton")
-        self.refresh_now_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+        self.refresh_now_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_BrowserReload))
         self.refresh_now_button.setToolTip("Refresh current location now")
         self.refresh_now_button.setMinimumHeight(28)
         self.refresh_now_button.clicked.connect(self._refresh_current_location)
@@ -3918,14 +4210,14 @@ class WeatherAlertApp(QMainWindow):
 
         self.web_source_quick_select_button = QPushButton("")
         self.web_source_quick_select_button.setObjectName("HeaderIconButton")
-        self.web_source_quick_select_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
+        self.web_source_quick_select_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ComputerIcon))
         self.web_source_quick_select_button.setToolTip("Choose radar or web source")
         self.web_source_quick_select_button.setMinimumHeight(28)
         controls_layout.addWidget(self.web_source_quick_select_button)
 
         self.mute_button = QPushButton("")
         self.mute_button.setObjectName("ToolbarMuteButton")
-        self.mute_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaVolumeMuted))
+        self.mute_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_MediaVolumeMuted))
         self.mute_button.setToolTip("Mute All Audio")
         self.mute_button.setCheckable(True)
         self.mute_button.setMinimumHeight(26)
@@ -3934,7 +4226,7 @@ class WeatherAlertApp(QMainWindow):
 
         self.incident_center_button = QPushButton("")
         self.incident_center_button.setObjectName("HeaderIconButton")
-        self.incident_center_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        self.incident_center_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
         self.incident_center_button.setToolTip("Open incident center")
         self.incident_center_button.setMinimumHeight(28)
         self.incident_center_button.clicked.connect(lambda checked=False: self._show_incident_center())
@@ -3942,7 +4234,7 @@ class WeatherAlertApp(QMainWindow):
 
         self.preferences_button = QPushButton("")
         self.preferences_button.setObjectName("HeaderIconButton")
-        self.preferences_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        self.preferences_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
         self.preferences_button.setToolTip("Open preferences")
         self.preferences_button.setMinimumHeight(28)
         self.preferences_button.clicked.connect(lambda checked=False: self._open_preferences_dialog("General"))
@@ -4038,7 +4330,7 @@ class WeatherAlertApp(QMainWindow):
         footer_layout.addStretch(1)
         incident_button = QPushButton("Incidents")
         incident_button.setObjectName("SecondaryActionButton")
-        incident_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        incident_button.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
         incident_button.clicked.connect(lambda checked=False: self._show_incident_center())
         footer_layout.addWidget(incident_button)
         layout.addLayout(footer_layout)
@@ -4054,121 +4346,131 @@ class WeatherAlertApp(QMainWindow):
 
     def _create_menu_bar(self):
         menu_bar = self.menuBar()
-        style = self.style()
-
-        # File Menu
-        file_menu = menu_bar.addMenu("&Station")
-        preferences_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView),
-                                     "&Preferences...", self)
-        preferences_action.triggered.connect(lambda _checked=False: self._open_preferences_dialog("General"))
-        file_menu.addAction(preferences_action)
-        self.file_show_monitoring_status_action = QAction("Show Operational Status", self, checkable=True)
-        self.file_show_monitoring_status_action.toggled.connect(self._on_show_monitoring_status_toggled)
-        file_menu.addSeparator()
-        self.backup_settings_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton),
-                                              "&Backup Settings...", self)
-        self.backup_settings_action.triggered.connect(self._backup_settings)
-        file_menu.addAction(self.backup_settings_action)
-        self.restore_settings_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_DialogOkButton),
-                                               "&Restore Settings...", self)
-        self.restore_settings_action.triggered.connect(self._restore_settings)
-        file_menu.addAction(self.restore_settings_action)
-        file_menu.addSeparator()
-        exit_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_DialogCloseButton), "E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # View Menu
-        view_menu = menu_bar.addMenu("&Desk")
-        self.web_sources_menu = view_menu.addMenu("&Sources")
-        self.web_sources_menu.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
-        self.web_sources_menu.aboutToShow.connect(self._update_web_sources_menu)
-        view_menu.addSeparator()
-        self.show_log_action = QAction("Show &Event Log", self, checkable=True)
-        self.show_log_action.toggled.connect(self._on_show_log_toggled)
-        view_menu.addAction(self.show_log_action)
-        self.show_alerts_area_action = QAction("Show &Alert Stack", self, checkable=True)
-        self.show_alerts_area_action.toggled.connect(self._on_show_alerts_toggled)
-        view_menu.addAction(self.show_alerts_area_action)
-        self.show_hourly_forecast_action = QAction("Show &8-Hour Forecast", self, checkable=True)
-        self.show_hourly_forecast_action.toggled.connect(self._on_show_hourly_forecast_toggled)
-        view_menu.addAction(self.show_hourly_forecast_action)
-        self.show_daily_forecast_action = QAction("Show &5-Day Forecast", self, checkable=True)
-        self.show_daily_forecast_action.toggled.connect(self._on_show_daily_forecast_toggled)
-        view_menu.addAction(self.show_daily_forecast_action)
-        view_menu.addSeparator()
-        customize_toolbar_action = QAction("Customize Desk...", self)
-        customize_toolbar_action.triggered.connect(lambda checked=False: self._open_preferences_dialog("Display"))
-        view_menu.addAction(customize_toolbar_action)
-        self.show_monitoring_status_action = QAction("Show Station Overview", self, checkable=True)
-        self.show_monitoring_status_action.toggled.connect(self._on_show_monitoring_status_toggled)
-        view_menu.addAction(self.show_monitoring_status_action)
-        self.show_location_overview_action = QAction("Show Watch Locations", self, checkable=True)
-        self.show_location_overview_action.toggled.connect(self._on_show_location_overview_toggled)
-        view_menu.addAction(self.show_location_overview_action)
-        view_menu.addSeparator()
-        self.dark_mode_action = QAction("&Enable Dark Mode", self, checkable=True)
-        self.dark_mode_action.toggled.connect(self._on_dark_mode_toggled)
-        view_menu.addAction(self.dark_mode_action)
-
-        # Incidents Menu
-        history_menu = menu_bar.addMenu("&Incidents")
-        incident_center_action = QAction("Open Incident Center", self)
-        incident_center_action.triggered.connect(lambda checked=False: self._show_incident_center())
-        history_menu.addAction(incident_center_action)
-        history_menu.addSeparator()
-        view_history_action = QAction("Alert History", self)
-        view_history_action.triggered.connect(self._show_alert_history)
-        history_menu.addAction(view_history_action)
-        view_timeline_action = QAction("Lifecycle Timeline", self)
-        view_timeline_action.triggered.connect(self._show_lifecycle_timeline)
-        history_menu.addAction(view_timeline_action)
-        export_incident_action = QAction("Export Incident Report...", self)
-        export_incident_action.triggered.connect(self._export_incident_report)
-        history_menu.addAction(export_incident_action)
-
-        # Actions Menu
-        actions_menu = menu_bar.addMenu("&Monitor")
-        refresh_now_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh Now", self)
-        refresh_now_action.setShortcut("F5")
-        refresh_now_action.triggered.connect(self._refresh_current_location)
-        actions_menu.addAction(refresh_now_action)
-        actions_menu.addSeparator()
-        self.announce_alerts_action = QAction("Timed Announcements", self, checkable=True)
-        self.announce_alerts_action.setToolTip("When checked, periodically announces repeater info or new alerts at the set interval.")
-        self.announce_alerts_action.toggled.connect(self._on_announce_alerts_toggled)
-        actions_menu.addAction(self.announce_alerts_action)
-        self.auto_refresh_action = QAction("Auto-&Refresh Station", self, checkable=True)
-        self.auto_refresh_action.toggled.connect(self._on_auto_refresh_content_toggled)
-        actions_menu.addAction(self.auto_refresh_action)
-        self.mute_action = QAction("Mute All Audio", self, checkable=True)
-        self.mute_action.toggled.connect(self._on_mute_toggled)
-        actions_menu.addAction(self.mute_action)
-        self.enable_sounds_action = QAction("Enable Alert Sounds", self, checkable=True)
-        self.enable_sounds_action.toggled.connect(self._on_enable_sounds_toggled)
-        actions_menu.addAction(self.enable_sounds_action)
-        self.desktop_notification_action = QAction("Enable Desktop Notifications", self, checkable=True)
-        self.desktop_notification_action.toggled.connect(self._on_desktop_notification_toggled)
-        actions_menu.addAction(self.desktop_notification_action)
-        actions_menu.addSeparator()
-        health_action = QAction("Delivery Health Dashboard", self)
-        health_action.triggered.connect(lambda: self._show_incident_center("Delivery Health"))
-        actions_menu.addAction(health_action)
-        test_channels_action = QAction("Send Test Notifications", self)
-        test_channels_action.triggered.connect(self._send_test_notifications)
-        actions_menu.addAction(test_channels_action)
-
-        # Help Menu
-        help_menu = menu_bar.addMenu("&Help")
-        github_help_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxQuestion),
-                                     "View Help on GitHub", self)
-        github_help_action.triggered.connect(self._show_github_help)
-        help_menu.addAction(github_help_action)
-        help_menu.addSeparator()
-        about_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation), "&About...", self)
-        about_action.triggered.connect(self._show_about_dialog)
-        help_menu.addAction(about_action)
+        # Build every action first, then insert each menu's actions in one pass with updates frozen.
+        menu_bar.setUpdatesEnabled(False)
+        try:
+            # File Menu
+            file_menu = menu_bar.addMenu("&Station")
+            preferences_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView),
+                                         "&Preferences...", self)
+            preferences_action.triggered.connect(lambda _checked=False: self._open_preferences_dialog("General"))
+            self.file_show_monitoring_status_action = QAction("Show Operational Status", self, checkable=True)
+            self.file_show_monitoring_status_action.toggled.connect(self._on_show_monitoring_status_toggled)
+            self.backup_settings_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton),
+                                                  "&Backup Settings...", self)
+            self.backup_settings_action.triggered.connect(self._backup_settings)
+            self.restore_settings_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_DialogOkButton),
+                                                   "&Restore Settings...", self)
+            self.restore_settings_action.triggered.connect(self._restore_settings)
+            exit_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_DialogCloseButton), "E&xit", self)
+            exit_action.setShortcut("Ctrl+Q")
+            exit_action.triggered.connect(self.close)
+            self._populate_menu(file_menu, [
+                preferences_action, None,
+                self.backup_settings_action, self.restore_settings_action, None,
+                exit_action,
+            ])
+
+            # View Menu
+            view_menu = menu_bar.addMenu("&Desk")
+            self.web_sources_menu = view_menu.addMenu("&Sources")
+            self.web_sources_menu.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_ComputerIcon))
+            self.web_sources_menu.aboutToShow.connect(self._update_web_sources_menu)
+            self.show_log_action = QAction("Show &Event Log", self, checkable=True)
+            self.show_log_action.toggled.connect(self._on_show_log_toggled)
+            self.show_alerts_area_action = QAction("Show &Alert Stack", self, checkable=True)
+            self.show_alerts_area_action.toggled.connect(self._on_show_alerts_toggled)
+            self.show_hourly_forecast_action = QAction("Show &8-Hour Forecast", self, checkable=True)
+            self.show_hourly_forecast_action.toggled.connect(self._on_show_hourly_forecast_toggled)
+            self.show_daily_forecast_action = QAction("Show &5-Day Forecast", self, checkable=True)
+            self.show_daily_forecast_action.toggled.connect(self._on_show_daily_forecast_toggled)
+            customize_toolbar_action = QAction("Customize Desk...", self)
+            customize_toolbar_action.triggered.connect(lambda checked=False: self._open_preferences_dialog("Display"))
+            self.show_monitoring_status_action = QAction("Show Station Overview", self, checkable=True)
+            self.show_monitoring_status_action.toggled.connect(self._on_show_monitoring_status_toggled)
+            self.show_location_overview_action = QAction("Show Watch Locations", self, checkable=True)
+            self.show_location_overview_action.toggled.connect(self._on_show_location_overview_toggled)
+            self.dark_mode_action = QAction("&Enable Dark Mode", self, checkable=True)
+            self.dark_mode_action.toggled.connect(self._on_dark_mode_toggled)
+            self._populate_menu(view_menu, [
+                None,
+                self.show_log_action, self.show_alerts_area_action,
+                self.show_hourly_forecast_action, self.show_daily_forecast_action, None,
+                customize_toolbar_action, self.show_monitoring_status_action, self.show_location_overview_action, None,
+                self.dark_mode_action,
+            ])
+
+            # Incidents Menu
+            history_menu = menu_bar.addMenu("&Incidents")
+            incident_center_action = QAction("Open Incident Center", self)
+            incident_center_action.triggered.connect(lambda checked=False: self._show_incident_center())
+            view_history_action = QAction("Alert History", self)
+            view_history_action.triggered.connect(self._show_alert_history)
+            view_timeline_action = QAction("Lifecycle Timeline", self)
+            view_timeline_action.triggered.connect(self._show_lifecycle_timeline)
+            export_incident_action = QAction("Export Incident Report...", self)
+            export_incident_action.triggered.connect(self._export_incident_report)
+            self._populate_menu(history_menu, [
+                incident_center_action, None,
+                view_history_action, view_timeline_action, export_incident_action,
+            ])
+
+            # Actions Menu
+            actions_menu = menu_bar.addMenu("&Monitor")
+            refresh_now_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh Now", self)
+            refresh_now_action.setShortcut("F5")
+            refresh_now_action.triggered.connect(self._refresh_current_location)
+            self.announce_alerts_action = QAction("Timed Announcements", self, checkable=True)
+            self.announce_alerts_action.setToolTip("When checked, periodically announces repeater info or new alerts at the set interval.")
+            self.announce_alerts_action.toggled.connect(self._on_announce_alerts_toggled)
+            self.auto_refresh_action = QAction("Auto-&Refresh Station", self, checkable=True)
+            self.auto_refresh_action.toggled.connect(self._on_auto_refresh_content_toggled)
+            self.adaptive_polling_action = QAction("Adaptive Polling", self, checkable=True)
+            self.adaptive_polling_action.setToolTip(
+                "When checked, checks gradually slow down (up to twice the set interval) while alerts are unchanged.")
+            self.adaptive_polling_action.toggled.connect(self._on_adaptive_polling_toggled)
+            self.mute_action = QAction("Mute All Audio", self, checkable=True)
+            self.mute_action.toggled.connect(self._on_mute_toggled)
+            self.enable_sounds_action = QAction("Enable Alert Sounds", self, checkable=True)
+            self.enable_sounds_action.toggled.connect(self._on_enable_sounds_toggled)
+            self.desktop_notification_action = QAction("Enable Desktop Notifications", self, checkable=True)
+            self.desktop_notification_action.toggled.connect(self._on_desktop_notification_toggled)
+            health_action = QAction("Delivery Health Dashboard", self)
+            health_action.triggered.connect(lambda: self._show_incident_center("Delivery Health"))
+            test_channels_action = QAction("Send Test Notifications", self)
+            test_channels_action.triggered.connect(self._send_test_notifications)
+            self._populate_menu(actions_menu, [
+                refresh_now_action, None,
+                self.announce_alerts_action, self.auto_refresh_action, self.adaptive_polling_action,
+                self.mute_action, self.enable_sounds_action, self.desktop_notification_action, None,
+                health_action, test_channels_action,
+            ])
+
+            # Help Menu
+            help_menu = menu_bar.addMenu("&Help")
+            github_help_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_MessageBoxQuestion),
+                                         "View Help on GitHub", self)
+            github_help_action.triggered.connect(self._show_github_help)
+            about_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_MessageBoxInformation), "&About...", self)
+            about_action.triggered.connect(self._show_about_dialog)
+            self._populate_menu(help_menu, [github_help_action, None, about_action])
+        finally:
+            menu_bar.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _populate_menu(menu: QMenu, entries: List[Optional[QAction]]):
+        """Adds actions in order, inserting a separator for each None; consecutive actions go in one addActions call."""
+        run: List[QAction] = []
+        for entry in entries:
+            if entry is not None:
+                run.append(entry)
+                continue
+            if run:
+                menu.addActions(run)
+                run = []
+            menu.addSeparator()
+        if run:
+            menu.addActions(run)
 
     def get_weather_emoji(self, forecast_text: str) -> str:
         """Returns an emoji based on the forecast text."""
@@ -4211,34 +4513,6 @@ class WeatherAlertApp(QMainWindow):
     def _first_payload_entry(payload_value: Any) -> Dict[str, Any]:
         return first_payload_entry(payload_value)
 
-    def _make_compact_label(
-        self,
-        text: str,
-        tooltip: Optional[str] = None,
-        wrap: bool = False,
-        max_lines: Optional[int] = 1,
-    ) -> QLabel:
-        label = QLabel(text)
-        label.setWordWrap(wrap)
-        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        label.setSizePolicy(
-            QSizePolicy.Policy.Expanding if wrap else QSizePolicy.Policy.Preferred,
-            QSizePolicy.Policy.Preferred if wrap else QSizePolicy.Policy.Fixed,
-        )
-        label.setMinimumWidth(0)
-        line_height = label.fontMetrics().lineSpacing()
-        if max_lines is None:
-            label.setMinimumHeight(line_height + 6)
-            label.setMaximumHeight(16777215)
-        else:
-            line_count = max(1, max_lines)
-            vertical_padding = 8 if not wrap else 6
-            label.setMinimumHeight((line_height * line_count) + vertical_padding)
-            label.setMaximumHeight((line_height * line_count) + vertical_padding + 4)
-        if tooltip:
-            label.setToolTip(tooltip)
-        return label
-
     def _forecast_theme_colors(self, row_index: int, is_header: bool = False) -> Dict[str, str]:
         if self.current_dark_mode_enabled:
             if is_header:
@@ -4259,35 +4533,6 @@ class WeatherAlertApp(QMainWindow):
             "text": "#1f2937",
         }
 
-    def _apply_forecast_cell_style(self, label: QLabel, row_index: int, is_header: bool = False) -> QLabel:
-        colors = self._forecast_theme_colors(row_index, is_header=is_header)
-        tooltip_bg = "#ffffff"
-        tooltip_text = "#102a43"
-        tooltip_border = "#a9bfd3"
-        if is_header:
-            line_height = label.fontMetrics().lineSpacing()
-            label.setMinimumHeight(max(label.minimumHeight(), line_height + 12))
-            label.setMaximumHeight(max(label.maximumHeight(), line_height + 16))
-            label.setStyleSheet(
-                f"padding: 3px 5px; background-color: {colors['bg']}; color: {colors['text']}; "
-                f"border: 1px solid {colors['border']}; font-weight: 700;"
-                f"QToolTip {{ background-color: {tooltip_bg}; color: {tooltip_text}; "
-                f"border: 1px solid {tooltip_border}; padding: 8px 10px; border-radius: 6px; }}"
-            )
-        else:
-            label.setStyleSheet(
-                f"padding: 2px 5px; background-color: {colors['bg']}; color: {colors['text']}; "
-                f"border-left: 1px solid {colors['border']}; border-bottom: 1px solid {colors['border']};"
-                f"QToolTip {{ background-color: {tooltip_bg}; color: {tooltip_text}; "
-                f"border: 1px solid {tooltip_border}; padding: 8px 10px; border-radius: 6px; }}"
-            )
-        return label
-
-    @staticmethod
-    def _apply_tooltip_to_labels(labels: List[QLabel], tooltip: str) -> None:
-        for label in labels:
-            label.setToolTip(tooltip)
-
     def _is_forecast_layout_stacked(self) -> bool:
         if not hasattr(self, "combined_forecast_widget"):
             return False
@@ -4429,75 +4674,61 @@ class WeatherAlertApp(QMainWindow):
 
     def _apply_alert_item_visuals(
         self,
-        item: QListWidgetItem,
+        item: QStandardItem,
         alert: Dict[str, Any],
         alert_category: str,
         escalated: bool,
         newly_notified: bool,
     ) -> None:
         severity = str(alert.get("severity", "Unknown")).title()
-        if self.current_dark_mode_enabled:
-            colors = {
-                "Extreme": ("#49151d", "#ffd7df"),
-                "Severe": ("#3f1f1f", "#fecaca"),
-                "Moderate": ("#3b2d12", "#fde68a"),
-                "Minor": ("#14253d", "#bfdbfe"),
-                "Unknown": ("#1b2530", "#d8e2ee"),
-            }
-            category_colors = {
-                "warning": ("#3f1f1f", "#fecaca"),
-                "watch": ("#3b2d12", "#fde68a"),
-                "advisory": ("#14253d", "#bfdbfe"),
-                "generic": ("#1b2530", "#d8e2ee"),
-            }
-        else:
-            colors = {
-                "Extreme": ("#fee2e2", "#7f1d1d"),
-                "Severe": ("#fff1f2", "#991b1b"),
-                "Moderate": ("#fffbeb", "#92400e"),
-                "Minor": ("#eff6ff", "#1d4ed8"),
-                "Unknown": ("#f8fafc", "#334155"),
-            }
-            category_colors = {
-                "warning": ("#fff1f2", "#991b1b"),
-                "watch": ("#fffbeb", "#92400e"),
-                "advisory": ("#eff6ff", "#1d4ed8"),
-                "generic": ("#f8fafc", "#334155"),
-            }
-
-        background, foreground = colors.get(severity, category_colors.get(alert_category, category_colors["generic"]))
+        dark = self.current_dark_mode_enabled
+        category_colors = ALERT_CATEGORY_COLORS[dark]
+        background, foreground = ALERT_SEVERITY_COLORS[dark].get(
+            severity, category_colors.get(alert_category, category_colors["generic"]))
         if newly_notified:
-            background = "#ffe4e6" if not self.current_dark_mode_enabled else "#4c1d2d"
+            background = ALERT_NEW_BACKGROUND[dark]
         if escalated:
-            background = "#fecdd3" if not self.current_dark_mode_enabled else "#5a1d24"
-            foreground = "#7f1d1d" if not self.current_dark_mode_enabled else "#ffe4e6"
-        item.setBackground(QColor(background))
-        item.setForeground(QColor(foreground))
+            background, foreground = ALERT_ESCALATED_COLORS[dark]
+        item.setBackground(background)
+        item.setForeground(foreground)
 
-    def _update_location_data(self, location_id):
+    def _update_location_data(self, location_id, timed_check: bool = False):
         if self._check_in_progress:
             self._pending_location_id = location_id
             self.log_to_gui("A check is already running; queued latest location refresh request.", level="DEBUG")
             return
 
         self._check_in_progress = True
+        self._check_generation += 1
         self.location_runtime_status[location_id] = {"state": "loading", "detail": "Refreshing from NWS"}
         self._update_dashboard_summary()
         self.update_status(f"Fetching data for {self.get_location_name_by_id(location_id)}...")
         self._clear_and_set_loading_states()
 
-        worker = Worker(self._fetch_all_data_for_location, location_id)
+        worker = Worker(
+            self._fetch_all_data_for_location, location_id, self._resolved_coords_by_location.get(location_id), timed_check
+        )
         worker.signals.result.connect(self._on_location_data_loaded)
         worker.signals.error.connect(
             lambda e, failed_location_id=location_id: self._on_data_load_error(e, failed_location_id)
         )
+        worker.signals.finished.connect(
+            lambda generation=self._check_generation: self._on_location_worker_finished(generation)
+        )
         self.thread_pool.start(worker)
 
+    def _on_location_worker_finished(self, generation: int):
+        # The result/error slots normally end the cycle; this releases the in-flight
+        # guard if one of them raised part-way, so timed checks cannot stall for good.
+        if self._check_in_progress and generation == self._check_generation:
+            self.log_to_gui("Location refresh ended without completing; releasing the check guard.", level="WARNING")
+            self._finish_check_cycle()
+
     def _schedule_next_timed_check(self, immediate: bool = False):
         is_active = self.announce_alerts_action.isChecked() or self.auto_refresh_action.isChecked()
         if not is_active:
             self.main_check_timer.stop()
-            self.countdown_timer.stop()
+            self._stop_countdown()
             self.top_countdown_label.setText("Next Check: --:-- (Paused)")
             return
 
@@ -4508,11 +4739,20 @@ class WeatherAlertApp(QMainWindow):
         self.main_check_timer.stop()
         if immediate:
             self._reset_and_start_countdown(self.current_check_interval_ms // 1000)
-            QTimer.singleShot(100, self.perform_check_cycle)
+            # Reusing the coarse single-shot check timer also lets stop() cancel this kick-off.
+            self.main_check_timer.start(100)
             return
 
-        self.main_check_timer.start(self.current_check_interval_ms)
-        self._reset_and_start_countdown(self.current_check_interval_ms // 1000)
+        interval_ms = self._next_check_interval_ms()
+        self.main_check_timer.start(interval_ms)
+        self._reset_and_start_countdown(interval_ms // 1000)
+
+    def _next_check_interval_ms(self) -> int:
+        if not self.current_adaptive_polling_checked or not self._unchanged_streak:
+            return self.current_check_interval_ms
+        streak = min(self._unchanged_streak, ADAPTIVE_POLL_MAX_STREAK)
+        factor = min(ADAPTIVE_POLL_BACKOFF_FACTOR ** streak, ADAPTIVE_POLL_MAX_FACTOR)
+        return int(self.current_check_interval_ms * factor)
 
     def _finish_check_cycle(self):
         self._check_in_progress = False
@@ -4529,51 +4769,48 @@ class WeatherAlertApp(QMainWindow):
                 return loc["name"]
         return "Unknown"
 
-    def _fetch_all_data_for_location(self, location_id: str) -> Dict[str, Any]:
-        coords = self.api_client.get_coordinates_for_location(location_id)
+    def _fetch_all_data_for_location(
+        self, location_id: str, coords: Optional[Tuple[float, float]] = None, timed_check: bool = False
+    ) -> Dict[str, Any]:
+        # Coordinates already resolved for this location id are passed in and reused.
+        if not coords:
+            coords = self.api_client.get_coordinates_for_location(location_id)
         if not coords:
             raise ValueError(f"Could not find coordinates for location '{location_id}'.")
 
         lat, lon = coords
-        alerts = self.api_client.get_alerts(lat, lon)
-        forecast_urls = self.api_client.get_forecast_urls(lat, lon)
+        # The CO-OPS marine lookup is independent of NWS, so it overlaps the NWS fan-out
+        # on the client's shared fetch workers.
+        marine_future = self.api_client.submit(self._fetch_nearest_marine_data, lat, lon)
+        fetched = self.api_client.fetch_all(
+            lat, lon, hourly_limit=HOURLY_FORECAST_PERIODS_USED, daily_limit=DAILY_FORECAST_PERIODS_USED
+        )
+        forecast_urls = fetched["forecast_urls"]
         if not forecast_urls:
             raise ModularApiError(f"Could not retrieve forecast URLs for {lat},{lon}. API might be down or rate-limited.")
 
-        hourly_forecast = None
-        daily_forecast = None
-        grid_forecast = None
-        current_conditions = None
-        marine_data = {}
-
-        if forecast_urls.get("hourly"):
-            hourly_forecast = self.api_client.get_forecast_data(forecast_urls["hourly"])
-            if not hourly_forecast:
-                raise ModularApiError(f"Failed to fetch hourly forecast data from {forecast_urls['hourly']}.")
-
-        if forecast_urls.get("daily"):
-            daily_forecast = self.api_client.get_forecast_data(forecast_urls["daily"])
-            if not daily_forecast:
-                raise ModularApiError(f"Failed to fetch daily forecast data from {forecast_urls['daily']}.")
+        if forecast_urls.get("hourly") and not fetched["hourly"]:
+            raise ModularApiError(f"Failed to fetch hourly forecast data from {forecast_urls['hourly']}.")
+        if forecast_urls.get("daily") and not fetched["daily"]:
+            raise ModularApiError(f"Failed to fetch daily forecast data from {forecast_urls['daily']}.")
 
-        if forecast_urls.get("grid"):
-            grid_forecast = self.api_client.get_forecast_data(forecast_urls["grid"])
-
-        if forecast_urls.get("observations"):
-            current_conditions = self.api_client.get_current_conditions(forecast_urls["observations"])
-
-        marine_data = self._fetch_nearest_marine_data(lat, lon)
+        marine_data = marine_future.result()
 
         return {
             "location_id": location_id,
             "coords": coords,
-            "alerts": alerts,
-            "hourly_forecast": hourly_forecast,
-            "daily_forecast": daily_forecast,
-            "grid_forecast": grid_forecast,
-            "current_conditions": current_conditions,
+            "alerts": fetched["alerts"],
+            "hourly_forecast": fetched["hourly"],
+            "daily_forecast": fetched["daily"],
+            "grid_forecast": fetched["grid"],
+            # Forecast grid texts are formatted here so the GUI slot only assigns them.
+            "hourly_rows": self._build_hourly_forecast_rows(fetched["hourly"], fetched["grid"]),
+            "daily_rows": self._build_daily_forecast_rows(fetched["daily"], fetched["grid"]),
+            "current_conditions": fetched["current_conditions"],
             "marine_data": marine_data,
             "fetched_at": time.time(),
+            # Passed through so only timed checks feed the adaptive polling streak.
+            "timed_check": timed_check,
         }
 
     @Slot(object)
@@ -4584,11 +4821,20 @@ class WeatherAlertApp(QMainWindow):
         coords = result["coords"]
         alerts = result["alerts"]
         if coords:
+            self._resolved_coords_by_location[location_id] = coords
             alerts = rank_alerts_by_proximity(alerts, coords[0], coords[1])
         result = dict(result)
         result["alerts"] = alerts
         previous = self.last_active_alerts_by_location.get(location_id, {})
         lifecycle = summarize_lifecycle(previous, alerts)
+        if result.get("timed_check"):
+            if location_id != self._unchanged_streak_location_id:
+                self._unchanged_streak_location_id = location_id
+                self._unchanged_streak = 0
+            if lifecycle["new"] or lifecycle["updated"] or lifecycle["expired"]:
+                self._unchanged_streak = 0
+            else:
+                self._unchanged_streak = min(self._unchanged_streak + 1, ADAPTIVE_POLL_MAX_STREAK)
         self.last_active_alerts_by_location[location_id] = lifecycle["active"]
         self.current_alerts_by_location[location_id] = alerts
         self.current_conditions_by_location[location_id] = result.get("current_conditions") or {}
@@ -4623,11 +4869,26 @@ class WeatherAlertApp(QMainWindow):
             return
 
         self.current_coords = coords
-        self._update_alerts_display_area(alerts, location_id, lifecycle)
+        # Repopulate the alert list and forecast grids with painting suspended so each repaints once.
+        repopulated_widgets = (
+            self.alerts_display_area,
+            self.lifecycle_display_area,
+            self.hourly_forecast_widget,
+            self.daily_forecast_widget,
+        )
+        for widget in repopulated_widgets:
+            widget.setUpdatesEnabled(False)
+        try:
+            self._update_alerts_display_area(alerts, location_id, lifecycle)
+            self._update_lifecycle_display(lifecycle)
+            self._update_hourly_forecast_display(
+                result["hourly_forecast"], result.get("grid_forecast"), result.get("hourly_rows"))
+            self._update_daily_forecast_display(
+                result["daily_forecast"], result.get("grid_forecast"), result.get("daily_rows"))
+        finally:
+            for widget in repopulated_widgets:
+                widget.setUpdatesEnabled(True)
         new_alert_titles = [alert.get("title", "N/A Title") for alert in lifecycle["new"] if alert.get("_notify_allowed")]
-        self._update_lifecycle_display(lifecycle)
-        self._update_hourly_forecast_display(result["hourly_forecast"], result.get("grid_forecast"))
-        self._update_daily_forecast_display(result["daily_forecast"], result.get("grid_forecast"))
         self._update_forecast_trends(result.get("hourly_forecast"), result.get("grid_forecast"))
         self._update_fishing_conditions(
             result.get("hourly_forecast"),
@@ -4648,6 +4909,7 @@ class WeatherAlertApp(QMainWindow):
     @Slot(Exception)
     def _on_data_load_error(self, e: Exception, location_id: Optional[str] = None):
         failed_location_id = location_id or self.current_location_id
+        self._unchanged_streak = 0
         self.log_to_gui(f"{self.get_location_name_by_id(failed_location_id)} refresh failed: {e}", level="ERROR")
 
         if failed_location_id != self.current_location_id:
@@ -4681,8 +4943,10 @@ class WeatherAlertApp(QMainWindow):
             }
             self._update_alerts_display_area(cached.get("alerts", []), failed_location_id, None)
             self._update_lifecycle_display(None)
-            self._update_hourly_forecast_display(cached.get("hourly_forecast"), cached.get("grid_forecast"))
-            self._update_daily_forecast_display(cached.get("daily_forecast"), cached.get("grid_forecast"))
+            self._update_hourly_forecast_display(
+                cached.get("hourly_forecast"), cached.get("grid_forecast"), cached.get("hourly_rows"))
+            self._update_daily_forecast_display(
+                cached.get("daily_forecast"), cached.get("grid_forecast"), cached.get("daily_rows"))
             self._update_forecast_trends(cached.get("hourly_forecast"), cached.get("grid_forecast"))
             self._update_fishing_conditions(
                 cached.get("hourly_forecast"),
@@ -4713,19 +4977,17 @@ class WeatherAlertApp(QMainWindow):
         self._finish_check_cycle()
 
     def _clear_and_set_loading_states(self):
-        self.alerts_display_area.clear()
+        self._clear_alert_items()
         self.alerts_meta_label.setText(f"{self.get_current_location_name()}: loading alerts and forecast data...")
-        self.alerts_display_area.addItem("Loading alerts...")
+        self._append_alert_item(QStandardItem("Loading alerts..."))
         self.lifecycle_display_area.clear()
         self.lifecycle_display_area.addItem("Loading lifecycle...")
         self.latest_temperature_reading = None
         self.current_conditions_by_location[self.current_location_id] = {}
         self.current_marine_data_by_location[self.current_location_id] = {}
         self._update_top_status_bar_display()
-        self._clear_layout(self.hourly_forecast_layout)
-        self.hourly_forecast_layout.addWidget(QLabel("Loading..."), 0, 0)
-        self._clear_layout(self.daily_forecast_layout)
-        self.daily_forecast_layout.addWidget(QLabel("Loading..."), 0, 0)
+        self._show_forecast_status(self.hourly_forecast_stack, "Loading...")
+        self._show_forecast_status(self.daily_forecast_stack, "Loading...")
         self._update_forecast_trends(None, None)
         self._update_fishing_conditions(None, None, None)
 
@@ -6058,14 +6320,14 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             )
 
     def _update_alerts_display_area(self, alerts: List[Any], location_id: str, lifecycle: Optional[Dict[str, Any]] = None):
-        self.alerts_display_area.clear()
+        self._clear_alert_items()
         if not alerts:
-            item = QListWidgetItem(f"No active alerts for {self.get_location_name_by_id(location_id)}.")
-            item.setData(Qt.ItemDataRole.UserRole + 1, "generic")
-            item.setData(Qt.ItemDataRole.UserRole + 3, True)
-            item.setData(Qt.ItemDataRole.UserRole + 4, "none")
+            item = QStandardItem(f"No active alerts for {self.get_location_name_by_id(location_id)}.")
+            item.setData("generic", Qt.ItemDataRole.UserRole + 1)
+            item.setData(True, Qt.ItemDataRole.UserRole + 3)
+            item.setData("none", Qt.ItemDataRole.UserRole + 4)
             item.setSizeHint(QSize(item.sizeHint().width(), 54))
-            self.alerts_display_area.addItem(item)
+            self._append_alert_item(item)
             self.alerts_meta_label.setText(f"{self.get_location_name_by_id(location_id)}: no active alerts right now.")
             self._apply_alert_filters()
             return
@@ -6078,8 +6340,8 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         should_play_sound = self._resolve_bool_override(rules.get("play_sounds"), should_play_sound_default)
         cooldown_s = int(rules.get("suppression_cooldown_seconds", 900))
 
-        high_priority_keywords = ["tornado", "severe thunderstorm", "flash flood warning"]
         rendered_alert_count = 0
+        new_alert_ids = self.alert_history_manager.new_alert_ids(alert.get("id", "unknown-id") for alert in alerts)
         for alert in alerts:
             now = datetime.now()
             distance_miles = alert.get("distance_miles")
@@ -6102,20 +6364,22 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             title = alert.get('title', 'N/A Title')
             summary = alert.get('summary', 'No summary available.')
             alert_text = self._alert_display_text(alert, distance_miles, escalation)
-            item = QListWidgetItem(alert_text)
+            item = QStandardItem(alert_text)
             alert_category = self._classify_alert_category(alert)
             alert_detail = dict(alert)
             alert_detail["location"] = self.get_location_name_by_id(location_id)
             alert_detail["distance_miles"] = distance_miles if isinstance(distance_miles, (int, float)) else alert.get("distance_miles", "")
-            item.setData(Qt.ItemDataRole.UserRole + 1, alert_category)
-            item.setData(Qt.ItemDataRole.UserRole + 2, alert_detail)
-            item.setData(Qt.ItemDataRole.UserRole + 3, False)
+            item.setData(alert_category, Qt.ItemDataRole.UserRole + 1)
+            item.setData(alert_detail, Qt.ItemDataRole.UserRole + 2)
+            item.setData(False, Qt.ItemDataRole.UserRole + 3)
+            item.setData(ALERT_CATEGORY_TAGS.get(alert_category, ALERT_TAG_GENERIC), Qt.ItemDataRole.UserRole + 5)
             item.setSizeHint(QSize(item.sizeHint().width(), self._alert_item_height_for_text(alert_text)))
             item.setToolTip(self._format_rich_tooltip(self._alert_tooltip_text(alert, distance_miles, escalation)))
             dedup_meta = self.alert_dedup.classify(alert)
 
-            is_new = self.alert_history_manager.add_alert(
-                alert.get("id", "unknown-id"),
+            alert_id = alert.get("id", "unknown-id")
+            is_new = alert_id in new_alert_ids and self.alert_history_manager.add_alert(
+                alert_id,
                 {
                     'id': alert.get("id", "unknown-id"),
                     'link': alert.get("link", ""),
@@ -6150,17 +6414,17 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 bool(escalation.get("escalate", False)),
                 bool(is_new and should_send),
             )
-            self.alerts_display_area.addItem(item)
+            self._append_alert_item(item)
             rendered_alert_count += 1
 
             if is_new and should_send:
+                alert_title_folded = title.casefold()
                 if should_play_sound:
-                    self._play_alert_sound(title.lower(), rules, escalation.get("escalate", False))
+                    self._play_alert_sound(alert_title_folded, rules, escalation.get("escalate", False))
                 if should_notify_desktop:
                     self._show_desktop_notification(f"{self.get_location_name_by_id(location_id)}: {title}", summary)
 
-                alert_title_lower = title.lower()
-                if any(keyword in alert_title_lower for keyword in high_priority_keywords):
+                if HIGH_PRIORITY_ALERT_RE.search(title):
                     self.log_to_gui("High-priority alert detected. Triggering extra notifications.", level="INFO")
                     QApplication.alert(self)
                 if escalation.get("escalate"):
@@ -6180,16 +6444,24 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                     }
 
         if rendered_alert_count == 0:
-            item = QListWidgetItem(
+            item = QStandardItem(
                 "Active NWS alerts are present, but none match this location's severity, type, or quiet-hour rules."
             )
-            item.setData(Qt.ItemDataRole.UserRole + 1, "generic")
-            item.setData(Qt.ItemDataRole.UserRole + 3, True)
-            item.setData(Qt.ItemDataRole.UserRole + 4, "suppressed")
+            item.setData("generic", Qt.ItemDataRole.UserRole + 1)
+            item.setData(True, Qt.ItemDataRole.UserRole + 3)
+            item.setData("suppressed", Qt.ItemDataRole.UserRole + 4)
             item.setSizeHint(QSize(item.sizeHint().width(), 64))
-            self.alerts_display_area.addItem(item)
+            self._append_alert_item(item)
         self._apply_alert_filters()
 
+    def _append_alert_item(self, item: QStandardItem) -> None:
+        self.alerts_model.appendRow(item)
+        self._alert_items.append(item)
+
+    def _clear_alert_items(self) -> None:
+        self.alerts_model.clear()
+        self._alert_items.clear()
+
     def _play_alert_sound(self, alert_text: str, rules: Optional[Dict[str, Any]] = None, escalated: bool = False):
         """Plays appropriate system sound for alert type."""
         if self.mute_action.isChecked() or not self.enable_sounds_action.isChecked():
@@ -6227,33 +6499,41 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         if QSystemTrayIcon.isSystemTrayAvailable() and hasattr(self, "tray_icon"):
             self.tray_icon.showMessage(title, message, self.windowIcon(), 10000)
 
-    def _update_hourly_forecast_display(self, forecast_json: Optional[Dict[str, Any]], grid_json: Optional[Dict[str, Any]]):
-        self._clear_layout(self.hourly_forecast_layout)
-        if not forecast_json or 'properties' not in forecast_json or 'periods' not in forecast_json['properties']:
+    def _update_hourly_forecast_display(
+        self,
+        forecast_json: Optional[Dict[str, Any]],
+        grid_json: Optional[Dict[str, Any]],
+        prepared: Optional[Dict[str, Any]] = None,
+    ):
+        if prepared is None:
+            prepared = self._build_hourly_forecast_rows(forecast_json, grid_json)
+        if prepared is None:
             self.latest_temperature_reading = None
-            self.hourly_forecast_layout.addWidget(QLabel("8-Hour forecast data unavailable."), 0, 0)
+            self._show_forecast_status(self.hourly_forecast_stack, "8-Hour forecast data unavailable.")
             self._update_top_status_bar_display()
             return
 
+        self.latest_temperature_reading = prepared["latest_temperature"]
+        self._update_top_status_bar_display()
+        self._render_forecast_rows(self.hourly_forecast_stack, prepared)
+
+    def _build_hourly_forecast_rows(
+        self, forecast_json: Optional[Dict[str, Any]], grid_json: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Formats the next eight hourly periods into grid texts; safe to run on a worker thread."""
+        if not forecast_json or 'properties' not in forecast_json or 'periods' not in forecast_json['properties']:
+            return None
+
         periods = forecast_json['properties']['periods'][:8]
+        latest_temperature = None
         if periods:
             first_temp = periods[0].get('temperature', 'N/A')
             first_unit = periods[0].get('temperatureUnit', '')
-            self.latest_temperature_reading = f"{first_temp}°{first_unit}" if first_unit else str(first_temp)
-        else:
-            self.latest_temperature_reading = None
-        self._update_top_status_bar_display()
-        headers = ["Time", "Temp", "Feels Like", "Wind", "Gusts", "Precip", "Humidity", "Sky", "Forecast"]
-        for col, header in enumerate(headers):
-            header_label = self._make_compact_label(f"<b>{header}</b>")
-            if col < 8:
-                header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            if col == 0:
-                header_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-            self._apply_forecast_cell_style(header_label, 0, is_header=True)
-            self.hourly_forecast_layout.addWidget(header_label, 0, col)
-
-        for i, p in enumerate(periods):
+            latest_temperature = f"{first_temp}°{first_unit}" if first_unit else str(first_temp)
+
+        rows: List[Optional[Tuple[List[str], str]]] = []
+        errors: List[str] = []
+        for p in periods:
             try:
                 formatted_time, start_dt, end_dt = self._format_period_time(p)
                 temp = f"{p.get('temperature', 'N/A')}°{p.get('temperatureUnit', '')}"
@@ -6346,73 +6626,43 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                         *detail_lines,
                     ]
                 )
-                rich_row_tooltip = self._format_rich_tooltip(row_tooltip)
-                forecast_label = self._make_compact_label(
-                    f"{emoji} {short_fc}",
-                    rich_row_tooltip,
-                    wrap=True,
-                    max_lines=1,
-                )
-                forecast_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-
-                time_label = self._make_compact_label(formatted_time)
-                time_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-                temp_label = self._make_compact_label(temp)
-                feels_like_label = self._make_compact_label(feels_like)
-                wind_label = self._make_compact_label(wind)
-                gust_label = self._make_compact_label(gust_text)
-                gust_label.setMinimumWidth(gust_label.fontMetrics().horizontalAdvance("99 mph") + 8)
-                precip_label = self._make_compact_label(precip)
-                humidity_label = self._make_compact_label(humidity)
-                sky_label = self._make_compact_label(sky_text)
-                row_labels = [
-                    time_label,
-                    temp_label,
-                    feels_like_label,
-                    wind_label,
-                    gust_label,
-                    precip_label,
-                    humidity_label,
-                    sky_label,
-                    forecast_label,
-                ]
-                self._apply_tooltip_to_labels(row_labels, rich_row_tooltip)
-                for compact_label in [time_label, temp_label, feels_like_label, wind_label, gust_label, precip_label, humidity_label, sky_label]:
-                    compact_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self._apply_forecast_cell_style(compact_label, i + 1)
-                self._apply_forecast_cell_style(forecast_label, i + 1)
-                self.hourly_forecast_layout.addWidget(time_label, i + 1, 0, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(temp_label, i + 1, 1, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(feels_like_label, i + 1, 2, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(wind_label, i + 1, 3, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(gust_label, i + 1, 4, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(precip_label, i + 1, 5, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(humidity_label, i + 1, 6, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(sky_label, i + 1, 7, alignment=Qt.AlignmentFlag.AlignTop)
-                self.hourly_forecast_layout.addWidget(forecast_label, i + 1, 8)
+                rows.append((
+                    [formatted_time, temp, feels_like, wind, gust_text, precip, humidity, sky_text, f"{emoji} {short_fc}"],
+                    self._format_rich_tooltip(row_tooltip),
+                ))
             except Exception as e:
-                self.log_to_gui(f"Error formatting hourly period: {e}", level="WARNING")
+                rows.append(None)
+                errors.append(f"Error formatting hourly period: {e}")
+        return {"rows": rows, "errors": errors, "latest_temperature": latest_temperature}
 
-    def _update_daily_forecast_display(self, forecast_json: Optional[Dict[str, Any]], grid_json: Optional[Dict[str, Any]]):
-        self._clear_layout(self.daily_forecast_layout)
-        if not forecast_json or 'properties' not in forecast_json or 'periods' not in forecast_json['properties']:
-            self.daily_forecast_layout.addWidget(QLabel("5-Day forecast data unavailable."), 0, 0)
+    def _update_daily_forecast_display(
+        self,
+        forecast_json: Optional[Dict[str, Any]],
+        grid_json: Optional[Dict[str, Any]],
+        prepared: Optional[Dict[str, Any]] = None,
+    ):
+        if prepared is None:
+            prepared = self._build_daily_forecast_rows(forecast_json, grid_json)
+        if prepared is None:
+            self._show_forecast_status(self.daily_forecast_stack, "5-Day forecast data unavailable.")
             return
 
+        self._render_forecast_rows(self.daily_forecast_stack, prepared)
+
+    def _build_daily_forecast_rows(
+        self, forecast_json: Optional[Dict[str, Any]], grid_json: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Formats up to five daytime periods into grid texts; safe to run on a worker thread."""
+        if not forecast_json or 'properties' not in forecast_json or 'periods' not in forecast_json['properties']:
+            return None
+
         periods = self._daily_daytime_periods(forecast_json['properties']['periods'], limit=5)
         if not periods:
-            self.daily_forecast_layout.addWidget(QLabel("5-Day forecast data unavailable."), 0, 0)
-            return
-
-        headers = ["Day", "High / Low", "Wind", "Precip", "Forecast"]
-        for col, header in enumerate(headers):
-            header_label = self._make_compact_label(f"<b>{header}</b>")
-            if col in (1, 2, 3):
-                header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._apply_forecast_cell_style(header_label, 0, is_header=True)
-            self.daily_forecast_layout.addWidget(header_label, 0, col)
+            return None
 
-        for i, p in enumerate(periods):
+        rows: List[Optional[Tuple[List[str], str]]] = []
+        errors: List[str] = []
+        for p in periods:
             try:
                 name = p.get('name', 'N/A')
                 high_temp = f"{p.get('temperature', 'N/A')}°{p.get('temperatureUnit', '')}"
@@ -6463,42 +6713,98 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 )
                 if detail_bits:
                     row_tooltip = f"{row_tooltip}\n\n" + "\n".join(detail_bits)
-                rich_row_tooltip = self._format_rich_tooltip(row_tooltip)
-
-                name_label = self._make_compact_label(name, rich_row_tooltip)
-                temp_label = self._make_compact_label(temp, rich_row_tooltip)
-                wind_label = self._make_compact_label(wind, rich_row_tooltip)
-                precip_label = self._make_compact_label(precip_text, rich_row_tooltip)
-                temp_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                wind_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                precip_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self._apply_forecast_cell_style(name_label, i + 1)
-                self._apply_forecast_cell_style(temp_label, i + 1)
-                self._apply_forecast_cell_style(wind_label, i + 1)
-                self._apply_forecast_cell_style(precip_label, i + 1)
-                self.daily_forecast_layout.addWidget(name_label, i + 1, 0)
-                self.daily_forecast_layout.addWidget(temp_label, i + 1, 1, alignment=Qt.AlignmentFlag.AlignTop)
-                self.daily_forecast_layout.addWidget(wind_label, i + 1, 2, alignment=Qt.AlignmentFlag.AlignTop)
-                self.daily_forecast_layout.addWidget(precip_label, i + 1, 3, alignment=Qt.AlignmentFlag.AlignTop)
-
-                short_fc_label = self._make_compact_label(
-                    f"{emoji} {short_fc}",
-                    rich_row_tooltip,
-                    wrap=True,
-                    max_lines=1,
-                )
-                short_fc_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-                self._apply_forecast_cell_style(short_fc_label, i + 1)
-                self.daily_forecast_layout.addWidget(short_fc_label, i + 1, 4)
+                rows.append((
+                    [name, temp, wind, precip_text, f"{emoji} {short_fc}"],
+                    self._format_rich_tooltip(row_tooltip),
+                ))
             except Exception as e:
-                self.log_to_gui(f"Error formatting daily period: {e}", level="WARNING")
+                rows.append(None)
+                errors.append(f"Error formatting daily period: {e}")
+        return {"rows": rows, "errors": errors}
 
-    def _clear_layout(self, layout: QLayout):
-        if layout is None: return
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+    def _create_forecast_table(
+        self,
+        object_name: str,
+        headers: List[str],
+        data_rows: int,
+        centered_columns,
+    ) -> QTableWidget:
+        """Builds a read-only forecast table with one reusable item per cell.
+
+        The last column holds the forecast text and stretches; refreshes only change
+        item text, tooltips and colours.
+        """
+        table = QTableWidget(data_rows, len(headers))
+        table.setObjectName(object_name)
+        table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        table.setShowGrid(False)
+        table.setWordWrap(False)
+        table.setTextElideMode(Qt.TextElideMode.ElideRight)
+        table.verticalHeader().hide()
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        header = table.horizontalHeader()
+        header.setHighlightSections(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        wrap_column = len(headers) - 1
+        header.setSectionResizeMode(wrap_column, QHeaderView.ResizeMode.Stretch)
+        for row in range(data_rows):
+            for col in range(len(headers)):
+                item = QTableWidgetItem()
+                if col in centered_columns or col == wrap_column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                else:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row, col, item)
+        return table
+
+    @staticmethod
+    def _create_forecast_stack(table: QTableWidget) -> QStackedWidget:
+        """Pairs a forecast table with the status label shown while it has no data."""
+        table.verticalHeader().setDefaultSectionSize(table.fontMetrics().lineSpacing() + 8)
+        stack = QStackedWidget()
+        status_label = QLabel("")
+        status_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        stack.addWidget(status_label)
+        stack.addWidget(table)
+        return stack
+
+    @staticmethod
+    def _show_forecast_status(stack: QStackedWidget, text: str) -> None:
+        stack.widget(0).setText(text)
+        stack.setCurrentIndex(0)
+
+    def _render_forecast_rows(self, stack: QStackedWidget, prepared: Dict[str, Any]) -> None:
+        table = stack.widget(1)
+        header_colors = self._forecast_theme_colors(0, is_header=True)
+        header_sheet = (
+            f"QHeaderView::section {{ background-color: {header_colors['bg']}; color: {header_colors['text']}; "
+            f"border: none; border-bottom: 1px solid {header_colors['border']}; padding: 3px 5px; font-weight: 700; }}"
+        )
+        if table.styleSheet() != header_sheet:
+            table.setStyleSheet(header_sheet)
+
+        rows = prepared["rows"]
+        for row in range(table.rowCount()):
+            entry = rows[row] if row < len(rows) else None
+            table.setRowHidden(row, entry is None)
+            if entry is None:
+                continue
+            texts, tooltip = entry
+            colors = self._forecast_theme_colors(row + 1)
+            background, foreground = QColor(colors["bg"]), QColor(colors["text"])
+            for col, text in enumerate(texts):
+                item = table.item(row, col)
+                item.setText(text)
+                item.setToolTip(tooltip)
+                item.setBackground(background)
+                item.setForeground(foreground)
+        stack.setCurrentIndex(1)
+        for message in prepared["errors"]:
+            self.log_to_gui(message, level="WARNING")
 
     @staticmethod
     def _c_to_f(value_c: Optional[float]) -> Optional[int]:
@@ -6645,10 +6951,13 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         except ValueError:
             return "N/A", None, None
 
-        label = start_dt.strftime("%I %p").lstrip("0")
+        hour = start_dt.hour
+        label = f"{hour % 12 or 12} {'AM' if hour < 12 else 'PM'}"
         return label, start_dt, end_dt
 
     def _open_preferences_dialog(self, initial_tab: str = "General"):
+        show_hourly_forecast = self.show_hourly_forecast_action.isChecked()
+        show_daily_forecast = self.show_daily_forecast_action.isChecked()
         current_prefs = {
             "repeater_info": self.current_repeater_info,
             "locations": self.locations,
@@ -6680,9 +6989,9 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             "dark_mode_enabled": self.dark_mode_action.isChecked(),
             "show_log": self.show_log_action.isChecked(),
             "show_alerts_area": self.show_alerts_area_action.isChecked(),
-            "show_forecasts_area": self.show_hourly_forecast_action.isChecked() or self.show_daily_forecast_action.isChecked(),
-            "show_hourly_forecast": self.show_hourly_forecast_action.isChecked(),
-            "show_daily_forecast": self.show_daily_forecast_action.isChecked(),
+            "show_forecasts_area": show_hourly_forecast or show_daily_forecast,
+            "show_hourly_forecast": show_hourly_forecast,
+            "show_daily_forecast": show_daily_forecast,
             "toolbar_show_location": self.current_toolbar_show_location,
             "toolbar_show_interval": self.current_toolbar_show_interval,
             "toolbar_show_sources": self.current_toolbar_show_sources,
@@ -6741,6 +7050,11 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self._update_top_status_bar_display()
 
             if locations_changed:
+                # Drop resolved coordinates for location ids that are no longer configured.
+                location_ids = {loc["id"] for loc in self.locations}
+                for location_id in list(self._resolved_coords_by_location):
+                    if location_id not in location_ids:
+                        del self._resolved_coords_by_location[location_id]
                 self.log_to_gui(f"Locations updated.", level="INFO")
                 self._on_location_selected(self.location_combo.currentIndex())
 
@@ -6749,35 +7063,28 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                     self.current_interval_key, FALLBACK_INITIAL_CHECK_INTERVAL_MS)
                 self.log_to_gui(f"Interval changed to: {self.current_interval_key}", level="INFO")
 
-            if self.announce_alerts_action.isChecked() != new_data["announce_alerts"]:
-                self.announce_alerts_action.setChecked(new_data["announce_alerts"])
-
-            if self.auto_refresh_action.isChecked() != new_data["auto_refresh_content"]:
-                self.auto_refresh_action.setChecked(new_data["auto_refresh_content"])
-
-            if self.mute_action.isChecked() != new_data["mute_audio"]:
-                self.mute_action.setChecked(new_data["mute_audio"])
-
-            if self.enable_sounds_action.isChecked() != new_data["enable_sounds"]:
-                self.enable_sounds_action.setChecked(new_data["enable_sounds"])
-                
-            if self.desktop_notification_action.isChecked() != new_data["enable_desktop_notifications"]:
-                self.desktop_notification_action.setChecked(new_data["enable_desktop_notifications"])
-
-            if self.dark_mode_action.isChecked() != new_data["dark_mode_enabled"]:
-                self.dark_mode_action.setChecked(new_data["dark_mode_enabled"])
-
-            if self.show_log_action.isChecked() != new_data["show_log"]:
-                self.show_log_action.setChecked(new_data["show_log"])
-
-            if self.show_alerts_area_action.isChecked() != new_data["show_alerts_area"]:
-                self.show_alerts_area_action.setChecked(new_data["show_alerts_area"])
-
-            if self.show_hourly_forecast_action.isChecked() != new_data["show_hourly_forecast"]:
-                self.show_hourly_forecast_action.setChecked(new_data["show_hourly_forecast"])
-
-            if self.show_daily_forecast_action.isChecked() != new_data["show_daily_forecast"]:
-                self.show_daily_forecast_action.setChecked(new_data["show_daily_forecast"])
+            # Apply every checkable action with its toggled slot blocked, then run the
+            # side effects once instead of once per action.
+            action_values = (
+                (self.announce_alerts_action, new_data["announce_alerts"]),
+                (self.auto_refresh_action, new_data["auto_refresh_content"]),
+                (self.mute_action, new_data["mute_audio"]),
+                (self.enable_sounds_action, new_data["enable_sounds"]),
+                (self.desktop_notification_action, new_data["enable_desktop_notifications"]),
+                (self.dark_mode_action, new_data["dark_mode_enabled"]),
+                (self.show_log_action, new_data["show_log"]),
+                (self.show_alerts_area_action, new_data["show_alerts_area"]),
+                (self.show_hourly_forecast_action, new_data["show_hourly_forecast"]),
+                (self.show_daily_forecast_action, new_data["show_daily_forecast"]),
+            )
+            changed = {action for action, value in action_values if action.isChecked() != value}
+            blockers = [QSignalBlocker(action) for action in changed]
+            for action, value in action_values:
+                if action in changed:
+                    action.setChecked(value)
+            for blocker in blockers:
+                blocker.unblock()
+            self._apply_display_state(new_data, changed)
 
             if self.current_log_sort_order != new_data["log_sort_order"]:
                 self.current_log_sort_order = new_data["log_sort_order"]
@@ -6787,23 +7094,95 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self._save_settings()
             self.log_to_gui("Preferences updated.", level="INFO")
 
+    def _apply_display_state(self, new_data: Dict[str, Any], changed: set):
+        """Runs the side effects of preference toggles applied with signals blocked."""
+        self.current_announce_alerts_checked = new_data["announce_alerts"]
+        self.current_auto_refresh_content_checked = new_data["auto_refresh_content"]
+        self.current_enable_sounds = new_data["enable_sounds"]
+        self.current_enable_desktop_notifications = new_data["enable_desktop_notifications"]
+        self.current_show_log_checked = new_data["show_log"]
+        self.current_show_alerts_area_checked = new_data["show_alerts_area"]
+        self.current_show_hourly_forecast_checked = new_data["show_hourly_forecast"]
+        self.current_show_daily_forecast_checked = new_data["show_daily_forecast"]
+        self.current_show_forecasts_area_checked = (
+            new_data["show_hourly_forecast"] or new_data["show_daily_forecast"])
+
+        if self.mute_action in changed:
+            self._on_mute_toggled(new_data["mute_audio"])
+        if self.dark_mode_action in changed:
+            self.current_dark_mode_enabled = new_data["dark_mode_enabled"]
+            self._apply_color_scheme()
+        if self.show_log_action in changed and new_data["show_log"]:
+            self._flush_log_buffer()
+            self._apply_log_sort()
+        if changed & {self.show_log_action, self.show_alerts_area_action,
+                      self.show_hourly_forecast_action, self.show_daily_forecast_action}:
+            self._update_panel_visibility()
+
     @Slot()
     def _refresh_current_location(self):
         if not self.current_location_id:
             self.log_to_gui("No active location selected. Manual refresh skipped.", level="WARNING")
             return
         self.main_check_timer.stop()
-        self.countdown_timer.stop()
+        self._stop_countdown()
         self.top_countdown_label.setText("Refreshing now")
-        if self.auto_refresh_action.isChecked() and QWebEngineView and self.web_view:
-            self.web_view.reload()
+        if self.auto_refresh_action.isChecked():
+            self._reload_radar_view(force=True)
         self._update_location_data(self.current_location_id)
 
+    def _reload_radar_view(self, force: bool = False) -> None:
+        """Reloads the radar tab, deferring timed reloads until the tab is on screen."""
+        if QWebEngineView is None or not isinstance(self.web_view, QWebEngineView):
+            return
+        radar_visible = (
+            self.isVisible() and not self.isMinimized() and self.web_tabs.currentWidget() is self.web_view
+        )
+        if not force:
+            if not radar_visible:
+                self._radar_reload_pending = True
+                return
+            if time.monotonic() - self._last_radar_reload < RADAR_AUTO_RELOAD_MIN_INTERVAL_S:
+                return
+        self._radar_reload_pending = False
+        self._last_radar_reload = time.monotonic()
+        self.web_view.reload()
+
+    @Slot(int)
+    def _on_web_tab_changed(self, _index: int) -> None:
+        if QWebEngineView and self.web_tabs.currentWidget() is self.web_view:
+            self._ensure_web_view()
+        if self._radar_reload_pending:
+            self._reload_radar_view()
+
+    def _ensure_web_view(self) -> None:
+        """Swaps the radar tab's placeholder for a real web view and loads any pending source."""
+        if QWebEngineView is None or isinstance(self.web_view, QWebEngineView):
+            return
+        placeholder = self.web_view
+        index = self.web_tabs.indexOf(placeholder)
+        was_current = self.web_tabs.currentIndex() == index
+        self.web_view = QWebEngineView()
+        self.web_view.loadFinished.connect(lambda _ok=False: self._update_web_navigation_buttons())
+        blocker = QSignalBlocker(self.web_tabs)
+        self.web_tabs.removeTab(index)
+        self.web_tabs.insertTab(index, self.web_view, "Radar")
+        if was_current:
+            self.web_tabs.setCurrentIndex(index)
+        blocker.unblock()
+        placeholder.deleteLater()
+        # The new view has nothing loaded, so there is nothing left to reload.
+        self._radar_reload_pending = False
+        pending_url, self._pending_web_view_url = self._pending_web_view_url, None
+        if pending_url:
+            self._load_web_view_url(pending_url)
+        self._update_web_navigation_buttons()
+
     @Slot()
     def perform_check_cycle(self):
         if not (self.announce_alerts_action.isChecked() or self.auto_refresh_action.isChecked()):
             self.main_check_timer.stop()
-            self.countdown_timer.stop()
+            self._stop_countdown()
             self.top_countdown_label.setText("Next Check: --:-- (Paused)")
             return
 
@@ -6812,30 +7191,54 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             return
 
         self.main_check_timer.stop()
-        self.countdown_timer.stop()
+        self._stop_countdown()
         self.top_countdown_label.setText("Next Check: checking now...")
 
-        if self.auto_refresh_action.isChecked() and QWebEngineView and self.web_view:
-            self.web_view.reload()
+        if self.auto_refresh_action.isChecked():
+            self._reload_radar_view()
 
         # Only check the currently selected location, not all of them.
         if self.current_location_id:
-            self._update_location_data(self.current_location_id)
+            self._update_location_data(self.current_location_id, timed_check=True)
         else:
             self.log_to_gui("No active location selected. Timed check skipped.", level="WARNING")
             self._schedule_next_timed_check(immediate=False)
 
     def log_to_gui(self, message: str, level: str = "INFO"):
-        formatted_message = f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [{level.upper()}] {message}"
-        if hasattr(self, 'log_area'):
-            self.log_area.append(formatted_message)
-        else:
-            self._log_buffer.append(formatted_message)
+        now = int(time.time())
+        if now != self._log_timestamp[0]:
+            self._log_timestamp = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+        formatted_message = f"[{self._log_timestamp[1]}] [{level.upper()}] {message}"
+        self._log_lines.append(formatted_message)
+        self._log_line_total += 1
+        self._log_buffer.append(formatted_message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
         getattr(logging, level.lower(), logging.info)(message)
 
     def update_status(self, message: str):
         self.status_bar.showMessage(message, 5000)
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._sync_clock_timer()
+        self._sync_countdown_timer()
+        if self._radar_reload_pending:
+            self._reload_radar_view()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._sync_clock_timer()
+        self._sync_countdown_timer()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_clock_timer()
+            self._sync_countdown_timer()
+            if self._radar_reload_pending:
+                self._reload_radar_view()
+
     def closeEvent(self, event):
         self.log_to_gui("Shutting down...", level="INFO")
         self.main_check_timer.stop()
@@ -6843,39 +7246,45 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         self.clock_timer.stop()
         self.scheduled_announcement_timer.stop()
         self.thread_pool.waitForDone()
+        self._stop_tts_thread()
         self.alert_history_manager.save_history()
-        self._save_settings()
+        self.api_client.flush_geocache()
+        self.api_client.close()
+        if not self._save_settings_now():
+            logging.error("Error saving settings on shutdown.")
         event.accept()
 
     # --- TTS Engine ---
-    class _DummyEngine:
-        def say(self, text, name=None): logging.info(f"TTS (Dummy): {text}")
+    def _init_tts_thread(self):
+        self._tts_queue: List[Tuple[str, int]] = []
+        self._tts_thread = QThread(self)
+        self._tts_worker = TtsWorker()
+        self._tts_worker.moveToThread(self._tts_thread)
+        self._tts_thread.finished.connect(self._tts_worker.deleteLater)
+        self._tts_worker.failed.connect(self._on_tts_failed)
+        self.tts_speak_requested.connect(self._tts_worker.speak)
+        # Also covers quitting without closeEvent; stopping twice is harmless.
+        QApplication.instance().aboutToQuit.connect(self._stop_tts_thread)
+        self._tts_thread.start()
 
-        def runAndWait(self): pass
-
-        def stop(self): pass
+    @Slot(str)
+    def _on_tts_failed(self, message: str):
+        self.log_to_gui(message, level="ERROR")
 
-        def isBusy(self): return False
-
-    def _initialize_tts_engine(self):
-        try:
-            engine = pyttsx3.init()
-            voices = engine.getProperty('voices')
-            if not voices:
-                raise RuntimeError("No TTS voices found on the system.")
-            return engine
-        except Exception as e:
-            self.log_to_gui(f"TTS engine initialization failed: {e}. Voice announcements will be disabled.",
-                            level="ERROR")
-            return self._DummyEngine()
+    def _stop_tts_thread(self):
+        # Lets any utterance in progress finish before the engine's thread goes away.
+        self._tts_thread.quit()
+        self._tts_thread.wait()
 
     def _speak_message_internal(self, text: str, escalated: bool = False):
+        if self._enqueue_speech(text, escalated):
+            self._flush_speech()
+
+    def _enqueue_speech(self, text: str, escalated: bool = False) -> bool:
+        """Queues text for the TTS thread without speaking it; returns True if _flush_speech is needed."""
         if self.mute_action.isChecked():
             self.log_to_gui(f"Audio muted. Would have spoken: {text}", level="DEBUG")
-            return
-        if self.is_tts_dummy:
-            self.tts_engine.say(text)
-            return
+            return False
         try:
             rules = self._get_location_config(self.current_location_id).get("rules", {})
             profile_cfg = rules.get("audio_profiles", {})
@@ -6900,13 +7309,17 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             voice_rate = int(active_profile.get("voice_rate", 200))
             if escalated:
                 voice_rate = int(profile_cfg.get("escalated", {}).get("voice_rate", max(voice_rate, 215)))
-            if hasattr(self.tts_engine, "setProperty"):
-                self.tts_engine.setProperty("rate", voice_rate)
-            if self.tts_engine.isBusy(): self.tts_engine.stop()
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            self._tts_queue.append((text, voice_rate))
+            return True
         except Exception as e:
             self.log_to_gui(f"TTS error: {e}", level="ERROR")
+            return False
+
+    def _flush_speech(self):
+        """Hands everything queued by _enqueue_speech to the TTS thread as one batch."""
+        batch, self._tts_queue = self._tts_queue, []
+        if batch:
+            self.tts_speak_requested.emit(batch)
 
     def _set_last_announcement_label(self):
         if hasattr(self, "last_announcement_label"):
@@ -6963,6 +7376,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         ):
             phrases.append(self.current_repeater_info)
             self._last_repeater_announcement_minute_key = minute_key
+            self._last_spoken_repeater = self.current_repeater_info
 
         time_marks = self._selected_time_marks(announce_time=True)
         if current_minute in time_marks and self._last_time_announcement_minute_key != minute_key:
@@ -6977,27 +7391,35 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 self.log_to_gui("Scheduled temperature announcement skipped (temperature data unavailable).", level="DEBUG")
             self._last_temp_announcement_minute_key = minute_key
 
+        # Scheduled phrases and due escalation reminders share a single engine run.
+        needs_flush = False
         if phrases:
-            self._speak_message_internal(" ".join(phrases))
+            needs_flush = self._enqueue_speech(" ".join(phrases))
             self._set_last_announcement_label()
-        self._process_escalation_repeats()
+        needs_flush |= self._queue_escalation_repeats()
+        if needs_flush:
+            self._flush_speech()
 
-    def _process_escalation_repeats(self):
+    def _queue_escalation_repeats(self) -> bool:
+        """Queues reminders for escalated alerts that are due; returns True if _flush_speech is needed."""
         if not self.escalation_repeat_state:
-            return
+            return False
         now_ts = time.time()
         due_ids = [aid for aid, data in self.escalation_repeat_state.items() if now_ts >= data.get("next_ts", now_ts + 1)]
+        needs_flush = False
         for alert_id in due_ids:
             data = self.escalation_repeat_state.get(alert_id, {})
             title = data.get("title", "Severe alert")
             location_name = data.get("location_name", "current location")
-            self._speak_message_internal(
+            needs_flush |= self._enqueue_speech(
                 f"Escalated weather alert remains active for {location_name}: {title}.",
                 escalated=True,
             )
-            self._set_last_announcement_label()
             repeat_minutes = max(1, int(data.get("repeat_minutes", 5)))
             self.escalation_repeat_state[alert_id]["next_ts"] = now_ts + repeat_minutes * 60
+        if due_ids:
+            self._set_last_announcement_label()
+        return needs_flush
 
     def _handle_timed_announcements(self, new_alert_titles: List[str], location_id: str):
         """Handles the logic for all timed audio announcements."""
@@ -7013,16 +7435,45 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self._speak_message_internal(full_message)
             self._set_last_announcement_label()
         elif self.current_repeater_info and self.current_announce_repeater_at_interval:
+            minute_key = datetime.now().strftime("%Y%m%d%H%M")
+            # A scheduled repeater mark may already have read the same text this minute.
+            if (
+                self.current_repeater_info == self._last_spoken_repeater
+                and self._last_repeater_announcement_minute_key == minute_key
+            ):
+                return
             self._speak_message_internal(self.current_repeater_info)
+            self._last_spoken_repeater = self.current_repeater_info
+            self._last_repeater_announcement_minute_key = minute_key
             self._set_last_announcement_label()
 
     # --- UI Update and State Management Methods ---
     def _update_current_time_display(self):
         if hasattr(self, 'current_time_label'):
             time_text = f"Time {time.strftime('%I:%M:%S %p')}"
+            if time_text == self._clock_text:
+                return
+            self._clock_text = time_text
             self.current_time_label.setText(time_text)
             self.current_time_label.setToolTip(time_text)
 
+    @staticmethod
+    def _ms_until_next_second() -> int:
+        return CLOCK_UPDATE_INTERVAL_MS - int(time.time() * 1000) % CLOCK_UPDATE_INTERVAL_MS
+
+    @Slot()
+    def _tick_clock(self) -> None:
+        self._update_current_time_display()
+        self.clock_timer.start(self._ms_until_next_second())
+
+    def _sync_clock_timer(self) -> None:
+        """Runs the toolbar clock only while the window and the clock chip are visible."""
+        if self.isVisible() and not self.isMinimized() and self.current_toolbar_show_time:
+            if not self.clock_timer.isActive():
+                self._tick_clock()
+        else:
+            self.clock_timer.stop()
+
     def _update_top_status_bar_display(self):
         if hasattr(self, 'top_repeater_label'):
             repeater_text = self._compact_text(self.current_repeater_info or "N/A", 36)
@@ -7064,6 +7515,8 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self.last_announcement_label.setVisible(self.current_toolbar_show_last_announcement)
         if hasattr(self, "current_time_label"):
             self.current_time_label.setVisible(self.current_toolbar_show_time)
+        self._sync_clock_timer()
+        self._sync_countdown_timer()
 
     def _refresh_location_overview(self) -> None:
         if not hasattr(self, "location_overview_list"):
@@ -7080,7 +7533,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             item = QListWidgetItem(text)
             item.setData(Qt.ItemDataRole.UserRole, loc_id)
             if loc_id == self.current_location_id:
-                item.setBackground(QColor("#dbeafe"))
+                item.setBackground(CURRENT_LOCATION_BACKGROUND)
             self.location_overview_list.addItem(item)
         self.location_overview_list.blockSignals(False)
 
@@ -7274,6 +7727,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
     def _apply_loaded_settings_to_ui(self):
         self.announce_alerts_action.setChecked(self.current_announce_alerts_checked)
         self.auto_refresh_action.setChecked(self.current_auto_refresh_content_checked)
+        self.adaptive_polling_action.setChecked(self.current_adaptive_polling_checked)
         self.mute_action.setChecked(self.current_mute_audio_checked)
         self.enable_sounds_action.setChecked(self.current_enable_sounds)
         self.desktop_notification_action.setChecked(self.current_enable_desktop_notifications)
@@ -7345,29 +7799,54 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         else:
             self.log_to_gui("Timed checks paused.", level="INFO")
             self.main_check_timer.stop()
-            self.countdown_timer.stop()
+            self._stop_countdown()
             self.top_countdown_label.setText("Next --:-- (Paused)")
 
     def _reset_and_start_countdown(self, total_seconds: int):
         self.countdown_timer.stop()
-        self.remaining_time_seconds = total_seconds
-        if total_seconds > 0 and (self.announce_alerts_action.isChecked() or self.auto_refresh_action.isChecked()):
-            self.countdown_timer.start(1000)
+        self._next_check_deadline = time.monotonic() + total_seconds
         self._update_countdown_display()
+        self._sync_countdown_timer()
+
+    def _stop_countdown(self):
+        self.countdown_timer.stop()
+        self._next_check_deadline = None
+
+    def _countdown_remaining_seconds(self) -> int:
+        if self._next_check_deadline is None:
+            return 0
+        return max(math.ceil(self._next_check_deadline - time.monotonic()), 0)
+
+    def _sync_countdown_timer(self) -> None:
+        """Ticks the countdown chip only while it is visible and a timed check is pending."""
+        is_active = self.announce_alerts_action.isChecked() or self.auto_refresh_action.isChecked()
+        should_tick = (
+            is_active
+            and self._countdown_remaining_seconds() > 0
+            and self.isVisible()
+            and not self.isMinimized()
+            and self.current_toolbar_show_countdown
+        )
+        if should_tick:
+            if not self.countdown_timer.isActive():
+                self._update_countdown_display()
+                self.countdown_timer.start(CLOCK_UPDATE_INTERVAL_MS)
+        else:
+            self.countdown_timer.stop()
 
     def _update_countdown_display(self):
         is_active = self.announce_alerts_action.isChecked() or self.auto_refresh_action.isChecked()
         if not is_active:
             self.top_countdown_label.setText("Paused")
             self.top_countdown_label.setToolTip("Timed checks are paused")
-        else:
-            remaining = max(self.remaining_time_seconds, 0)
+        elif self._next_check_deadline is not None:
+            remaining = self._countdown_remaining_seconds()
             minutes, seconds = divmod(remaining, 60)
             countdown_text = f"Next {minutes:02d}:{seconds:02d}"
             self.top_countdown_label.setText(countdown_text)
             self.top_countdown_label.setToolTip(f"Next timed check in {minutes:02d}:{seconds:02d}")
-            if self.remaining_time_seconds > 0:
-                self.remaining_time_seconds -= 1
+            if not remaining:
+                self.countdown_timer.stop()
 
     def _update_panel_visibility(self):
         """Centralized function to control visibility of main UI panels."""
@@ -7415,18 +7894,21 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         self._update_main_timer_state()
         self._save_settings()
 
+    def _on_adaptive_polling_toggled(self, checked):
+        self.current_adaptive_polling_checked = checked
+        self._unchanged_streak = 0
+        self._save_settings()
+
     def _on_mute_toggled(self, checked):
         self.current_mute_audio_checked = checked
         self.mute_action.setChecked(checked)
         self.mute_button.setChecked(checked)
 
-        style = self.style()
-        if checked:
-            self.mute_action.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaVolumeMuted))
-            self.mute_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaVolumeMuted))
-        else:
-            self.mute_action.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaVolume))
-            self.mute_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaVolume))
+        icon = self._standard_icon(
+            QStyle.StandardPixmap.SP_MediaVolumeMuted if checked else QStyle.StandardPixmap.SP_MediaVolume
+        )
+        self.mute_action.setIcon(icon)
+        self.mute_button.setIcon(icon)
 
         self._save_settings()
 
@@ -7445,6 +7927,9 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
 
     def _on_show_log_toggled(self, checked):
         self.current_show_log_checked = checked
+        if checked:
+            self._flush_log_buffer()
+            self._apply_log_sort()
         self._update_panel_visibility()
         self._save_settings()
 
@@ -7635,6 +8120,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             return
         if location_id != self.current_location_id:
             self.current_location_id = location_id
+            self._unchanged_streak = 0
             self.log_to_gui(f"Selected location: {self.get_current_location_name()}", level="INFO")
             self._update_location_data(self.current_location_id)
             self._save_settings()
@@ -7651,28 +8137,56 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
 
     # --- Web Source Management ---
     def _update_web_sources_menu(self):
-        self.web_sources_menu.clear()
-        self.web_source_action_group = QActionGroup(self)
-        self.web_source_action_group.setExclusive(True)
-        style = self.style()
+        """Syncs the source entries with RADAR_OPTIONS, creating or removing only the actions that changed."""
+        if not hasattr(self, "_web_source_actions"):
+            self._build_web_sources_menu()
+        menu = self.web_sources_menu
+        actions = self._web_source_actions
+
+        for name in [name for name in actions if name not in self.RADAR_OPTIONS]:
+            action = actions.pop(name)
+            menu.removeAction(action)
+            self.web_source_action_group.removeAction(action)
+            action.deleteLater()
 
         for name, url in self.RADAR_OPTIONS.items():
-            action = QAction(name, self, checkable=True)
-            action.setData(url)
-            action.triggered.connect(self._on_radar_source_selected)
-            if url == self.current_radar_url:
-                action.setChecked(True)
-            self.web_sources_menu.addAction(action)
-            self.web_source_action_group.addAction(action)
+            action = actions.get(name)
+            if action is None:
+                action = QAction(name, self, checkable=True)
+                action.triggered.connect(self._on_radar_source_selected)
+                self.web_source_action_group.addAction(action)
+                menu.insertAction(self._web_sources_separator, action)
+                actions[name] = action
+            if action.data() != url:
+                action.setData(url)
+
+        ordered = [actions[name] for name in self.RADAR_OPTIONS]
+        if [action for action in menu.actions() if action in actions.values()] != ordered:
+            for action in ordered:
+                menu.removeAction(action)
+                menu.insertAction(self._web_sources_separator, action)
+
+        selected = actions.get(self._get_display_name_for_url(self.current_radar_url))
+        checked = self.web_source_action_group.checkedAction()
+        if selected is not None:
+            selected.setChecked(True)
+        elif checked is not None:
+            checked.setChecked(False)
+
+    def _build_web_sources_menu(self):
+        """Creates the action group and the fixed entries that follow the source list."""
+        self._web_source_actions: Dict[str, QAction] = {}
+        self.web_source_action_group = QActionGroup(self)
+        self.web_source_action_group.setExclusive(True)
 
-        self.web_sources_menu.addSeparator()
+        self._web_sources_separator = self.web_sources_menu.addSeparator()
 
-        open_in_browser_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_DesktopIcon),
+        open_in_browser_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_DesktopIcon),
                                          "Open Current in Browser", self)
         open_in_browser_action.triggered.connect(self._open_current_in_browser)
         self.web_sources_menu.addAction(open_in_browser_action)
 
-        save_current_action = QAction(style.standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton),
+        save_current_action = QAction(self._standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton),
                                       ADD_CURRENT_SOURCE_TEXT, self)
         save_current_action.triggered.connect(self._save_current_web_source)
         self.web_sources_menu.addAction(save_current_action)
@@ -7689,18 +8203,29 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         action = action_to_use or self.sender()
         if action:
             url_str = action.data()
+            if url_str == self.current_radar_url and action.text() == self._last_valid_radar_text:
+                return
             self.current_radar_url = url_str
             self._last_valid_radar_text = action.text()
+            # The exclusive action group unchecks the previous source; the source list itself is unchanged.
+            action.setChecked(True)
             self._load_web_view_url(url_str)
             self._save_settings()
-            self._update_web_sources_menu()
 
     def _load_web_view_url(self, url_str: str):
+        if QWebEngineView and not isinstance(self.web_view, QWebEngineView):
+            self._pending_web_view_url = url_str
+            if self.web_tabs.currentWidget() is self.web_view:
+                self._ensure_web_view()
+            return
         if QWebEngineView and self.web_view:
             effective_url = self._safe_external_url(self._location_aware_web_url(url_str))
             if effective_url == "#":
                 self.log_to_gui("Blocked invalid web source URL.", level="WARNING")
                 return
+            if effective_url == self._last_loaded_web_url:
+                self.log_to_gui(f"Skipped reloading unchanged web view: {effective_url}", level="DEBUG")
+                return
             if effective_url.lower().endswith('.pdf'):
                 escaped_url = self._html_attr(effective_url)
                 self.web_view.setHtml(
@@ -7710,9 +8235,6 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 QDesktopServices.openUrl(QUrl(effective_url))
                 self._last_loaded_web_url = effective_url
             else:
-                if effective_url == self._last_loaded_web_url:
-                    self.log_to_gui(f"Skipped reloading unchanged web view: {effective_url}", level="DEBUG")
-                    return
                 self.web_view.setUrl(QUrl(effective_url))
                 self._last_loaded_web_url = effective_url
             self.log_to_gui(f"Loaded web view: {effective_url}", level="INFO")
@@ -7749,6 +8271,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 QMessageBox.warning(self, "Duplicate Name", f"A source with the name '{name}' already exists.")
                 return
             self.RADAR_OPTIONS[name] = url
+            self._radar_url_to_name.setdefault(url, name)
             self.current_radar_url = url
             self._last_valid_radar_text = name
             self._save_settings()
@@ -7769,6 +8292,7 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 QMessageBox.warning(self, "Duplicate Name", f"A source with the name '{name}' already exists.")
                 return
             self.RADAR_OPTIONS[name] = url
+            self._radar_url_to_name.setdefault(url, name)
             self.current_radar_url = url
             self._last_valid_radar_text = name
             self._load_web_view_url(url)
@@ -7777,23 +8301,35 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self.log_to_gui(f"Added new web source: {name} ({url})", level="INFO")
 
     def _manage_web_sources(self):
-        dialog = ManageSourcesDialog(self.RADAR_OPTIONS, self)
+        if self._manage_sources_dialog is None:
+            self._manage_sources_dialog = ManageSourcesDialog(self.RADAR_OPTIONS, self)
+        else:
+            self._manage_sources_dialog.set_sources(self.RADAR_OPTIONS)
+        dialog = self._manage_sources_dialog
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_sources = dialog.get_sources()
-            self.RADAR_OPTIONS = new_sources
-            if self.current_radar_url not in self.RADAR_OPTIONS.values():
-                self.current_radar_url = list(self.RADAR_OPTIONS.values())[0] if self.RADAR_OPTIONS else ""
-                self._last_valid_radar_text = list(self.RADAR_OPTIONS.keys())[0] if self.RADAR_OPTIONS else ""
+            # Dict equality is order-insensitive, so compare order too.
+            if list(new_sources.items()) == list(self.RADAR_OPTIONS.items()):
+                return
+            self._set_radar_options(new_sources)
+            if self.current_radar_url not in self._radar_url_to_name:
+                first_name = next(iter(self.RADAR_OPTIONS), "")
+                self.current_radar_url = self.RADAR_OPTIONS.get(first_name, "")
+                self._last_valid_radar_text = first_name
                 self._load_web_view_url(self.current_radar_url)
             self._save_settings()
             self._update_web_sources_menu()
             self.log_to_gui("Web sources updated.", level="INFO")
 
+    def _set_radar_options(self, options: Dict[str, str]) -> None:
+        self.RADAR_OPTIONS = options
+        # Reverse index; the first name wins when several sources share a URL.
+        self._radar_url_to_name: Dict[str, str] = {}
+        for name, url in options.items():
+            self._radar_url_to_name.setdefault(url, name)
+
     def _get_display_name_for_url(self, url: str) -> Optional[str]:
-        for name, u in self.RADAR_OPTIONS.items():
-            if u == url:
-                return name
-        return None
+        return self._radar_url_to_name.get(url)
 
     def _apply_forecast_font_sizes(self) -> None:
         hourly_size = 8
@@ -7818,10 +8354,10 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         self.alerts_display_area.setMaximumHeight(alerts_panel_height)
         self.lifecycle_display_area.setMinimumHeight(lifecycle_height)
         self.lifecycle_display_area.setMaximumHeight(lifecycle_height)
-        self.hourly_forecast_scroll.setMinimumHeight(forecast_panel_height)
-        self.hourly_forecast_scroll.setMaximumHeight(forecast_panel_height)
-        self.daily_forecast_scroll.setMinimumHeight(forecast_panel_height)
-        self.daily_forecast_scroll.setMaximumHeight(forecast_panel_height)
+        self.hourly_forecast_stack.setMinimumHeight(forecast_panel_height)
+        self.hourly_forecast_stack.setMaximumHeight(forecast_panel_height)
+        self.daily_forecast_stack.setMinimumHeight(forecast_panel_height)
+        self.daily_forecast_stack.setMaximumHeight(forecast_panel_height)
         self.alerts_display_area.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.hourly_forecast_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.daily_forecast_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -7841,19 +8377,26 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             self.alerts_group.setMaximumHeight(16777215)
 
     def _apply_color_scheme(self):
-        stylesheet = DARK_STYLESHEET if self.current_dark_mode_enabled else LIGHT_STYLESHEET
-        self.setStyleSheet(stylesheet)
-        tooltip_palette = QPalette()
-        tooltip_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor("#ffffff"))
-        tooltip_palette.setColor(QPalette.ColorRole.ToolTipText, QColor("#102a43"))
-        tooltip_palette.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
-        tooltip_palette.setColor(QPalette.ColorRole.Text, QColor("#102a43"))
-        QToolTip.setPalette(tooltip_palette)
+        stylesheet = STYLESHEETS[bool(self.current_dark_mode_enabled)]
+        # Re-setting an identical stylesheet still re-polishes every child widget.
+        if stylesheet is not self._applied_stylesheet:
+            self.setStyleSheet(stylesheet)
+            if self._applied_stylesheet is None:
+                # Tooltips use the same light palette in both themes; set it once.
+                tooltip_palette = QPalette()
+                tooltip_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor("#ffffff"))
+                tooltip_palette.setColor(QPalette.ColorRole.ToolTipText, QColor("#102a43"))
+                tooltip_palette.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
+                tooltip_palette.setColor(QPalette.ColorRole.Text, QColor("#102a43"))
+                QToolTip.setPalette(tooltip_palette)
+            self._applied_stylesheet = stylesheet
         self._apply_forecast_font_sizes()
         cached = self.last_known_data_by_location.get(self.current_location_id)
         if cached:
-            self._update_hourly_forecast_display(cached.get("hourly_forecast"), cached.get("grid_forecast"))
-            self._update_daily_forecast_display(cached.get("daily_forecast"), cached.get("grid_forecast"))
+            self._update_hourly_forecast_display(
+                cached.get("hourly_forecast"), cached.get("grid_forecast"), cached.get("hourly_rows"))
+            self._update_daily_forecast_display(
+                cached.get("daily_forecast"), cached.get("grid_forecast"), cached.get("daily_rows"))
             self._update_forecast_trends(cached.get("hourly_forecast"), cached.get("grid_forecast"))
             self._update_fishing_conditions(
                 cached.get("hourly_forecast"),
@@ -7863,20 +8406,53 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         self.log_to_gui(f"Applied {'dark' if self.current_dark_mode_enabled else 'light'} theme.", level="INFO")
 
     def _apply_log_sort(self):
-        current_text = self.log_area.toPlainText()
-        if not current_text:
+        order = self.current_log_sort_order
+        if not self._log_lines:
+            return
+        # Lines are recorded in timestamp order, so ascending is the buffer as-is and
+        # descending is its reverse; neither needs a sort. Appends keep an ascending
+        # view ordered, while a descending view is stale once new lines arrive.
+        if order == self._log_display_order and (
+                order != "descending" or self._log_display_count == self._log_line_total):
+            return
+        if order in ("chronological", "ascending"):
+            lines = self._log_lines
+        elif order == "descending":
+            lines = reversed(self._log_lines)
+        else:
             return
 
-        lines = current_text.split('\n')
-        if self.current_log_sort_order == "chronological":
-            pass
-        elif self.current_log_sort_order == "ascending":
-            lines.sort()
-        elif self.current_log_sort_order == "descending":
-            lines.sort(reverse=True)
+        # Swap the whole document in one go instead of clear() + append();
+        # it already includes any lines still waiting for the flush timer.
+        self._log_buffer.clear()
+        self.log_area.setUpdatesEnabled(False)
+        self.log_area.blockSignals(True)
+        try:
+            self.log_area.setPlainText('\n'.join(lines))
+        finally:
+            self.log_area.blockSignals(False)
+            self.log_area.setUpdatesEnabled(True)
+        self._log_display_order = order
+        self._log_display_count = self._log_line_total
 
+    @Slot()
+    def _flush_log_buffer(self):
+        if not self._log_buffer or self.log_area is None:
+            return
+        if not self.current_show_log_checked:
+            # Hidden panel: drop the batch and rebuild from _log_lines when shown.
+            self._log_buffer.clear()
+            self._log_display_order = None
+            return
+        self.log_area.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+    def _clear_log(self):
+        self._log_lines.clear()
+        self._log_buffer.clear()
+        self._log_display_order = "chronological"
+        self._log_display_count = self._log_line_total
         self.log_area.clear()
-        self.log_area.append('\n'.join(lines))
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
@@ -7890,24 +8466,33 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         self.current_log_sort_order = "ascending"
         self._apply_log_sort()
         self._save_settings()
-        self.log_to_gui("Log sorted in ascending order.", level="INFO")
+        self.log_to_gui("Log sorted oldest first.", level="INFO")
 
     @Slot()
     def _sort_log_descending(self):
         self.current_log_sort_order = "descending"
         self._apply_log_sort()
         self._save_settings()
-        self.log_to_gui("Log sorted in descending order.", level="INFO")
+        self.log_to_gui("Log sorted newest first.", level="INFO")
+
+    def _open_settings_file_dialog(self, caption: str, accept_mode: QFileDialog.AcceptMode, on_selected: Callable) -> None:
+        dialog = QFileDialog(self, caption, "", "JSON Files (*.json);;All Files (*)")
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QFileDialog.AcceptMode.AcceptOpen:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
 
     def _backup_settings(self):
-        file_name, _ = QFileDialog.getSaveFileName(
-            self, "Backup Settings", "", "JSON Files (*.json);;All Files (*)"
-        )
+        self._open_settings_file_dialog("Backup Settings", QFileDialog.AcceptMode.AcceptSave, self._do_backup_settings)
+
+    @Slot(str)
+    def _do_backup_settings(self, file_name: str):
         if file_name:
             try:
-                settings_file = os.path.join(self._get_user_data_path(), SETTINGS_FILE_NAME)
-                if os.path.exists(settings_file):
-                    shutil.copy(settings_file, file_name)
+                if os.path.exists(self.settings_manager.file_path):
+                    self.settings_manager.backup_to(file_name)
                     self.log_to_gui(f"Settings backed up to {file_name}", level="INFO")
                     QMessageBox.information(self, "Backup Successful", f"Settings backed up to:\n{file_name}")
                 else:
@@ -7918,32 +8503,54 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
                 QMessageBox.critical(self, "Backup Error", f"Failed to backup settings:\n{e}")
 
     def _restore_settings(self):
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Restore Settings", "", "JSON Files (*.json);;All Files (*)"
-        )
-        if file_name:
-            try:
-                # First, validate the file is a proper JSON
-                with open(file_name, 'r') as f:
-                    settings_to_restore = json.load(f)
-
-                # If valid, proceed with writing it
-                settings_file = os.path.join(self._get_user_data_path(), SETTINGS_FILE_NAME)
-                self.settings_manager.save(settings_to_restore)
-
-                self.log_to_gui(f"Settings restored from {file_name}", level="INFO")
-                QMessageBox.information(self, "Restore Successful", 
-                                        "Settings have been restored. The application will now apply the new settings.")
-                
-                # Reload and reapply everything
-                self._load_settings()
-                self._apply_loaded_settings_to_ui()
-                if self.current_location_id:
-                    self._update_location_data(self.current_location_id)
-
-            except (IOError, OSError, json.JSONDecodeError) as e:
-                self.log_to_gui(f"Error restoring settings: {e}", level="ERROR")
-                QMessageBox.critical(self, "Restore Error", f"Failed to restore settings from the selected file.\n\nError: {e}")
+        self._open_settings_file_dialog("Restore Settings", QFileDialog.AcceptMode.AcceptOpen, self._do_restore_settings)
+
+    @Slot(str)
+    def _do_restore_settings(self, file_name: str):
+        if not file_name:
+            return
+        # Drop any queued save of the old state before the file is replaced.
+        self.settings_save_timer.stop()
+        self._pending_settings = None
+        self._last_saved_settings = None
+        self._settings_restore_in_progress = True
+        if self._settings_write_in_progress:
+            # Restoring now could be overwritten by the save still running; start once it finishes.
+            self._pending_restore_file = file_name
+            return
+        self._start_settings_restore(file_name)
+
+    def _start_settings_restore(self, file_name: str):
+        worker = Worker(self._restore_settings_file, file_name)
+        worker.signals.result.connect(self._on_settings_restored)
+        worker.signals.error.connect(self._on_settings_restore_failed)
+        self.thread_pool.start(worker)
+
+    def _restore_settings_file(self, file_name: str) -> str:
+        """Runs on a worker thread: validates and copies the backup into place."""
+        self.settings_manager.restore_from(file_name)
+        return file_name
+
+    @Slot(object)
+    def _on_settings_restored(self, file_name: str):
+        self.log_to_gui(f"Settings restored from {file_name}", level="INFO")
+        QMessageBox.information(self, "Restore Successful",
+                                "Settings have been restored. The application will now apply the new settings.")
+
+        # Reload and reapply everything
+        try:
+            self._load_settings()
+            self._apply_loaded_settings_to_ui()
+        finally:
+            self._settings_restore_in_progress = False
+        if self.current_location_id:
+            self._update_location_data(self.current_location_id)
+
+    @Slot(Exception)
+    def _on_settings_restore_failed(self, e: Exception):
+        self._settings_restore_in_progress = False
+        self.log_to_gui(f"Error restoring settings: {e}", level="ERROR")
+        QMessageBox.critical(self, "Restore Error", f"Failed to restore settings from the selected file.\n\nError: {e}")
 
     def _classify_alert_category(self, alert: Dict[str, Any]) -> str:
         text_parts = [
@@ -7952,14 +8559,10 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
             str(alert.get("headline", "")),
             str(alert.get("summary", "")),
         ]
-        combined_text = " ".join(text_parts).lower()
-        if "warning" in combined_text:
-            return "warning"
-        if "watch" in combined_text:
-            return "watch"
-        if "advisory" in combined_text:
-            return "advisory"
-        return "generic"
+        found = {match.lower() for match in ALERT_CATEGORY_RE.findall(" ".join(text_parts))}
+        if not found:
+            return "generic"
+        return next(keyword for keyword in ALERT_CATEGORY_KEYWORDS if keyword in found)
 
     def _alert_item_height_for_text(self, text: str) -> int:
         available_width = max(self.alerts_display_area.viewport().width() - 18, 220)
@@ -7973,8 +8576,8 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         )
         return max(56, rect.height() + 14)
 
-    def _show_current_alert_details(self, item: QListWidgetItem) -> None:
-        alert_data = item.data(Qt.ItemDataRole.UserRole + 2)
+    def _show_current_alert_details(self, index: QModelIndex) -> None:
+        alert_data = index.data(Qt.ItemDataRole.UserRole + 2)
         if not isinstance(alert_data, dict):
             return
         dialog = AlertDetailsDialog(alert_data, self)
@@ -8008,48 +8611,43 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
         )
 
     def _apply_alert_filters(self) -> None:
-        show_all = self.all_alerts_button.isChecked()
-        show_warnings = self.warning_button.isChecked()
-        show_watches = self.watch_button.isChecked()
-        show_advisories = self.advisory_button.isChecked()
-        visible_count = 0
-        total_alert_count = 0
-        placeholder_reason = ""
+        if self.all_alerts_button.isChecked():
+            mask = ALERT_TAG_ALL
+        else:
+            mask = ALERT_TAG_GENERIC
+            if self.warning_button.isChecked():
+                mask |= ALERT_TAG_WARNING
+            if self.watch_button.isChecked():
+                mask |= ALERT_TAG_WATCH
+            if self.advisory_button.isChecked():
+                mask |= ALERT_TAG_ADVISORY
+        # Newly appended rows are filtered on insertion; only a mask change re-filters.
+        # Suspend painting so the proxy's row removals/inserts repaint once.
+        self.alerts_display_area.setUpdatesEnabled(False)
+        try:
+            self.alerts_proxy.set_mask(mask)
+        finally:
+            self.alerts_display_area.setUpdatesEnabled(True)
 
-        for i in range(self.alerts_display_area.count()):
-            item = self.alerts_display_area.item(i)
-            is_placeholder = bool(item.data(Qt.ItemDataRole.UserRole + 3))
-            if is_placeholder:
+        placeholder_count = 0
+        placeholder_reason = ""
+        for item in self._alert_items:
+            if item.data(Qt.ItemDataRole.UserRole + 3):
+                placeholder_count += 1
                 placeholder_reason = str(item.data(Qt.ItemDataRole.UserRole + 4) or placeholder_reason)
-                item.setHidden(False)
-                continue
-
-            total_alert_count += 1
-            category = item.data(Qt.ItemDataRole.UserRole + 1) or "generic"
-            if show_all or category == "generic":
-                item.setHidden(False)
-                visible_count += 1
-                continue
-
-            show = (
-                (category == "warning" and show_warnings) or
-                (category == "watch" and show_watches) or
-                (category == "advisory" and show_advisories)
-            )
-            item.setHidden(not show)
-            if show:
-                visible_count += 1
         self._update_alerts_meta_label(
-            visible_count,
-            total_alert_count,
+            self.alerts_proxy.rowCount() - placeholder_count,
+            len(self._alert_items) - placeholder_count,
             self.get_current_location_name(),
             placeholder_reason,
         )
-        self.alerts_display_area.viewport().update()
 
     def _filter_alerts(self):
         sender = self.sender()
-        
+        filter_buttons = (self.all_alerts_button, self.warning_button, self.watch_button, self.advisory_button)
+        # Programmatic check-state changes below must not re-enter this slot.
+        blockers = [QSignalBlocker(button) for button in filter_buttons]
+
         # Exclusive "All" button
         if sender == self.all_alerts_button and self.all_alerts_button.isChecked():
             self.warning_button.setChecked(False)
@@ -8065,6 +8663,8 @@ body { font-family: Segoe UI, Arial, sans-serif; background:#f8fafc; color:#3341
            not self.advisory_button.isChecked():
             self.all_alerts_button.setChecked(True)
 
+        for blocker in blockers:
+            blocker.unblock()
         self._apply_alert_filters()
 
 
@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+gui = pytest.importorskip("PyWeatherAlertGui")
+
+
+def _interval_for_streak(streak, interval_ms=60_000):
+    window = SimpleNamespace(
+        current_adaptive_polling_checked=True,
+        current_check_interval_ms=interval_ms,
+        _unchanged_streak=streak,
+    )
+    return gui.WeatherAlertApp._next_check_interval_ms(window)
+
+
+def test_adaptive_polling_backs_off_up_to_the_cap():
+    assert _interval_for_streak(0) == 60_000
+    assert _interval_for_streak(1) == int(60_000 * gui.ADAPTIVE_POLL_BACKOFF_FACTOR)
+    assert _interval_for_streak(gui.ADAPTIVE_POLL_MAX_STREAK) == int(60_000 * gui.ADAPTIVE_POLL_MAX_FACTOR)
+
+
+def test_adaptive_polling_large_streak_stays_at_the_cap():
+    assert _interval_for_streak(1751) == int(60_000 * gui.ADAPTIVE_POLL_MAX_FACTOR)
+    assert _interval_for_streak(10**6) == int(60_000 * gui.ADAPTIVE_POLL_MAX_FACTOR)
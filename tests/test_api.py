@@ -1,3 +1,8 @@
+import json
+
+import pytest
+
+from weather_alert import api as api_module
 from weather_alert.api import NwsApiClient
 
 
@@ -17,6 +22,49 @@ def test_parse_lat_lon_input_support():
     assert round(coords[0], 3) == 38.627
 
 
+def test_pgeocode_loads_lazily_and_is_shared(monkeypatch):
+    pgeocode = pytest.importorskip("pgeocode")
+    created = []
+
+    class FakeNominatim:
+        def __init__(self, country):
+            created.append(country)
+
+    monkeypatch.setattr(pgeocode, "Nominatim", FakeNominatim)
+    api_module._clear_nominatim_cache()
+    try:
+        first = NwsApiClient("test-agent")
+        second = NwsApiClient("test-agent")
+        assert created == []
+        assert first.pgeocode_client is second.pgeocode_client
+        assert created == ["us"]
+    finally:
+        api_module._clear_nominatim_cache()
+
+
+def test_pgeocode_load_failure_is_retried_and_reported(monkeypatch):
+    pgeocode = pytest.importorskip("pgeocode")
+    attempts = []
+
+    def flaky_nominatim(country):
+        attempts.append(country)
+        if len(attempts) == 1:
+            raise OSError("download failed")
+        return object()
+
+    monkeypatch.setattr(pgeocode, "Nominatim", flaky_nominatim)
+    api_module._clear_nominatim_cache()
+    try:
+        client = NwsApiClient("test-agent")
+        assert client.pgeocode_client is None
+        assert client.geocoder_available is False
+        assert client.pgeocode_client is not None
+        assert client.geocoder_available is True
+        assert len(attempts) == 2
+    finally:
+        api_module._clear_nominatim_cache()
+
+
 def test_validate_location_uses_resolution(monkeypatch):
     client = NwsApiClient("test-agent")
 
@@ -53,6 +101,27 @@ def test_get_forecast_urls_includes_grid_data(monkeypatch):
     }
 
 
+def test_forecast_urls_persist_to_geocache(monkeypatch, tmp_path):
+    geocache_path = str(tmp_path / "geocache.json")
+    client = NwsApiClient("test-agent", geocache_path=geocache_path)
+    calls = []
+
+    def fake_get_json(url, **_kwargs):
+        calls.append(url)
+        return {"properties": {"forecast": "https://api.weather.gov/gridpoints/XXX/1,1/forecast"}}
+
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    assert client.get_forecast_urls(38.62701, -90.19941)["daily"].endswith("/forecast")
+    assert client.get_forecast_urls(38.62699, -90.19939)["daily"].endswith("/forecast")
+    assert len(calls) == 1
+    client.flush_geocache()
+
+    reloaded = NwsApiClient("test-agent", geocache_path=geocache_path)
+    monkeypatch.setattr(reloaded, "_get_json", fake_get_json)
+    assert reloaded.get_forecast_urls(38.6270, -90.1994)["daily"].endswith("/forecast")
+    assert len(calls) == 1
+
+
 def test_city_state_abbreviation_resolves(monkeypatch):
     client = NwsApiClient("test-agent")
 
@@ -112,6 +181,26 @@ def test_zone_polygon_resolves_to_first_coordinate(monkeypatch):
     assert coords == (38.510, -90.310)
 
 
+def test_resolved_coordinates_persist_to_geocache(monkeypatch, tmp_path):
+    geocache_path = str(tmp_path / "geocache.json")
+    client = NwsApiClient("test-agent", geocache_path=geocache_path)
+
+    def fake_get_json(url, **_kwargs):
+        return {"geometry": {"type": "Point", "coordinates": [-90.310, 38.510]}}
+
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    assert client.get_coordinates_for_location("ILC163") == (38.510, -90.310)
+    client.flush_geocache()
+
+    reloaded = NwsApiClient("test-agent", geocache_path=geocache_path)
+
+    def fail_get_json(url, **_kwargs):
+        raise AssertionError(f"unexpected request to {url}")
+
+    monkeypatch.setattr(reloaded, "_get_json", fail_get_json)
+    assert reloaded.get_coordinates_for_location("ILC163") == (38.510, -90.310)
+
+
 def test_alert_query_is_encoded_and_normalized(monkeypatch):
     client = NwsApiClient("test-agent")
     called = {}
@@ -179,3 +268,98 @@ def test_current_conditions_normalizes_latest_observation(monkeypatch):
     assert conditions["wind_direction"] == "S"
     assert round(conditions["visibility_miles"], 1) == 10.0
     assert round(conditions["pressure_inhg"], 2) == 29.97
+
+
+def test_fetch_all_combines_forecasts_and_alerts(monkeypatch):
+    client = NwsApiClient("test-agent")
+    grid = "https://api.weather.gov/gridpoints/XXX/1,1"
+
+    def fake_get_json(url, **_kwargs):
+        if "/points/" in url:
+            return {"properties": {"forecastHourly": f"{grid}/forecast/hourly", "forecast": f"{grid}/forecast"}}
+        if "/alerts/active" in url:
+            return {"features": [{"properties": {"id": "a1", "event": "Flood Watch"}}]}
+        return {"url": url}
+
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    result = client.fetch_all(38.51, -90.31)
+
+    assert result["hourly"] == {"url": f"{grid}/forecast/hourly"}
+    assert result["daily"] == {"url": f"{grid}/forecast"}
+    assert result["grid"] is None
+    assert result["current_conditions"] is None
+    assert result["alerts"][0]["event"] == "Flood Watch"
+    assert result["forecast_urls"]["daily"] == f"{grid}/forecast"
+
+
+def test_forecast_limit_trims_periods_and_keeps_full_cache(monkeypatch):
+    client = NwsApiClient("test-agent")
+    calls = []
+    url = "https://api.weather.gov/gridpoints/XXX/1,1/forecast/hourly"
+
+    def fake_get_json(url, **_kwargs):
+        calls.append(url)
+        return {"properties": {"updated": "now", "periods": [{"number": n} for n in range(1, 157)]}}
+
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    limited = client.get_forecast_data(url, limit=8)
+    full = client.get_forecast_data(url)
+
+    assert [p["number"] for p in limited["properties"]["periods"]] == list(range(1, 9))
+    assert limited["properties"]["updated"] == "now"
+    assert len(full["properties"]["periods"]) == 156
+    assert len(calls) == 1
+
+
+def test_get_json_revalidates_with_etag(monkeypatch):
+    client = NwsApiClient("test-agent")
+    sent_headers = []
+
+    class FakeResponse:
+        def __init__(self, status_code, headers=None, body=None):
+            self.status_code = status_code
+            self.headers = headers or {}
+            self._body = body
+
+        def raise_for_status(self):
+            pass
+
+        @property
+        def content(self):
+            return json.dumps(self._body).encode("utf-8")
+
+    responses = [
+        FakeResponse(200, {"ETag": '"abc"'}, {"features": []}),
+        FakeResponse(304),
+    ]
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    url = "https://api.weather.gov/alerts/active?point=1,2"
+    assert client._get_json(url) == {"features": []}
+    assert client._get_json(url) == {"features": []}
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+
+
+def test_geocode_rows_with_nan_coordinates_are_skipped():
+    rows = _FakeGeocodeRows(
+        [
+            {"place_name": "Nowhere", "latitude": float("nan"), "longitude": -90.0},
+            {"place_name": "St Louis", "latitude": 38.6270, "longitude": -90.1994},
+        ]
+    )
+    assert NwsApiClient._coordinates_from_geocode_result(rows) == (38.6270, -90.1994)
+
+
+def test_submit_runs_on_shared_fetch_workers():
+    client = NwsApiClient("test-agent")
+    try:
+        first = client.submit(lambda value: value * 2, 21)
+        assert first.result(timeout=5) == 42
+        assert client._get_executor() is client._get_executor()
+    finally:
+        client.close()
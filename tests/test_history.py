@@ -40,3 +40,17 @@ def test_history_migrates_from_pickle(tmp_path):
     items = manager.get_recent_alerts()
     assert items[0]["id"] == "legacy-id"
     assert json_path.exists()
+
+
+def test_history_seen_alerts_are_bounded(tmp_path):
+    history_path = tmp_path / "alert_history.json"
+    manager = AlertHistoryManager(str(history_path), max_history_items=10, max_seen_alerts=3)
+    for alert_id in ["a", "b", "c"]:
+        manager.add_alert(alert_id, {"id": alert_id})
+    assert manager.new_alert_ids(["a", "d"]) == {"d"}
+    manager.add_alert("d", {"id": "d"})
+
+    assert list(manager.seen_alerts) == ["c", "a", "d"]
+    manager.save_history()
+    manager2 = AlertHistoryManager(str(history_path), max_history_items=10, max_seen_alerts=3)
+    assert manager2.new_alert_ids(["a", "b"]) == {"b"}
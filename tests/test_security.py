@@ -0,0 +1,16 @@
+from weather_alert.security import is_web_url, safe_external_url
+
+
+def test_is_web_url_requires_http_scheme_and_host():
+    assert is_web_url("https://radar.weather.gov/")
+    assert is_web_url("HTTP://example.com/path?q=1")
+    assert not is_web_url("ftp://example.com")
+    assert not is_web_url("https://")
+    assert not is_web_url("https://exa mple.com")
+    assert not is_web_url(None)
+
+
+def test_safe_external_url_falls_back_for_non_web_links():
+    assert safe_external_url(" https://example.com ") == "https://example.com"
+    assert safe_external_url("javascript:alert(1)") == "#"
+    assert safe_external_url("file:///etc/passwd", "") == ""
@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from weather_alert.settings import SettingsManager
 
 
@@ -17,3 +19,58 @@ def test_settings_save_and_load(tmp_path):
     manager = SettingsManager(str(path))
     assert manager.save({"abc": 123})
     assert manager.load()["abc"] == 123
+
+
+def test_settings_save_replaces_file_atomically(tmp_path):
+    path = tmp_path / "settings.json"
+    manager = SettingsManager(str(path))
+    assert manager.save({"abc": 1})
+    assert manager.save({"abc": 2})
+    assert manager.load()["abc"] == 2
+    assert not (tmp_path / "settings.json.tmp").exists()
+
+
+def test_settings_restore_from_rejects_non_object(tmp_path):
+    path = tmp_path / "settings.json"
+    manager = SettingsManager(str(path))
+    assert manager.save({"abc": 1})
+    backup = tmp_path / "backup.json"
+    backup.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        manager.restore_from(str(backup))
+    assert manager.load()["abc"] == 1
+
+    backup.write_text(json.dumps({"abc": 5}), encoding="utf-8")
+    manager.restore_from(str(backup))
+    assert manager.load()["abc"] == 5
+
+
+def test_settings_backup_to_copies_current_file(tmp_path):
+    manager = SettingsManager(str(tmp_path / "settings.json"))
+    assert manager.save({"abc": 7})
+    backup = tmp_path / "backup.json"
+    backup.write_text("stale", encoding="utf-8")
+    manager.backup_to(str(backup))
+    assert json.loads(backup.read_text(encoding="utf-8")) == {"abc": 7}
+    assert not (tmp_path / "backup.json.tmp").exists()
+
+
+def test_settings_save_skips_unchanged_write(tmp_path):
+    path = tmp_path / "settings.json"
+    manager = SettingsManager(str(path))
+    assert manager.save({"abc": 1})
+    path.write_text(json.dumps({"abc": 99}), encoding="utf-8")
+    assert manager.save({"abc": 1})
+    assert json.loads(path.read_text(encoding="utf-8"))["abc"] == 99
+    assert manager.get("abc") == 1
+    assert manager.get("missing", "fallback") == "fallback"
+
+
+def test_settings_dumps_fallback_matches_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    from weather_alert import settings as settings_module
+
+    settings = {"zeta": [1, 2.5, None], "alpha": {"name": "Zürich °F", "on": True}, "empty": {}}
+    with_orjson = settings_module._dumps(settings)
+    monkeypatch.setattr(settings_module, "orjson", None)
+    assert settings_module._dumps(settings) == with_orjson
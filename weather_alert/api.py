@@ -1,7 +1,13 @@
+import importlib.util
+import json
 import logging
+import math
+import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
@@ -9,19 +15,31 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 try:
-    import pandas
+    import orjson
 except ImportError:  # pragma: no cover - optional dependency guard
-    pandas = None
+    orjson = None
 
-try:
-    import pgeocode
-except ImportError:  # pragma: no cover - optional dependency guard
-    pgeocode = None
+# pgeocode pulls in pandas, so it is only imported when the geocoder is first needed.
+PGEOCODE_INSTALLED = importlib.util.find_spec("pgeocode") is not None
 
 
 NWS_STATION_API_URL_TEMPLATE = "https://api.weather.gov/stations/{station_id}"
 NWS_POINTS_API_URL_TEMPLATE = "https://api.weather.gov/points/{latitude},{longitude}"
 ALERTS_API_URL = "https://api.weather.gov/alerts/active"
+# Only the point varies between alert queries, so the filter part is encoded once.
+_ALERTS_URL_TEMPLATE = ALERTS_API_URL + "?point={lat}%2C{lon}&" + urlencode({
+    "certainty": "Possible,Likely,Observed",
+    "severity": "Extreme,Severe,Moderate,Minor",
+    "urgency": "Immediate,Future,Expected",
+})
+GEOCACHE_WRITE_INTERVAL_S = 30
+# The session is shared by the GUI's worker pool, marine lookups and notifications.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+# fetch_all runs five lookups at once: alerts, hourly, daily, grid and current conditions.
+FETCH_ALL_CONCURRENT_JOBS = 5
+# One more worker for a job a caller overlaps with fetch_all via submit() (the GUI's marine lookup).
+FETCH_ALL_MAX_WORKERS = FETCH_ALL_CONCURRENT_JOBS + 1
 ZONE_TYPES = ["forecast", "public", "marine", "coastal", "offshore", "fire", "weather"]
 STATE_NAME_TO_CODE = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
@@ -38,6 +56,47 @@ STATE_NAME_TO_CODE = {
 }
 
 
+def _loads(data: bytes) -> Any:
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Offline geocoders shared by every client, by country. Only successful loads are kept,
+# so a failed first-run download is retried on the next lookup.
+_nominatim_clients: Dict[str, Any] = {}
+_nominatim_failed: set = set()
+_nominatim_lock = threading.Lock()
+
+
+def _load_nominatim(country: str) -> Optional[Any]:
+    # Building the geocoder reads (and on first run downloads) a multi-MB CSV, so it is
+    # created on first lookup; the lock keeps concurrent lookups from loading it twice.
+    with _nominatim_lock:
+        client = _nominatim_clients.get(country)
+        if client is not None:
+            return client
+        try:
+            import pgeocode
+        except ImportError:  # pragma: no cover - optional dependency guard
+            return None
+        try:
+            client = pgeocode.Nominatim(country)
+        except Exception as e:
+            _nominatim_failed.add(country)
+            logging.error("Offline geocoder unavailable: %s", e)
+            return None
+        _nominatim_failed.discard(country)
+        _nominatim_clients[country] = client
+        return client
+
+
+def _clear_nominatim_cache() -> None:
+    with _nominatim_lock:
+        _nominatim_clients.clear()
+        _nominatim_failed.clear()
+
+
 class ApiError(Exception):
     """Custom exception for API-related errors."""
 
@@ -45,15 +104,25 @@ class ApiError(Exception):
 class NwsApiClient:
     """Handles NWS API requests with retries and short-lived caches."""
 
-    def __init__(self, user_agent: str, timeout: int = 10, forecast_ttl_s: int = 300, coords_ttl_s: int = 86400):
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: int = 10,
+        forecast_ttl_s: int = 300,
+        coords_ttl_s: int = 86400,
+        points_ttl_s: int = 86400,
+        geocache_path: Optional[str] = None,
+    ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.forecast_ttl_s = forecast_ttl_s
         self.coords_ttl_s = coords_ttl_s
+        self.points_ttl_s = points_ttl_s
         self.headers = {"User-Agent": self.user_agent, "Accept": "application/geo+json"}
-        self.pgeocode_client = pgeocode.Nominatim("us") if pgeocode else None
+        self._pgeocode_client: Optional[Any] = None
 
         self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.user_agent})
         retry = Retry(
             total=3,
             backoff_factor=0.7,
@@ -61,7 +130,11 @@ class NwsApiClient:
             allowed_methods=("GET", "POST"),
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -69,12 +142,58 @@ class NwsApiClient:
         self._forecast_url_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
         self._forecast_data_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self._observation_station_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        # Long-lived pool for fetch_all fan-out, created on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # URL -> (validator headers, parsed body) for conditional GETs.
+        self._conditional_cache: Dict[str, Tuple[Dict[str, str], Dict[str, Any]]] = {}
+
+        # Resolved location -> coordinates and gridpoint URLs, persisted across runs when geocache_path is set.
+        # Loaded on first use; API calls run on worker threads, hence the lock.
+        self.geocache_path = geocache_path
+        self._geocache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._geocache_lock = threading.Lock()
+        self._geocache_dirty = False
+        self._geocache_last_write = 0.0
+
+    @property
+    def pgeocode_client(self) -> Optional[Any]:
+        if self._pgeocode_client is None:
+            self._pgeocode_client = _load_nominatim("us")
+        return self._pgeocode_client
+
+    @pgeocode_client.setter
+    def pgeocode_client(self, client: Optional[Any]) -> None:
+        self._pgeocode_client = client
+
+    @property
+    def geocoder_available(self) -> bool:
+        """Whether ZIP/city lookups can use the offline geocoder, without loading it.
+
+        False once a load has failed, until a later lookup loads it successfully.
+        """
+        return self._pgeocode_client is not None or (PGEOCODE_INSTALLED and "us" not in _nominatim_failed)
 
     def _get_json(self, url: str, *, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         use_headers = headers if headers else self.headers
+        previous = self._conditional_cache.get(url)
+        if previous:
+            use_headers = {**use_headers, **previous[0]}
         response = self.session.get(url, headers=use_headers, timeout=self.timeout)
+        if response.status_code == 304 and previous:
+            return previous[1]
         response.raise_for_status()
-        return response.json()
+        data = _loads(response.content)
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators:
+            self._conditional_cache[url] = (validators, data)
+        else:
+            self._conditional_cache.pop(url, None)
+        return data
 
     @staticmethod
     def _cache_get(cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
@@ -91,6 +210,81 @@ class NwsApiClient:
     def _cache_set(cache: Dict[str, Tuple[float, Any]], key: str, value: Any, ttl_s: int) -> None:
         cache[key] = (time.time() + ttl_s, value)
 
+    def _load_geocache(self) -> Dict[str, Dict[str, Any]]:
+        # Caller must hold _geocache_lock.
+        if self._geocache is None:
+            self._geocache = {"coords": {}}
+            if self.geocache_path and os.path.exists(self.geocache_path):
+                try:
+                    with open(self.geocache_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        for section, entries in data.items():
+                            if isinstance(entries, dict):
+                                self._geocache[section] = entries
+                except (IOError, ValueError) as e:
+                    logging.error("Error loading geocode cache from %s: %s", self.geocache_path, e)
+        return self._geocache
+
+    def _geocache_get_coords(self, key: str) -> Optional[Tuple[float, float]]:
+        if not self.geocache_path:
+            return None
+        with self._geocache_lock:
+            value = self._load_geocache()["coords"].get(key)
+        try:
+            return float(value[0]), float(value[1])
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    def _geocache_get_points(self, key: str) -> Optional[Dict[str, str]]:
+        if not self.geocache_path:
+            return None
+        with self._geocache_lock:
+            entry = self._load_geocache().get("points", {}).get(key)
+        try:
+            expires_at, urls = entry
+            if time.time() <= float(expires_at) and isinstance(urls, dict):
+                return urls
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    def _geocache_put(self, section: str, key: str, value: Any) -> None:
+        if not self.geocache_path:
+            return
+        with self._geocache_lock:
+            self._load_geocache().setdefault(section, {})[key] = value
+            self._geocache_dirty = True
+            if time.time() - self._geocache_last_write < GEOCACHE_WRITE_INTERVAL_S:
+                return
+            self._write_geocache_locked()
+
+    def _write_geocache_locked(self) -> None:
+        tmp_path = f"{self.geocache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.geocache_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._geocache, f)
+            os.replace(tmp_path, self.geocache_path)
+            self._geocache_dirty = False
+            self._geocache_last_write = time.time()
+        except (IOError, OSError) as e:
+            logging.error("Error saving geocode cache to %s: %s", self.geocache_path, e)
+
+    def flush_geocache(self) -> None:
+        """Writes any geocode cache entries held back by the write throttle."""
+        if not self.geocache_path:
+            return
+        with self._geocache_lock:
+            if self._geocache_dirty:
+                self._write_geocache_locked()
+
+    def _remember_coordinates(self, key: str, coords: Tuple[float, float], persist: bool = True) -> Tuple[float, float]:
+        self._cache_set(self._coords_cache, key, coords, self.coords_ttl_s)
+        if persist:
+            self._geocache_put("coords", key, [coords[0], coords[1]])
+        return coords
+
     @staticmethod
     def _parse_lat_lon(location_id: str) -> Optional[Tuple[float, float]]:
         match = re.match(r"^\s*(-?\d{1,2}(?:\.\d+)?)\s*,\s*(-?\d{1,3}(?:\.\d+)?)\s*$", location_id)
@@ -104,17 +298,11 @@ class NwsApiClient:
 
     @staticmethod
     def _is_missing(value: Any) -> bool:
-        if value is None:
-            return True
-        if pandas is not None:
-            try:
-                return bool(pandas.isna(value))
-            except (TypeError, ValueError):
-                return False
+        # Geocoder rows carry scalar floats (NaN when unknown); anything non-numeric is unusable.
         try:
-            return value != value
-        except Exception:
-            return False
+            return math.isnan(float(value))
+        except (TypeError, ValueError):
+            return True
 
     @staticmethod
     def _row_value(row: Any, field_name: str) -> Any:
@@ -245,29 +433,29 @@ class NwsApiClient:
 
         lat_lon = self._parse_lat_lon(processed_input)
         if lat_lon:
-            self._cache_set(self._coords_cache, processed_input, lat_lon, self.coords_ttl_s)
-            return lat_lon
+            return self._remember_coordinates(processed_input, lat_lon, persist=False)
+
+        persisted = self._geocache_get_coords(processed_input)
+        if persisted:
+            return self._remember_coordinates(processed_input, persisted, persist=False)
 
         if processed_input.isdigit() and len(processed_input) == 5:
             location_info = self.pgeocode_client.query_postal_code(processed_input) if self.pgeocode_client else None
             coords = self._coordinates_from_geocode_result(location_info)
             if coords:
-                self._cache_set(self._coords_cache, processed_input, coords, self.coords_ttl_s)
-                return coords
+                return self._remember_coordinates(processed_input, coords)
 
         zone_match = re.match(r"^[A-Z]{2}[A-Z]\d{3}$", processed_input)
         if zone_match:
             coords = self._get_coordinates_for_zone(processed_input)
             if coords:
-                self._cache_set(self._coords_cache, processed_input, coords, self.coords_ttl_s)
-                return coords
+                return self._remember_coordinates(processed_input, coords)
 
         city_state = self._normalize_city_state_input(raw_input)
         if city_state:
             coords = self._resolve_city_state(*city_state)
             if coords:
-                self._cache_set(self._coords_cache, processed_input, coords, self.coords_ttl_s)
-                return coords
+                return self._remember_coordinates(processed_input, coords)
 
         nws_id_to_try = processed_input
         if len(processed_input) == 3 and processed_input.isalpha():
@@ -278,9 +466,7 @@ class NwsApiClient:
             data = self._get_json(station_url)
             coords = data.get("geometry", {}).get("coordinates")
             if coords and len(coords) == 2:
-                result = (float(coords[1]), float(coords[0]))
-                self._cache_set(self._coords_cache, processed_input, result, self.coords_ttl_s)
-                return result
+                return self._remember_coordinates(processed_input, (float(coords[1]), float(coords[0])))
         except requests.RequestException as e:
             logging.error("API error fetching station '%s': %s", nws_id_to_try, e)
 
@@ -301,6 +487,12 @@ class NwsApiClient:
         if cached:
             return cached
 
+        # The gridpoint mapping for a location changes rarely; reuse it across runs.
+        persisted = self._geocache_get_points(cache_key)
+        if persisted:
+            self._cache_set(self._forecast_url_cache, cache_key, persisted, self.points_ttl_s)
+            return persisted
+
         points_url = NWS_POINTS_API_URL_TEMPLATE.format(latitude=lat, longitude=lon)
         try:
             props = self._get_json(points_url).get("properties", {})
@@ -310,27 +502,37 @@ class NwsApiClient:
                 "grid": props.get("forecastGridData"),
                 "observations": props.get("observationStations"),
             }
-            self._cache_set(self._forecast_url_cache, cache_key, data, self.forecast_ttl_s)
+            self._cache_set(self._forecast_url_cache, cache_key, data, self.points_ttl_s)
+            self._geocache_put("points", cache_key, [time.time() + self.points_ttl_s, data])
             return data
         except (requests.RequestException, ValueError) as e:
             logging.error("API error fetching gridpoint properties: %s", e)
             return None
 
-    def get_forecast_data(self, url: str) -> Optional[Dict[str, Any]]:
+    def get_forecast_data(self, url: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Returns forecast JSON for a gridpoint URL.
+
+        With ``limit``, only the first ``limit`` periods are returned; the full payload stays cached.
+        """
         if not url:
             return None
 
-        cached = self._cache_get(self._forecast_data_cache, url)
-        if cached:
-            return cached
-
-        try:
-            data = self._get_json(url)
+        data = self._cache_get(self._forecast_data_cache, url)
+        if not data:
+            try:
+                data = self._get_json(url)
+            except (requests.RequestException, ValueError) as e:
+                logging.error("API error fetching forecast data from %s: %s", url, e)
+                return None
             self._cache_set(self._forecast_data_cache, url, data, self.forecast_ttl_s)
+        return self._limit_periods(data, limit)
+
+    @staticmethod
+    def _limit_periods(data: Any, limit: Optional[int]) -> Any:
+        properties = data.get("properties") if limit is not None and isinstance(data, dict) else None
+        if not isinstance(properties, dict) or not isinstance(properties.get("periods"), list):
             return data
-        except (requests.RequestException, ValueError) as e:
-            logging.error("API error fetching forecast data from %s: %s", url, e)
-            return None
+        return {**data, "properties": {**properties, "periods": properties["periods"][:limit]}}
 
     @staticmethod
     def _c_to_f(value_c: Optional[float]) -> Optional[float]:
@@ -517,13 +719,7 @@ class NwsApiClient:
         }
 
     def get_alerts(self, lat: float, lon: float) -> List[Dict[str, Any]]:
-        params = {
-            "point": f"{lat},{lon}",
-            "certainty": "Possible,Likely,Observed",
-            "severity": "Extreme,Severe,Moderate,Minor",
-            "urgency": "Immediate,Future,Expected",
-        }
-        url = f"{ALERTS_API_URL}?{urlencode(params)}"
+        url = _ALERTS_URL_TEMPLATE.format(lat=lat, lon=lon)
         try:
             data = self._get_json(url)
             features = data.get("features", [])
@@ -532,6 +728,51 @@ class NwsApiClient:
             logging.error("Error fetching alerts from %s: %s", url, e)
             return []
 
+    def fetch_all(
+        self,
+        lat: float,
+        lon: float,
+        hourly_limit: Optional[int] = None,
+        daily_limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Fetches alerts, forecasts and current conditions for a point concurrently.
+
+        Alerts and the points lookup start together; the forecast and observation
+        requests fan out once the gridpoint URLs are known. The limits trim the
+        hourly and daily period lists, as in get_forecast_data.
+        """
+        executor = self._get_executor()
+        alerts_future = executor.submit(self.get_alerts, lat, lon)
+        forecast_urls = self.get_forecast_urls(lat, lon) or {}
+        futures = {
+            "hourly": executor.submit(self.get_forecast_data, forecast_urls.get("hourly"), hourly_limit),
+            "daily": executor.submit(self.get_forecast_data, forecast_urls.get("daily"), daily_limit),
+            "grid": executor.submit(self.get_forecast_data, forecast_urls.get("grid")),
+            "current_conditions": executor.submit(self.get_current_conditions, forecast_urls.get("observations")),
+        }
+        result = {key: future.result() for key, future in futures.items()}
+        result["alerts"] = alerts_future.result()
+        result["forecast_urls"] = forecast_urls or None
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=FETCH_ALL_MAX_WORKERS, thread_name_prefix="nws-fetch")
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Runs fn(*args) on the client's fetch workers, e.g. a lookup to overlap with fetch_all."""
+        return self._get_executor().submit(fn, *args)
+
+    def close(self) -> None:
+        """Stops the fetch workers and closes pooled connections."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.session.close()
+
     def build_alert_geojson(self, alerts: List[Dict[str, Any]]) -> Dict[str, Any]:
         features: List[Dict[str, Any]] = []
         for index, alert in enumerate(alerts):
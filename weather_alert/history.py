@@ -2,21 +2,28 @@ import json
 import logging
 import os
 import pickle
-from collections import deque
-from typing import Any, Deque, Dict, List
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Set
 
 
 class AlertHistoryManager:
     """Manages persistent storage of seen alerts using JSON with pickle migration."""
 
-    def __init__(self, file_path: str, max_history_items: int = 100):
+    def __init__(self, file_path: str, max_history_items: int = 100, max_seen_alerts: int = 4096):
         self.file_path = file_path
         self.max_history_items = max_history_items
-        self.seen_alerts = set()
+        self.max_seen_alerts = max_seen_alerts
+        # Alert ids in least- to most-recently-seen order, capped at max_seen_alerts.
+        self.seen_alerts: "OrderedDict[str, None]" = OrderedDict()
         self.alert_history: Deque[Dict[str, Any]] = deque(maxlen=max_history_items)
         self.lifecycle_timeline: Deque[Dict[str, Any]] = deque(maxlen=max_history_items * 10)
         self._load_history()
 
+    def _set_seen_alerts(self, alert_ids: Iterable[str]) -> None:
+        self.seen_alerts = OrderedDict.fromkeys(alert_ids)
+        while len(self.seen_alerts) > self.max_seen_alerts:
+            self.seen_alerts.popitem(last=False)
+
     def _legacy_pickle_candidates(self) -> List[str]:
         stem, ext = os.path.splitext(self.file_path)
         candidates = []
@@ -33,7 +40,7 @@ class AlertHistoryManager:
             try:
                 with open(legacy_path, "rb") as f:
                     data = pickle.load(f)
-                self.seen_alerts = set(data.get("seen_alerts", []))
+                self._set_seen_alerts(data.get("seen_alerts", []))
                 history = data.get("history", [])
                 self.alert_history = deque(history, maxlen=self.max_history_items)
                 self.lifecycle_timeline = deque(data.get("lifecycle", []), maxlen=self.max_history_items * 10)
@@ -49,7 +56,7 @@ class AlertHistoryManager:
             if os.path.exists(self.file_path):
                 with open(self.file_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                self.seen_alerts = set(data.get("seen_alerts", []))
+                self._set_seen_alerts(data.get("seen_alerts", []))
                 self.alert_history = deque(data.get("history", []), maxlen=self.max_history_items)
                 self.lifecycle_timeline = deque(data.get("lifecycle", []), maxlen=self.max_history_items * 10)
                 return
@@ -63,7 +70,7 @@ class AlertHistoryManager:
             with open(self.file_path, "w", encoding="utf-8") as f:
                 json.dump(
                     {
-                        "seen_alerts": sorted(list(self.seen_alerts)),
+                        "seen_alerts": list(self.seen_alerts),
                         "history": list(self.alert_history),
                         "lifecycle": list(self.lifecycle_timeline),
                     },
@@ -73,16 +80,27 @@ class AlertHistoryManager:
         except Exception as e:
             logging.error("Error saving alert history: %s", e)
 
+    def new_alert_ids(self, alert_ids: Iterable[str]) -> Set[str]:
+        """Returns the ids not seen yet; ids already seen are marked recently used."""
+        current_ids = set(alert_ids)
+        new_ids = current_ids - self.seen_alerts.keys()
+        # Still-active alerts must not age out and be announced again.
+        for alert_id in current_ids - new_ids:
+            self.seen_alerts.move_to_end(alert_id)
+        return new_ids
+
     def add_alert(self, alert_id: str, alert_data: Dict[str, Any]) -> bool:
-        if alert_id not in self.seen_alerts:
-            self.seen_alerts.add(alert_id)
-            self.alert_history.appendleft(alert_data)
-            return True
-        return False
+        if alert_id in self.seen_alerts:
+            self.seen_alerts.move_to_end(alert_id)
+            return False
+        self.seen_alerts[alert_id] = None
+        if len(self.seen_alerts) > self.max_seen_alerts:
+            self.seen_alerts.popitem(last=False)
+        self.alert_history.appendleft(alert_data)
+        return True
 
     def remove_alert(self, alert_id: str) -> None:
-        if alert_id in self.seen_alerts:
-            self.seen_alerts.remove(alert_id)
+        self.seen_alerts.pop(alert_id, None)
         self.alert_history = deque(
             [alert for alert in self.alert_history if alert.get("id") != alert_id],
             maxlen=self.max_history_items,
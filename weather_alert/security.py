@@ -1,12 +1,27 @@
+import functools
 import html
+import re
 from typing import Any, Dict
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
+
+_URL_RE = re.compile(r"^https?://[^\s/$.?#][^\s]*$", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_url(url: str) -> ParseResult:
+    # The same handful of source and alert links are checked on every render.
+    return urlparse(url)
+
+
+def is_web_url(url: Any) -> bool:
+    """True for http(s) URLs with a host and no whitespace."""
+    return bool(_URL_RE.match(str(url or "").strip()))
 
 
 def safe_external_url(url: Any, fallback: str = "#") -> str:
     """Allow only normal web URLs before embedding or opening external content."""
     text = str(url or "").strip()
-    parsed = urlparse(text)
+    parsed = _parse_url(text)
     if parsed.scheme not in {"https", "http"} or not parsed.netloc:
         return fallback
     return text
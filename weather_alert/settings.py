@@ -1,7 +1,28 @@
+import copy
 import json
 import logging
 import os
-from typing import Any, Dict
+import shutil
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(settings: Dict[str, Any]) -> bytes:
+    # Both paths emit indented, key-sorted JSON so the file stays user-editable and diffable.
+    if orjson:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(settings, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
 
 
 class SettingsManager:
@@ -9,6 +30,9 @@ class SettingsManager:
 
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self._write_lock = threading.Lock()
+        # Last settings known to be on disk; lets save() skip identical rewrites.
+        self._cache: Optional[Dict[str, Any]] = None
         self._migrate_settings_if_needed()
 
     def _migrate_settings_if_needed(self) -> None:
@@ -25,21 +49,71 @@ class SettingsManager:
             logging.warning("Settings file not found: %s", self.file_path)
             return {}
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                settings = json.load(f)
+            with open(self.file_path, "rb") as f:
+                settings = _loads(f.read())
                 logging.info("Settings loaded from %s", self.file_path)
+                if isinstance(settings, dict):
+                    self._cache = copy.deepcopy(settings)
                 return settings
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             logging.error("Error loading settings from %s: %s", self.file_path, e)
             return {}
 
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns a value from the in-memory settings, loading the file on first use."""
+        if self._cache is None:
+            self.load()
+        return (self._cache or {}).get(key, default)
+
     def save(self, settings: Dict[str, Any]) -> bool:
+        """Writes settings atomically; safe to call from a worker thread.
+
+        Returns True without touching the disk when the settings match what was last loaded or saved.
+        """
         try:
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=4)
+            with self._write_lock:
+                if settings == self._cache and os.path.exists(self.file_path):
+                    return True
+                self._replace_file_locked(_dumps(settings))
+                self._cache = copy.deepcopy(settings)
             logging.info("Settings saved to %s", self.file_path)
             return True
         except (IOError, OSError) as e:
             logging.error("Error saving settings to %s: %s", self.file_path, e)
             return False
+
+    def _replace_file_locked(self, data: bytes) -> None:
+        # Caller holds _write_lock; readers only ever see the old or the new file.
+        tmp_path = f"{self.file_path}.tmp"
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.file_path)
+
+    def backup_to(self, dest_path: str) -> None:
+        """Copies the settings file to dest_path, replacing it atomically.
+
+        Raises OSError on I/O failure, including when there is no settings file yet.
+        """
+        tmp_path = f"{dest_path}.tmp"
+        with self._write_lock:
+            # copyfile uses the kernel's in-place copy (sendfile and friends) where available.
+            shutil.copyfile(self.file_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+        logging.info("Settings backed up to %s", dest_path)
+
+    def restore_from(self, source_path: str) -> None:
+        """Validates a settings backup and writes it over the settings file.
+
+        The backup is read once; the validated bytes are what gets written.
+        Raises ValueError if the backup is not a JSON object and OSError on I/O failure.
+        """
+        with open(source_path, "rb") as f:
+            data = f.read()
+        settings = _loads(data)
+        if not isinstance(settings, dict):
+            raise ValueError("Settings file must contain a JSON object.")
+        with self._write_lock:
+            self._replace_file_locked(data)
+            self._cache = settings
+        logging.info("Settings restored from %s", source_path)